@@ -0,0 +1,98 @@
+"""
+Compares building the Pokémon DataFrame from a list of dicts against the
+typed column builder, on synthetic records with every ``POKEMON_SCHEMA``
+column. ``frame_mb`` counts the shared ``Types``/``Abilities`` lists once
+per row, so it overstates the builder's frame.
+
+Usage:
+    python benchmarks/bench_columnar.py [ROWS ...]
+"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pandas as pd
+
+from src.columnar import PokemonColumnBuilder
+
+TYPES = [
+    "normal", "fire", "water", "grass", "electric", "ice", "fighting", "poison",
+    "ground", "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark",
+    "steel", "fairy",
+]
+ABILITIES = [
+    "overgrow", "chlorophyll", "blaze", "solar-power", "torrent", "rain-dish",
+    "static", "lightning-rod", "levitate", "intimidate", "keen-eye", "run-away",
+]
+
+
+def synthetic_records(rows: int):
+    generator = random.Random(42)
+    for pokemon_id in range(1, rows + 1):
+        yield {
+            "ID": pokemon_id,
+            "Name": f"Pokemon-{pokemon_id}",
+            "Base Experience": generator.randint(20, 400),
+            "Types": generator.sample(TYPES, generator.randint(1, 2)),
+            "HP": generator.randint(1, 255),
+            "Attack": generator.randint(1, 255),
+            "Defense": generator.randint(1, 255),
+            "Special Attack": generator.randint(1, 255),
+            "Special Defense": generator.randint(1, 255),
+            "Speed": generator.randint(1, 255),
+            "Abilities": generator.sample(ABILITIES, generator.randint(1, 3)),
+            "Height": generator.randint(1, 200),
+            "Weight": generator.randint(1, 10_000),
+        }
+
+
+def frame_from_dicts(records: list[dict]) -> pd.DataFrame:
+    return pd.DataFrame(records)
+
+
+def frame_from_columns(records: list[dict]) -> pd.DataFrame:
+    builder = PokemonColumnBuilder()
+    builder.extend(records)
+    return builder.to_dataframe()
+
+
+def build_from_columns(rows: int) -> pd.DataFrame:
+    builder = PokemonColumnBuilder()
+    builder.extend(synthetic_records(rows))
+    return builder.to_dataframe()
+
+
+def measure(build, records: list[dict]) -> dict:
+    # The records are generated beforehand, so only the DataFrame build is
+    # timed and traced; the records themselves are not part of the peak.
+    start = time.perf_counter()
+    dataframe = build(records)
+    elapsed = time.perf_counter() - start
+    frame_bytes = int(dataframe.memory_usage(deep=True).sum())
+    del dataframe
+
+    tracemalloc.start()
+    build(records)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": round(elapsed, 3),
+        "peak_mb": round(peak / 2**20, 1),
+        "frame_mb": round(frame_bytes / 2**20, 1),
+    }
+
+
+def main(row_counts: list[int]):
+    for rows in row_counts:
+        records = list(synthetic_records(rows))
+        builders = (("dicts", frame_from_dicts), ("columns", frame_from_columns))
+        for name, build in builders:
+            print(f"rows={rows} builder={name} {measure(build, records)}")
+        del records
+
+
+if __name__ == "__main__":
+    main([int(rows) for rows in sys.argv[1:]] or [1_000, 100_000, 1_000_000])
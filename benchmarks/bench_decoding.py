@@ -0,0 +1,73 @@
+"""
+Compares decoding Pokémon detail payloads with ``json.loads`` and the
+previous hand-written ``stats`` scan against ``ProjectedDecoder``, which
+uses the fastest available parser and only projects the schema fields.
+
+Usage:
+    python benchmarks/bench_decoding.py [PAYLOADS] [MOVES]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from stub_server import synthetic_pokemon
+from src.decoding import ProjectedDecoder
+
+
+def legacy_decode(body: bytes) -> dict:
+    pokemon_data = json.loads(body)
+    pokemon_dict = {
+        "ID": pokemon_data["id"],
+        "Name": pokemon_data["name"].title(),
+        "Base Experience": pokemon_data["base_experience"],
+        "Types": [pokemon_type["type"]["name"] for pokemon_type in pokemon_data["types"]],
+        "HP": None,
+        "Attack": None,
+        "Defense": None,
+    }
+    for pokemon_stat in pokemon_data["stats"]:
+        if pokemon_stat["stat"]["name"] == "hp":
+            pokemon_dict["HP"] = pokemon_stat["base_stat"]
+        elif pokemon_stat["stat"]["name"] == "attack":
+            pokemon_dict["Attack"] = pokemon_stat["base_stat"]
+        elif pokemon_stat["stat"]["name"] == "defense":
+            pokemon_dict["Defense"] = pokemon_stat["base_stat"]
+    return pokemon_dict
+
+
+def measure(decode, bodies: list[bytes]) -> tuple[float, int]:
+    """
+    Returns the decoding time per payload in microseconds and the peak
+    transient memory of decoding one payload.
+    """
+    started_at = time.perf_counter()
+    for body in bodies:
+        decode(body)
+    elapsed = (time.perf_counter() - started_at) / len(bodies) * 1e6
+    tracemalloc.start()
+    decode(bodies[0])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(payloads: int, moves: int):
+    bodies = [
+        json.dumps(synthetic_pokemon(pokemon_id, moves)).encode()
+        for pokemon_id in range(1, payloads + 1)
+    ]
+    decoder = ProjectedDecoder()
+    print(f"{payloads} payloads of ~{len(bodies[0]) // 1024} KB, backend {decoder.backend}")
+    for name, decode in [("legacy", legacy_decode), ("projected", decoder.decode)]:
+        elapsed, peak = measure(decode, bodies)
+        print(f"{name:>10}: {elapsed:8.1f} us/payload, peak {peak / 1024:8.1f} KB")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 400,
+    )
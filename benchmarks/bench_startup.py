@@ -0,0 +1,42 @@
+"""
+Measures the cold start time of each CLI stage, i.e. the time until the
+stage's modules are imported and it is ready to run.
+
+Usage:
+    python benchmarks/bench_startup.py [REPEAT]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+STAGE_IMPORTS = {
+    "cli": "import main",
+    "extract": "import main, src.checkpoint, src.extractor",
+    "transform": "import main, src.transformer",
+    "report": "import main, src.reporter",
+}
+
+
+def measure(code: str, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(repeat: int):
+    results = {
+        stage: round(measure(code, repeat) * 1000, 1)
+        for stage, code in STAGE_IMPORTS.items()
+    }
+    print(json.dumps({"startup_ms": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
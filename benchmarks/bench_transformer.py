@@ -0,0 +1,77 @@
+"""
+Compares the fused DataTransformer.transform_pokemon_data against the
+previous implementation (one explode per aggregation, row-wise
+categorization and eager DataFrame log formatting) on synthetic data.
+
+Usage:
+    python benchmarks/bench_transformer.py [ROWS ...]
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pandas as pd
+
+from bench_columnar import build_from_columns
+from src.transformer import DataTransformer
+
+
+def legacy_transform(pokemon_dataframe: pd.DataFrame, logger: logging.Logger):
+    pokemon_dataframe["Category"] = pokemon_dataframe["Base Experience"].apply(
+        lambda x: "Weak" if x < 50 else "Medium" if x < 100 else "Strong"
+    )
+    logger.info(f"Pokemon experience: \n {pokemon_dataframe}")
+    exploded_df = pokemon_dataframe.explode("Types")
+    pokemon_count_by_type = exploded_df["Types"].value_counts().reset_index()
+    pokemon_count_by_type.columns = ["Type", "Count"]
+    logger.info(f"Pokemon count by type: \n {pokemon_count_by_type}")
+    exploded_df = pokemon_dataframe.explode("Types")
+    type_statistics = (
+        exploded_df.groupby("Types")
+        .agg({"HP": "mean", "Attack": "mean", "Defense": "mean"})
+        .reset_index()
+        .round(2)
+    )
+    logger.info(f"Type statistics: \n {type_statistics}")
+    top_pokemon = pokemon_dataframe.sort_values("Base Experience", ascending=False).head(5)
+    logger.info(f"Top Pokemon: \n {top_pokemon}")
+    return pokemon_dataframe, pokemon_count_by_type, type_statistics, top_pokemon
+
+
+def check_identical(legacy_result, fused_result):
+    _, legacy_counts, legacy_statistics, _ = legacy_result
+    _, fused_counts, fused_statistics, _ = fused_result
+    pd.testing.assert_frame_equal(
+        legacy_counts.sort_values("Type", ignore_index=True),
+        fused_counts.sort_values("Type", ignore_index=True),
+    )
+    pd.testing.assert_frame_equal(legacy_statistics, fused_statistics)
+
+
+def main(row_counts: list[int]):
+    logger = logging.getLogger("bench_transformer")
+    logger.addHandler(logging.NullHandler())
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    for rows in row_counts:
+        dataframe = build_from_columns(rows)
+
+        start = time.perf_counter()
+        legacy_result = legacy_transform(dataframe.copy(), logger)
+        legacy_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fused_result = DataTransformer(logger).transform_pokemon_data(dataframe.copy())
+        fused_seconds = time.perf_counter() - start
+
+        check_identical(legacy_result, fused_result)
+        print(
+            f"rows={rows} legacy={legacy_seconds:.3f}s fused={fused_seconds:.3f}s "
+            f"speedup={legacy_seconds / fused_seconds:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(rows) for rows in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
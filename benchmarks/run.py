@@ -0,0 +1,166 @@
+"""
+Benchmarks the extractor, transformer and reporter separately and end to
+end against a local stub PokeAPI, and writes machine-readable results.
+
+Usage:
+    python benchmarks/run.py --sizes 100 1000 10000 100000 --output results.json
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT_DIR)
+
+from bench_columnar import build_from_columns
+from stub_server import StubPokeAPIServer
+
+
+def silent_logger() -> logging.Logger:
+    logger = logging.getLogger("benchmarks")
+    logger.handlers = [logging.NullHandler()]
+    logger.propagate = False
+    return logger
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def timed(stage: str, records: int, function, *args) -> tuple[dict, object]:
+    start_wall = time.perf_counter()
+    start_cpu = time.process_time()
+    result = function(*args)
+    wall = time.perf_counter() - start_wall
+    cpu = time.process_time() - start_cpu
+    return (
+        {
+            "stage": stage,
+            "records": records,
+            "wall_seconds": round(wall, 4),
+            "cpu_seconds": round(cpu, 4),
+            "records_per_second": round(records / wall, 1) if wall else None,
+        },
+        result,
+    )
+
+
+def extract(base_url: str, size: int):
+    from src.extractor import PokemonExtractor
+
+    os.environ["BASE_URL"] = base_url
+    extractor = PokemonExtractor(silent_logger())
+    try:
+        return extractor.build_pokemons_dataframe(
+            extractor.iter_pokemon_data(max_count=size)
+        )
+    finally:
+        extractor.close()
+
+
+def transform(pokemon_dataframe):
+    from src.transformer import DataTransformer
+
+    transformer = DataTransformer(silent_logger())
+    transformed = transformer.transform_pokemon_data(pokemon_dataframe)
+    return transformed, transformer.build_leaderboards(transformed[0])
+
+
+def report(transformed_result):
+    from src.reporter import DataReporter
+
+    (pokemon_dataframe, by_type, type_statistics, top_5), leaderboards = transformed_result
+    with tempfile.TemporaryDirectory() as output_dir:
+        os.environ["OUTPUT_DIR"] = output_dir
+        return DataReporter(silent_logger()).generate_all_reports(
+            by_type, top_5, type_statistics, leaderboards, pokemon_dataframe
+        )
+
+
+def end_to_end(base_url: str, size: int):
+    return report(transform(extract(base_url, size)))
+
+
+def run(args: argparse.Namespace) -> dict:
+    os.environ.update(
+        {
+            "CACHE_ENABLED": "false",
+            "CHECKPOINT_ENABLED": "false",
+            "RATE_LIMIT_PER_SECOND": "0",
+            "MAX_WORKERS": str(args.workers),
+            "MAX_RETRIES": "10",
+            "BACKOFF_FACTOR": "0",
+        }
+    )
+    results = []
+    for size in args.sizes:
+        pokemon_dataframe = build_from_columns(size)
+        result, transformed = timed("transform", size, transform, pokemon_dataframe)
+        results.append(result)
+        result, _ = timed("report", size, report, transformed)
+        results.append(result)
+        if size > args.max_http_size:
+            continue
+        with StubPokeAPIServer(size, args.latency, args.error_rate, args.fixtures_dir) as server:
+            result, _ = timed("extract", size, extract, server.base_url, size)
+            results.append(result)
+            result, _ = timed("end_to_end", size, end_to_end, server.base_url, size)
+            results.append(result)
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "sizes": args.sizes,
+            "latency": args.latency,
+            "error_rate": args.error_rate,
+            "workers": args.workers,
+            "max_http_size": args.max_http_size,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--latency", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--fixtures-dir", default=None)
+    parser.add_argument(
+        "--max-http-size",
+        type=int,
+        default=10000,
+        help="Largest size benchmarked through the stub server.",
+    )
+    parser.add_argument("--output", default=None, help="JSON file to write results to.")
+    args = parser.parse_args()
+
+    report_data = run(args)
+    output = json.dumps(report_data, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            output_file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
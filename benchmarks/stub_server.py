@@ -0,0 +1,271 @@
+"""
+Local HTTP stand-in for the PokeAPI, used by the benchmarks and tests.
+
+It serves the ``/api/v2/pokemon`` list and ``/api/v2/pokemon/{id}`` detail
+endpoints from recorded fixtures or synthetic payloads, with configurable
+latency, error rate and dataset size. Detail responses carry an ``ETag`` so
+conditional requests are answered with ``304 Not Modified``.
+
+Usage:
+    python benchmarks/stub_server.py --port 8000 --size 1000 --latency 0.05
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+TYPES = [
+    "normal", "fire", "water", "grass", "electric", "ice", "fighting", "poison",
+    "ground", "flying", "psychic", "bug", "rock", "ghost", "dragon", "dark",
+    "steel", "fairy",
+]
+STATS = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
+DETAIL_PATH = re.compile(r"^/api/v2/pokemon/(\d+)/?$")
+LIST_PATH = re.compile(r"^/api/v2/pokemon/?$")
+
+
+def synthetic_pokemon(pokemon_id: int, moves: int = 80) -> dict:
+    """
+    Builds a synthetic detail payload shaped like the PokeAPI's, including
+    the bulky ``moves`` and ``sprites`` sections.
+
+    Args:
+        pokemon_id (int): The Pokémon ID.
+        moves (int): The number of moves entries to include.
+
+    Returns:
+        dict: The detail payload.
+    """
+    generator = random.Random(pokemon_id)
+    types = generator.sample(TYPES, generator.randint(1, 2))
+    return {
+        "id": pokemon_id,
+        "name": f"pokemon-{pokemon_id}",
+        "base_experience": generator.randint(20, 400),
+        "height": generator.randint(1, 200),
+        "weight": generator.randint(1, 9999),
+        "abilities": [
+            {"ability": {"name": f"ability-{generator.randint(1, 300)}"}, "slot": 1}
+        ],
+        "types": [
+            {"slot": slot, "type": {"name": name, "url": f"/api/v2/type/{name}/"}}
+            for slot, name in enumerate(types, start=1)
+        ],
+        "stats": [
+            {"base_stat": generator.randint(1, 255), "effort": 0, "stat": {"name": name}}
+            for name in STATS
+        ],
+        "moves": [
+            {
+                "move": {"name": f"move-{index}", "url": f"/api/v2/move/{index}/"},
+                "version_group_details": [
+                    {"level_learned_at": index % 50, "move_learn_method": {"name": "level-up"}}
+                ],
+            }
+            for index in range(moves)
+        ],
+        "sprites": {
+            key: f"https://example.invalid/sprites/{key}/{pokemon_id}.png"
+            for key in ("front_default", "back_default", "front_shiny", "back_shiny")
+        },
+    }
+
+
+class StubPokeAPIServer:
+    """
+    Threaded stub PokeAPI server running in a background thread.
+    """
+
+    def __init__(
+        self,
+        dataset_size: int = 100,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        fixtures_dir: str | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = 42,
+    ):
+        """
+        Args:
+            dataset_size (int): The number of Pokémon served.
+            latency (float): The delay, in seconds, added to every response.
+            error_rate (float): The probability of answering with a 503.
+            fixtures_dir (str | None): A directory of recorded detail payloads
+                named ``{id}.json``. Missing IDs fall back to synthetic payloads.
+            host (str): The interface to bind.
+            port (int): The port to bind, 0 for any free port.
+            seed (int): The seed of the error injection.
+        """
+        self.dataset_size = dataset_size
+        self.latency = latency
+        self.error_rate = error_rate
+        self.fixtures_dir = fixtures_dir
+        self.requests_served = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._payloads = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/api/v2"
+
+    def start(self) -> "StubPokeAPIServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubPokeAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def detail_payload(self, pokemon_id: int) -> bytes:
+        """
+        Returns the encoded detail payload of a Pokémon, loading it once.
+
+        Args:
+            pokemon_id (int): The Pokémon ID.
+
+        Returns:
+            bytes: The JSON payload.
+        """
+        payload = self._payloads.get(pokemon_id)
+        if payload is None:
+            fixture_path = (
+                os.path.join(self.fixtures_dir, f"{pokemon_id}.json")
+                if self.fixtures_dir
+                else None
+            )
+            if fixture_path and os.path.exists(fixture_path):
+                with open(fixture_path, "rb") as fixture_file:
+                    payload = fixture_file.read()
+            else:
+                payload = json.dumps(synthetic_pokemon(pokemon_id)).encode()
+            self._payloads[pokemon_id] = payload
+        return payload
+
+    def list_payload(self, limit: int, offset: int) -> bytes:
+        """
+        Returns the encoded list page starting at ``offset``.
+
+        Args:
+            limit (int): The page size.
+            offset (int): The page offset.
+
+        Returns:
+            bytes: The JSON payload.
+        """
+        end = min(offset + limit, self.dataset_size)
+        next_url = (
+            f"{self.base_url}/pokemon?offset={end}&limit={limit}"
+            if end < self.dataset_size
+            else None
+        )
+        return json.dumps(
+            {
+                "count": self.dataset_size,
+                "next": next_url,
+                "previous": None,
+                "results": [
+                    {"name": f"pokemon-{pokemon_id}", "url": f"{self.base_url}/pokemon/{pokemon_id}/"}
+                    for pokemon_id in range(offset + 1, end + 1)
+                ],
+            }
+        ).encode()
+
+    def _should_fail(self) -> bool:
+        with self._lock:
+            self.requests_served += 1
+            return self._random.random() < self.error_rate
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: bytes = b"", headers: dict | None = None):
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if server.latency:
+                    time.sleep(server.latency)
+                if server._should_fail():
+                    self._send(503, b"Service Unavailable", {"Retry-After": "0"})
+                    return
+                url = urlparse(self.path)
+                detail_match = DETAIL_PATH.match(url.path)
+                if detail_match:
+                    pokemon_id = int(detail_match.group(1))
+                    if not 1 <= pokemon_id <= server.dataset_size:
+                        self._send(404, b"Not Found")
+                        return
+                    body = server.detail_payload(pokemon_id)
+                    etag = f'"{hashlib.md5(body).hexdigest()}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        self._send(304, headers={"ETag": etag})
+                        return
+                    self._send(
+                        200, body, {"Content-Type": "application/json", "ETag": etag}
+                    )
+                    return
+                if LIST_PATH.match(url.path):
+                    query = parse_qs(url.query)
+                    limit = int(query.get("limit", ["20"])[0])
+                    offset = int(query.get("offset", ["0"])[0])
+                    self._send(
+                        200,
+                        server.list_payload(limit, offset),
+                        {"Content-Type": "application/json"},
+                    )
+                    return
+                self._send(404, b"Not Found")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--size", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fixtures-dir", default=None)
+    args = parser.parse_args()
+    server = StubPokeAPIServer(
+        args.size, args.latency, args.error_rate, args.fixtures_dir, args.host, args.port
+    )
+    print(f"Serving stub PokeAPI at {server.base_url}")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,5 +9,50 @@ class Settings(BaseSettings):
     )
     BASE_URL: str = "https://pokeapi.co/api/v2"
     OUTPUT_DIR: str = "output"
-  
-    
\ No newline at end of file
+    INTERMEDIATE_DIR: str = "data"
+    OUTPUT_FORMAT: str = "csv"
+    OUTPUT_COMPRESSION: str | None = None
+    INCREMENTAL_REPORTS: bool = True
+    MANIFEST_FILE: str = ".manifest.json"
+    METRICS_ENABLED: bool = True
+    METRICS_FILE: str = "metrics_{stage}.json"
+    METRICS_DIR: str | None = None
+    PROFILE_STAGES: list[str] = []
+    TRACE_MEMORY: bool = False
+    SOURCE: str = "http"
+    LOCAL_DUMP_PATH: str = "api-data"
+    PAGE_SIZE: int = 100
+    MAX_POKEMON: int = 100
+    MAX_WORKERS: int = 8
+    REQUEST_TIMEOUT: float = 10.0
+    MAX_RETRIES: int = 5
+    BACKOFF_FACTOR: float = 0.5
+    BACKOFF_MAX: float = 30.0
+    BACKOFF_JITTER: float = 0.5
+    RATE_LIMIT_PER_SECOND: float = 20.0
+    RATE_LIMIT_BURST: int = 20
+    CACHE_ENABLED: bool = True
+    CACHE_PATH: str = ".cache/pokeapi.sqlite3"
+    CACHE_TTL_SECONDS: float = 7 * 24 * 60 * 60
+    CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    EXPERIENCE_BUCKETS: dict[str, float | None] = {
+        "Weak": 50,
+        "Medium": 100,
+        "Strong": None,
+    }
+    TYPE_STATISTICS_MEASURES: list[str] = []
+    TOP_K: int = 5
+    LEADERBOARD_COLUMNS: list[str] = []
+    LEADERBOARD_BY_TYPE: bool = False
+    STORE_ENABLED: bool = False
+    STORE_PATH: str = "data/pokemon.sqlite3"
+    STORE_PUSHDOWN: bool = False
+    PIPELINE_QUEUE_SIZE: int = 4
+    PIPELINE_CHUNK_SIZE: int = 100
+    REFRESH_INTERVAL_SECONDS: float = 60 * 60
+    DAEMON_HOST: str = "127.0.0.1"
+    DAEMON_PORT: int = 8080
+    CHECKPOINT_ENABLED: bool = False
+    CHECKPOINT_DIR: str = ".checkpoint"
+    DEAD_LETTER_ENABLED: bool = True
+    REPAIR_MAX_ATTEMPTS: int = 3
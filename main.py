@@ -1,36 +1,610 @@
+import time
+
+STARTED_AT = time.perf_counter()
+
+import argparse
 import logging
 import logging.config
+import os
+import sys
 
-from src import PokemonExtractor
-from src import DataTransformer
-from src import DataReporter
-
-logging.config.fileConfig("config/logging.conf")
 logger = logging.getLogger(__name__)
 
+STAGES = ("extract", "merge", "transform", "report")
+RECORDS_ARTIFACT = "pokemon_records.pkl"
+TRANSFORMED_ARTIFACT = "transformed.pkl"
+DEAD_LETTER_ARTIFACT = "dead_letter.json"
+PARTIALS_DIR = "partials"
+METRICS_SUBDIR = "metrics"
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Builds the command line parser.
+
+    Returns:
+        argparse.ArgumentParser: The parser.
+    """
+    parser = argparse.ArgumentParser(
+        description="Extracts, transforms and reports Pokémon data from the PokeAPI."
+    )
+    parser.add_argument(
+        "stage",
+        nargs="?",
+        choices=("run", "daemon", "repair", *STAGES),
+        default="run",
+        help=(
+            "The stage to run. 'run' executes extract, transform and report in "
+            "memory (default). 'merge' combines the partial outputs of sharded "
+            "extract runs. 'repair' re-fetches only the Pokémon in the "
+            "dead-letter file and patches them into the extracted records. "
+            "'daemon' keeps the data warm, refreshing it and serving it over "
+            "HTTP until stopped."
+        ),
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of Pokémon to extract (0 for all). Defaults to MAX_POKEMON.",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help="Directory of the intermediate artifacts. Defaults to INTERMEDIATE_DIR.",
+    )
+    parser.add_argument(
+        "--shard",
+        default=None,
+        help=(
+            "Extract only the Pokémon whose ID modulo N is i, given as i/N with "
+            "a zero-based i, into a partial output for the merge stage."
+        ),
+    )
+    parser.add_argument(
+        "--id-range",
+        default=None,
+        help=(
+            "Extract only the Pokémon in these inclusive ID ranges, such as "
+            "1-151,387-493, into a partial output for the merge stage."
+        ),
+    )
+    parser.add_argument(
+        "--pipelined",
+        action="store_true",
+        help=(
+            "With 'run', stream the records from extraction into the "
+            "transformation through bounded queues instead of running the "
+            "stages one after the other."
+        ),
+    )
+    return parser
+
+
+def _shard_spec(args: argparse.Namespace):
+    """
+    Builds the shard of a sharded extract run from the command line.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        ShardSpec | None: The shard, or None if the run is not sharded.
+
+    Raises:
+        ValueError: If ``--shard`` or ``--id-range`` is malformed.
+    """
+    if args.shard is None and args.id_range is None:
+        return None
+    from src.sharding import ShardSpec, parse_id_ranges, parse_shard
+
+    index, count = parse_shard(args.shard) if args.shard else (0, 1)
+    id_ranges = parse_id_ranges(args.id_range) if args.id_range else ()
+    return ShardSpec(index, count, id_ranges)
+
+
+def _artifact_path(args: argparse.Namespace, artifact: str) -> str:
+    """
+    Returns the path of an intermediate artifact, creating its directory.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        artifact (str): The artifact file name.
+
+    Returns:
+        str: The artifact path.
+    """
+    from config import Settings
+
+    data_dir = args.data_dir or Settings().INTERMEDIATE_DIR
+    os.makedirs(data_dir, exist_ok=True)
+    return os.path.join(data_dir, artifact)
+
+
+def _write_records(pokemons_dataframe, records_path: str):
+    """
+    Writes the Pokémon records artifact, renaming it into place so a stage
+    reading it concurrently or after an interruption never sees a partial pickle.
+
+    Args:
+        pokemons_dataframe (pd.DataFrame): The Pokémon records.
+        records_path (str): The artifact path.
+    """
+    pokemons_dataframe.to_pickle(f"{records_path}.tmp")
+    os.replace(f"{records_path}.tmp", records_path)
+
+
+def _dead_letter_queue(args: argparse.Namespace, shard=None):
+    """
+    Opens the dead-letter queue of the Pokémon that failed to be fetched.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        shard (ShardSpec | None): The shard of a sharded extract run, whose
+            failures go to a partial file for the merge stage.
+
+    Returns:
+        DeadLetterQueue | None: The queue, or None if ``DEAD_LETTER_ENABLED``
+            is off.
+    """
+    from config import Settings
+    from src.dead_letter import DeadLetterQueue
+
+    if not Settings().DEAD_LETTER_ENABLED:
+        return None
+    if shard is None:
+        return DeadLetterQueue(_artifact_path(args, DEAD_LETTER_ARTIFACT), logger)
+    from src.sharding import partial_file_name
 
-def main():
+    partials_dir = _artifact_path(args, PARTIALS_DIR)
+    return DeadLetterQueue(
+        os.path.join(partials_dir, partial_file_name(DEAD_LETTER_ARTIFACT, shard)),
+        logger,
+    )
+
+
+def extract(args: argparse.Namespace, metrics=None, shard=None):
+    """
+    Extracts the Pokémon records from the PokeAPI.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        metrics (MetricsRecorder | None): The run metrics.
+        shard (ShardSpec | None): The slice of the list to extract. None
+            extracts the whole list.
+
+    Returns:
+        pd.DataFrame: The Pokémon records.
+    """
+    from src.checkpoint import CheckpointStore
+    from src.extractor import PokemonExtractor
+
+    extractor = PokemonExtractor(logger, metrics)
+    extractor.dead_letters = _dead_letter_queue(args, shard)
     try:
-        extractor = PokemonExtractor(logger)
-        pokemons_data = extractor.fetch_pokemon_data(limit=100)
-        pokemons_dataframe = extractor.build_pokemons_dataframe(pokemons_data)
+        limit = extractor.configs.MAX_POKEMON if args.limit is None else args.limit
+        pokemons_data = extractor.iter_pokemon_data(max_count=limit or None)
+        checkpoint_dir = extractor.configs.CHECKPOINT_DIR
+        if shard is not None:
+            pokemons_data = extractor.filter_shard(pokemons_data, shard)
+            # Shards running side by side must not share a checkpoint.
+            checkpoint_dir = os.path.join(checkpoint_dir, shard.name)
+        if extractor.configs.CHECKPOINT_ENABLED:
+            checkpoint = CheckpointStore(checkpoint_dir, logger)
+            return extractor.build_incremental_dataframe(pokemons_data, checkpoint)
+        return extractor.build_pokemons_dataframe(pokemons_data)
+    finally:
+        extractor.close()
+
+
+def store_pokemon(pokemons_dataframe):
+    """
+    Saves the transformed Pokémon records to the Pokémon store, if enabled.
+
+    Args:
+        pokemons_dataframe (pd.DataFrame): The transformed Pokémon records.
+    """
+    from config import Settings
+
+    configs = Settings()
+    if not configs.STORE_ENABLED:
+        return
+    from src.store import PokemonStore
+
+    store = PokemonStore(configs.STORE_PATH)
+    try:
+        written = store.write_dataframe(pokemons_dataframe)
+        logger.info(f"Stored {written} Pokemon in {store.path}")
+    finally:
+        store.close()
+
+
+def transform_in_store(transformer, pokemons_dataframe) -> dict:
+    """
+    Saves the Pokémon records to the Pokémon store and pushes the type
+    aggregations and the top Pokémon down to SQL. The results cover every
+    Pokémon in the store, including those stored by earlier runs.
 
+    Args:
+        transformer (DataTransformer): The transformer.
+        pokemons_dataframe (pd.DataFrame): The Pokémon records.
+
+    Returns:
+        dict: The transformed DataFrames, by name.
+    """
+    from src.store import PokemonStore
+
+    store = PokemonStore(transformer.configs.STORE_PATH)
+    try:
+        written = store.write_dataframe(pokemons_dataframe)
+        logger.info(f"Stored {written} Pokemon in {store.path}")
         (
-            pokemons_dataframe,
             pokemons_by_type_dataframe,
             pokemons_type_statistics_dataframe,
             pokemons_top_5_dataframe,
-        ) = DataTransformer(logger).transform_pokemon_data(pokemons_dataframe)
+        ) = transformer.transform_store(store)
+        pokemons_dataframe = store.to_dataframe()
+    finally:
+        store.close()
+    return {
+        "pokemon": pokemons_dataframe,
+        "by_type": pokemons_by_type_dataframe,
+        "type_statistics": pokemons_type_statistics_dataframe,
+        "top_5": pokemons_top_5_dataframe,
+        "leaderboards": transformer.build_leaderboards(pokemons_dataframe),
+    }
 
-        DataReporter(logger).generate_all_reports(
-            pokemons_by_type_dataframe,
-            pokemons_top_5_dataframe,
-            pokemons_type_statistics_dataframe,
+
+def transform(pokemons_dataframe) -> dict:
+    """
+    Transforms the Pokémon records, saving them to the Pokémon store when
+    ``STORE_ENABLED``. With ``STORE_PUSHDOWN`` as well, the aggregations run
+    in the store with ``transform_in_store``.
+
+    Args:
+        pokemons_dataframe (pd.DataFrame): The Pokémon records.
+
+    Returns:
+        dict: The transformed DataFrames, by name.
+    """
+    from src.transformer import DataTransformer
+
+    transformer = DataTransformer(logger)
+    if transformer.configs.STORE_ENABLED and transformer.configs.STORE_PUSHDOWN:
+        return transform_in_store(transformer, pokemons_dataframe)
+    (
+        pokemons_dataframe,
+        pokemons_by_type_dataframe,
+        pokemons_type_statistics_dataframe,
+        pokemons_top_5_dataframe,
+    ) = transformer.transform_pokemon_data(pokemons_dataframe)
+    store_pokemon(pokemons_dataframe)
+    return {
+        "pokemon": pokemons_dataframe,
+        "by_type": pokemons_by_type_dataframe,
+        "type_statistics": pokemons_type_statistics_dataframe,
+        "top_5": pokemons_top_5_dataframe,
+        "leaderboards": transformer.build_leaderboards(pokemons_dataframe),
+    }
+
+
+def pipelined(args: argparse.Namespace, metrics=None) -> dict:
+    """
+    Extracts and transforms the Pokémon records concurrently, streaming them
+    through the ``StreamingPipeline``. Checkpoints are not used.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        metrics (MetricsRecorder | None): The run metrics.
+
+    Returns:
+        dict: The transformed DataFrames, by name.
+    """
+    from src.extractor import PokemonExtractor
+    from src.pipeline import StreamingPipeline
+
+    extractor = PokemonExtractor(logger, metrics)
+    extractor.dead_letters = _dead_letter_queue(args)
+    try:
+        limit = extractor.configs.MAX_POKEMON if args.limit is None else args.limit
+        records = extractor.iter_pokemon_records(max_count=limit or None)
+        transformed = StreamingPipeline(logger).run(records)
+    finally:
+        extractor.close()
+    store_pokemon(transformed["pokemon"])
+    return transformed
+
+
+def merge(args: argparse.Namespace):
+    """
+    Merges the partial outputs of sharded extract runs, and the dead-letter
+    files of the shards into the canonical one.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+
+    Returns:
+        pd.DataFrame: The Pokémon records of all shards, deduplicated and
+            ordered by ID.
+    """
+    import glob
+
+    from src.sharding import merge_partials
+
+    stem, extension = os.path.splitext(RECORDS_ARTIFACT)
+    paths = glob.glob(
+        os.path.join(_artifact_path(args, PARTIALS_DIR), f"{stem}.*{extension}")
+    )
+    logger.info(f"Merging {len(paths)} partial outputs")
+    pokemons_dataframe = merge_partials(paths)
+    dead_letters = _dead_letter_queue(args)
+    if dead_letters is not None:
+        from src.dead_letter import DeadLetterQueue
+
+        stem, extension = os.path.splitext(DEAD_LETTER_ARTIFACT)
+        partial_paths = glob.glob(
+            os.path.join(_artifact_path(args, PARTIALS_DIR), f"{stem}.*{extension}")
+        )
+        for path in sorted(partial_paths):
+            dead_letters.update(DeadLetterQueue(path, logger).entries())
+        # A Pokémon that failed in one shard may have been extracted by another.
+        dead_letters.resolve(pokemons_dataframe["ID"].tolist())
+    return pokemons_dataframe
+
+
+def _check_repair_inputs(args: argparse.Namespace):
+    """
+    Checks that there are extracted records to patch the dead-lettered
+    Pokémon into, before the repair stage fetches them again.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+
+    Raises:
+        FileNotFoundError: If there are dead-lettered Pokémon but neither the
+            records artifact nor a checkpoint to patch them into.
+    """
+    from config import Settings
+    from src.dead_letter import DeadLetterQueue
+
+    records_path = _artifact_path(args, RECORDS_ARTIFACT)
+    if (
+        DeadLetterQueue(_artifact_path(args, DEAD_LETTER_ARTIFACT), logger)
+        and not os.path.exists(records_path)
+        and not Settings().CHECKPOINT_ENABLED
+    ):
+        raise FileNotFoundError(records_path)
+
+
+def repair(args: argparse.Namespace, metrics=None) -> int:
+    """
+    Re-fetches only the Pokémon in the dead-letter file, with exponential
+    backoff, and patches them into the extracted records and, when
+    ``CHECKPOINT_ENABLED``, into the checkpoint.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        metrics (MetricsRecorder | None): The run metrics.
+
+    Returns:
+        int: The number of Pokémon still failing.
+    """
+    import pandas as pd
+
+    from src.checkpoint import CheckpointStore
+    from src.columnar import PokemonColumnBuilder
+    from src.dead_letter import DeadLetterQueue, patch_records
+    from src.extractor import PokemonExtractor
+
+    dead_letters = DeadLetterQueue(_artifact_path(args, DEAD_LETTER_ARTIFACT), logger)
+    if not dead_letters:
+        logger.info("No dead-lettered Pokemon to repair")
+        return 0
+    extractor = PokemonExtractor(logger, metrics)
+    records_path = _artifact_path(args, RECORDS_ARTIFACT)
+    try:
+        repaired = extractor.repair_dead_letters(dead_letters)
+    finally:
+        extractor.close()
+    if extractor.configs.CHECKPOINT_ENABLED:
+        CheckpointStore(extractor.configs.CHECKPOINT_DIR, logger).append(repaired)
+    if os.path.exists(records_path):
+        builder = PokemonColumnBuilder()
+        builder.extend(repaired)
+        pokemons_dataframe = patch_records(
+            pd.read_pickle(records_path), builder.to_dataframe()
+        )
+        _write_records(pokemons_dataframe, records_path)
+        logger.info(f"Patched {len(repaired)} Pokemon into {records_path}")
+    return len(dead_letters)
+
+
+def report(transformed: dict) -> bool:
+    """
+    Generates the reports from the transformed data.
+
+    Args:
+        transformed (dict): The transformed DataFrames, by name.
+
+    Returns:
+        bool: True if all reports were generated, False otherwise.
+    """
+    from src.reporter import DataReporter
+
+    return DataReporter(logger).generate_all_reports(
+        transformed["by_type"],
+        transformed["top_5"],
+        transformed["type_statistics"],
+        transformed["leaderboards"],
+        transformed["pokemon"],
+    )
+
+
+def run_stage(args: argparse.Namespace, metrics) -> bool:
+    """
+    Runs the selected stage, reading its input from and writing its output
+    to the intermediate artifacts when it runs on its own.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        metrics (MetricsRecorder): The run metrics.
+
+    Returns:
+        bool: True if the stage succeeded, False otherwise.
+    """
+    import pandas as pd
+
+    from src.pipeline import stage_errors
+
+    if args.stage == "daemon":
+        from config import Settings
+        from src.daemon import RefreshDaemon
+
+        limit = Settings().MAX_POKEMON if args.limit is None else args.limit
+        RefreshDaemon(logger, metrics, max_count=limit or None).serve_forever()
+        return True
+    if args.stage == "repair":
+        # Checked outside stage_errors, so main() reports the missing artifact.
+        _check_repair_inputs(args)
+        with stage_errors("repair"), metrics.stage("repair"):
+            remaining = repair(args, metrics)
+        if remaining:
+            logger.warning(f"{remaining} Pokemon are still dead-lettered")
+        return remaining == 0
+    if args.stage == "run" and args.pipelined:
+        with stage_errors("pipeline"), metrics.stage("pipeline"):
+            transformed = pipelined(args, metrics)
+        with stage_errors("report"), metrics.stage("report"):
+            return report(transformed)
+    if args.stage == "run":
+        with stage_errors("extract"), metrics.stage("extract"):
+            pokemons_dataframe = extract(args, metrics)
+        if _dead_letter_queue(args):
+            # The repair stage patches the failed Pokémon into these records.
+            records_path = _artifact_path(args, RECORDS_ARTIFACT)
+            _write_records(pokemons_dataframe, records_path)
+            logger.info(f"Saved {len(pokemons_dataframe)} Pokemon to {records_path}")
+        with stage_errors("transform"), metrics.stage("transform"):
+            transformed = transform(pokemons_dataframe)
+        with stage_errors("report"), metrics.stage("report"):
+            return report(transformed)
+    if args.stage == "extract":
+        with stage_errors("extract"), metrics.stage("extract"):
+            pokemons_dataframe = extract(args, metrics, args.shard_spec)
+        if args.shard_spec is None:
+            records_path = _artifact_path(args, RECORDS_ARTIFACT)
+        else:
+            from src.sharding import partial_file_name
+
+            partials_dir = _artifact_path(args, PARTIALS_DIR)
+            os.makedirs(partials_dir, exist_ok=True)
+            records_path = os.path.join(
+                partials_dir, partial_file_name(RECORDS_ARTIFACT, args.shard_spec)
+            )
+        _write_records(pokemons_dataframe, records_path)
+        logger.info(f"Extracted {len(pokemons_dataframe)} Pokemon to {records_path}")
+        return True
+    if args.stage == "merge":
+        with stage_errors("merge"), metrics.stage("merge"):
+            pokemons_dataframe = merge(args)
+        records_path = _artifact_path(args, RECORDS_ARTIFACT)
+        _write_records(pokemons_dataframe, records_path)
+        logger.info(f"Merged {len(pokemons_dataframe)} Pokemon to {records_path}")
+        return True
+    if args.stage == "transform":
+        pokemons_dataframe = pd.read_pickle(_artifact_path(args, RECORDS_ARTIFACT))
+        with stage_errors("transform"), metrics.stage("transform"):
+            transformed = transform(pokemons_dataframe)
+        transformed_path = _artifact_path(args, TRANSFORMED_ARTIFACT)
+        pd.to_pickle(transformed, transformed_path)
+        logger.info(f"Transformed data saved to {transformed_path}")
+        return True
+    transformed = pd.read_pickle(_artifact_path(args, TRANSFORMED_ARTIFACT))
+    with stage_errors("report"), metrics.stage("report"):
+        return report(transformed)
+
+
+def write_metrics(args: argparse.Namespace, metrics):
+    """
+    Writes the run metrics to ``METRICS_DIR``, if enabled. It defaults to a
+    subdirectory of the reports directory, which the report stage leaves alone.
+
+    Args:
+        args (argparse.Namespace): The command line arguments.
+        metrics (MetricsRecorder): The run metrics.
+    """
+    from config import Settings
+
+    configs = Settings()
+    if not configs.METRICS_ENABLED:
+        return
+    stage = args.stage
+    if args.shard_spec is not None:
+        stage = f"{stage}.{args.shard_spec.name}"
+    try:
+        metrics_dir = configs.METRICS_DIR or os.path.join(
+            configs.OUTPUT_DIR, METRICS_SUBDIR
+        )
+        metrics_path = metrics.write(
+            metrics_dir, configs.METRICS_FILE.format(stage=stage)
         )
+        logger.info(f"Run metrics saved to {metrics_path}")
+    except OSError as e:
+        logger.error(f"Failed to write run metrics: {e}")
 
-    except Exception as e:
-        logger.error(e)
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the pipeline from the command line.
+
+    Args:
+        argv (list[str] | None): The command line arguments. Defaults to ``sys.argv``.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.stage != "extract" and (args.shard or args.id_range):
+        parser.error("--shard and --id-range only apply to the extract stage")
+    if args.stage != "run" and args.pipelined:
+        parser.error("--pipelined only applies to the run stage")
+    try:
+        args.shard_spec = _shard_spec(args)
+    except ValueError as e:
+        parser.error(str(e))
+    logging.config.fileConfig("config/logging.conf", disable_existing_loggers=False)
+    from config import Settings
+    from src.metrics import MetricsRecorder
+    from src.pipeline import PipelineError
+
+    configs = Settings()
+    metrics = MetricsRecorder(configs.PROFILE_STAGES, configs.TRACE_MEMORY)
+    metrics.stages["startup"] = {
+        "wall_seconds": round(time.perf_counter() - STARTED_AT, 4)
+    }
+    logger.info(
+        f"Startup of stage '{args.stage}' took "
+        f"{(time.perf_counter() - STARTED_AT) * 1000:.0f} ms"
+    )
+    try:
+        succeeded = run_stage(args, metrics)
+    except FileNotFoundError as e:
+        logger.error(f"Missing input artifact, run the previous stage first: {e}")
+        return 1
+    except PipelineError as e:
+        logger.error(str(e), exc_info=e.__cause__)
+        return 1
+    except KeyboardInterrupt:
+        logger.warning(f"Stage '{args.stage}' interrupted")
+        return 130
+    finally:
+        write_metrics(args, metrics)
+    logger.info(
+        f"Stage '{args.stage}' finished in {time.perf_counter() - STARTED_AT:.2f} s"
+    )
+    return 0 if succeeded else 1
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,6 +1,21 @@
-from .extractor import PokemonExtractor
-from .transformer import DataTransformer
-from .reporter import DataReporter
+import importlib
 
 
 __all__ = ["PokemonExtractor", "DataTransformer", "DataReporter"]
+
+_LAZY_IMPORTS = {
+    "PokemonExtractor": ".extractor",
+    "DataTransformer": ".transformer",
+    "DataReporter": ".reporter",
+}
+
+
+def __getattr__(name: str):
+    """
+    Imports the pipeline classes on first access, so that running a single
+    stage does not pay for the plotting libraries of the others.
+    """
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,220 @@
+import numpy as np
+import pandas as pd
+
+from .aggregation import Measure
+
+MERGEABLE_FUNCTIONS = ("size", "count", "sum", "mean", "std", "min", "max")
+
+
+class TypeAggregateState:
+    """
+    Mergeable per-type partial aggregates of the Pokemon data.
+
+    For every type it keeps the Pokemon count, the non-null count, sum and sum
+    of squares of each stat column and a histogram of the experience
+    categories, plus the minimum and maximum of the columns of ``min`` and
+    ``max`` measures. States can be fed chunk by chunk and merged across
+    workers, and the final means, standard deviations and measures are
+    derived from them.
+    """
+
+    def __init__(
+        self,
+        stat_columns: list[str],
+        categories: list[str],
+        measures: list[Measure] = (),
+    ):
+        """
+        Args:
+            stat_columns (list[str]): The stat columns to aggregate.
+            categories (list[str]): The possible experience categories.
+            measures (list[Measure]): Extra measures of each type, such as the
+                ``TYPE_STATISTICS_MEASURES``.
+
+        Raises:
+            ValueError: If a measure cannot be merged across chunks, such as
+                a median or a percentile.
+        """
+        for measure in measures:
+            if measure.function not in MERGEABLE_FUNCTIONS:
+                raise ValueError(
+                    f"Measure {measure.name!r} cannot be computed chunk by chunk, "
+                    f"only {list(MERGEABLE_FUNCTIONS)} can be merged"
+                )
+        self.stat_columns = list(stat_columns)
+        self.categories = list(categories)
+        self.measures = list(measures)
+        self._summed_columns = list(
+            dict.fromkeys(
+                self.stat_columns
+                + [measure.column for measure in self.measures if measure.column]
+            )
+        )
+        self._extreme_columns = list(
+            dict.fromkeys(
+                f"{measure.column}_{measure.function}"
+                for measure in self.measures
+                if measure.function in ("min", "max")
+            )
+        )
+        self._integer_columns = set()
+        columns = ["Count"]
+        for column in self._summed_columns:
+            columns += [f"{column}_count", f"{column}_sum", f"{column}_sumsq"]
+        columns += [f"Category_{category}" for category in self.categories]
+        self.frame = pd.DataFrame(
+            columns=columns, index=pd.Index([], name="Types"), dtype="float64"
+        )
+        self.extremes = pd.DataFrame(
+            columns=self._extreme_columns,
+            index=pd.Index([], name="Types"),
+            dtype="float64",
+        )
+
+    def _partial_aggregates(self, pokemon_dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes the partial aggregates of a chunk in one grouped pass.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): A chunk of categorized Pokemon data.
+
+        Returns:
+            pd.DataFrame: The partial aggregates of the chunk, indexed by type.
+        """
+        exploded_df = pokemon_dataframe.explode("Types").dropna(subset=["Types"])
+        partial = {"Types": exploded_df["Types"].to_numpy(), "Count": 1.0}
+        for column in self._summed_columns:
+            values = exploded_df[column].astype("float64")
+            present = values.notna()
+            values = values.fillna(0.0).to_numpy()
+            partial[f"{column}_count"] = present.to_numpy(dtype="float64")
+            partial[f"{column}_sum"] = values
+            partial[f"{column}_sumsq"] = values * values
+        if self.categories:
+            category = exploded_df["Category"].astype(str)
+            for name in self.categories:
+                partial[f"Category_{name}"] = (category == name).to_numpy(dtype="float64")
+        return pd.DataFrame(partial).groupby("Types").sum()[self.frame.columns]
+
+    def _partial_extremes(self, pokemon_dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes the minimum and maximum columns of a chunk in one grouped pass.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): A chunk of Pokemon data.
+
+        Returns:
+            pd.DataFrame: The extremes of the chunk, indexed by type.
+        """
+        exploded_df = pokemon_dataframe.explode("Types").dropna(subset=["Types"])
+        partial = {"Types": exploded_df["Types"].to_numpy()}
+        functions = {}
+        for name in self._extreme_columns:
+            column, _, function = name.rpartition("_")
+            partial[name] = exploded_df[column].astype("float64").to_numpy()
+            functions[name] = function
+        return pd.DataFrame(partial).groupby("Types").agg(functions)
+
+    def _merge_extremes(self, extremes: pd.DataFrame):
+        """
+        Folds other extremes into the state's, ignoring missing values.
+
+        Args:
+            extremes (pd.DataFrame): The extremes to fold, indexed by type.
+        """
+        if not self._extreme_columns:
+            return
+        self.extremes = self.extremes.combine(
+            extremes,
+            lambda current, other: (
+                np.fmin(current, other)
+                if current.name.endswith("_min")
+                else np.fmax(current, other)
+            ),
+        )[self._extreme_columns]
+
+    def update(self, pokemon_dataframe: pd.DataFrame) -> "TypeAggregateState":
+        """
+        Adds a chunk of categorized Pokemon data to the state.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): A chunk of categorized Pokemon data.
+
+        Returns:
+            TypeAggregateState: The updated state.
+        """
+        if len(pokemon_dataframe):
+            self.frame = self.frame.add(
+                self._partial_aggregates(pokemon_dataframe), fill_value=0.0
+            )
+            if self._extreme_columns:
+                self._merge_extremes(self._partial_extremes(pokemon_dataframe))
+            self._integer_columns.update(
+                column
+                for column in self._summed_columns
+                if pd.api.types.is_integer_dtype(pokemon_dataframe[column])
+            )
+        return self
+
+    def merge(self, other: "TypeAggregateState") -> "TypeAggregateState":
+        """
+        Merges another state, such as one built by another worker, into this one.
+
+        Args:
+            other (TypeAggregateState): The state to merge.
+
+        Returns:
+            TypeAggregateState: The merged state.
+        """
+        self.frame = self.frame.add(other.frame, fill_value=0.0)
+        self._merge_extremes(other.extremes)
+        self._integer_columns.update(other._integer_columns)
+        return self
+
+    def to_type_aggregates(self) -> pd.DataFrame:
+        """
+        Derives the final per-type aggregates from the state.
+
+        Returns:
+            pd.DataFrame: The count, mean and standard deviation of every stat,
+                the category histogram and the extra measures of each type,
+                indexed by type. Sums and extremes of integer columns are
+                integers, as when computed on the whole data.
+        """
+        frame = self.frame.sort_index()
+        extremes = self.extremes.reindex(frame.index)
+        type_aggregates = pd.DataFrame(index=frame.index)
+        type_aggregates["Count"] = frame["Count"].astype("int64")
+        means = {}
+        deviations = {}
+        for column in self._summed_columns:
+            count = frame[f"{column}_count"].where(frame[f"{column}_count"] > 0)
+            mean = frame[f"{column}_sum"] / count
+            variance = (frame[f"{column}_sumsq"] - count * mean * mean) / (count - 1)
+            means[column] = mean
+            deviations[column] = variance.clip(lower=0.0) ** 0.5
+        for column in self.stat_columns:
+            type_aggregates[column] = means[column]
+            type_aggregates[f"{column} Std"] = deviations[column]
+        for category in self.categories:
+            type_aggregates[category] = frame[f"Category_{category}"].astype("int64")
+        for measure in self.measures:
+            column = measure.column
+            if measure.function == "size":
+                values = frame["Count"].astype("int64")
+            elif measure.function == "count":
+                values = frame[f"{column}_count"].astype("int64")
+            elif measure.function == "mean":
+                values = means[column]
+            elif measure.function == "std":
+                values = deviations[column]
+            elif measure.function == "sum":
+                values = frame[f"{column}_sum"]
+            else:
+                values = extremes[f"{column}_{measure.function}"]
+            if measure.function in ("sum", "min", "max") and (
+                column in self._integer_columns
+            ):
+                values = values.round().astype("Int64")
+            type_aggregates[measure.name] = values
+        return type_aggregates
@@ -0,0 +1,518 @@
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from .columnar import POKEMON_COLUMNS
+
+AGGREGATION_FUNCTIONS = (
+    "size",
+    "count",
+    "sum",
+    "mean",
+    "median",
+    "std",
+    "min",
+    "max",
+    "quantile",
+)
+FILTER_OPERATORS = ("==", "!=", "<", "<=", ">", ">=", "in", "contains")
+LIST_COLUMNS = frozenset(
+    column for column, kind in POKEMON_COLUMNS.items() if kind == "list"
+)
+
+_PERCENTILE = re.compile(r"p(\d{1,2}(?:\.\d+)?)")
+
+
+def validate_name(name: object, kind: str) -> str:
+    """
+    Checks that a name can label a column: a non-empty string of printable
+    characters, which ``sql_identifier`` and ``sql_literal`` can quote.
+
+    Args:
+        name (object): The name.
+        kind (str): What the name is of, for the error message.
+
+    Returns:
+        str: The name.
+
+    Raises:
+        ValueError: If the name is not a non-empty printable string.
+    """
+    if not isinstance(name, str) or not name.strip() or not name.isprintable():
+        raise ValueError(
+            f"Invalid {kind} name {name!r}, expected a non-empty printable string"
+        )
+    return name
+
+
+def sql_identifier(name: str) -> str:
+    """
+    Quotes a name as an SQL identifier, such as a column alias.
+
+    Args:
+        name (str): The name.
+
+    Returns:
+        str: The name in double quotes, with its double quotes doubled.
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_literal(value: str) -> str:
+    """
+    Quotes a string as an SQL string literal.
+
+    Args:
+        value (str): The string.
+
+    Returns:
+        str: The string in single quotes, with its single quotes doubled.
+    """
+    return "'" + value.replace("'", "''") + "'"
+
+
+class Measure(NamedTuple):
+    """
+    A value computed for every group: ``function`` applied to ``column``.
+    ``size`` counts the rows of the group and needs no column; ``quantile``
+    takes the quantile ``q``.
+    """
+
+    name: str
+    column: str | None = None
+    function: str = "size"
+    q: float | None = None
+
+    @property
+    def key(self) -> str:
+        """
+        Identifies the computation, so that measures with different names
+        but the same definition are computed once.
+        """
+        return f"{self.function}({self.column}, {self.q})"
+
+
+class Bucket(NamedTuple):
+    """
+    A derived categorical column: the value of ``column`` is labeled with the
+    first label whose exclusive upper bound it is under. Values over every
+    bound, and missing values, get the last label.
+    """
+
+    name: str
+    column: str
+    upper_bounds: tuple[float, ...]
+    labels: tuple[str, ...]
+
+    @classmethod
+    def from_upper_bounds(
+        cls, name: str, column: str, upper_bounds: dict[str, float | None]
+    ) -> "Bucket":
+        """
+        Builds a bucket from labels and their upper bounds, such as
+        ``{"Weak": 50, "Medium": 100, "Strong": None}``.
+
+        Args:
+            name (str): The name of the derived column.
+            column (str): The bucketed column.
+            upper_bounds (dict[str, float | None]): The exclusive upper bound
+                of each label, in ascending order. The last label is
+                unbounded and its bound must be None.
+
+        Returns:
+            Bucket: The bucket.
+
+        Raises:
+            ValueError: If the bounds are not ascending, the last label is
+                bounded or a label is not a valid name.
+        """
+        labels = tuple(
+            validate_name(label, f"{name!r} bucket label") for label in upper_bounds
+        )
+        bounds = tuple(upper_bounds.values())
+        if not labels or bounds[-1] is not None:
+            raise ValueError(f"The last bucket of {name!r} must have no upper bound")
+        if any(bound is None for bound in bounds[:-1]) or list(bounds[:-1]) != sorted(
+            bounds[:-1]
+        ):
+            raise ValueError(f"The bucket bounds of {name!r} must be ascending")
+        return cls(name, column, tuple(bounds[:-1]), labels)
+
+    @property
+    def dtype(self) -> pd.CategoricalDtype:
+        """
+        Returns the ordered categorical type of the labels.
+        """
+        return pd.CategoricalDtype(list(self.labels), ordered=True)
+
+    def apply(self, values: pd.Series) -> pd.Categorical:
+        """
+        Labels the values.
+
+        Args:
+            values (pd.Series): The values of the bucketed column.
+
+        Returns:
+            pd.Categorical: The label of each value.
+        """
+        values = values.to_numpy(dtype="float64", na_value=np.nan)
+        codes = np.select(
+            [values < bound for bound in self.upper_bounds],
+            range(len(self.upper_bounds)),
+            default=len(self.upper_bounds),
+        )
+        return pd.Categorical.from_codes(codes, dtype=self.dtype)
+
+    def sql_case(self, column_sql: str) -> str:
+        """
+        Builds the SQL expression labeling a column, with the semantics of
+        ``apply``. The labels are quoted as string literals.
+
+        Args:
+            column_sql (str): The SQL expression of the bucketed column.
+
+        Returns:
+            str: The SQL ``CASE`` expression.
+        """
+        cases = " ".join(
+            f"WHEN {column_sql} < {float(bound)!r} THEN {sql_literal(label)}"
+            for bound, label in zip(self.upper_bounds, self.labels)
+        )
+        return f"CASE {cases} ELSE {sql_literal(self.labels[-1])} END"
+
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    A row condition. ``in`` checks membership in a collection of values and
+    ``contains`` checks whether a list column holds ``value``.
+
+    Filters are hashable, so that specs sharing a filter share its mask: a
+    collection value, such as the list of an ``in`` filter, is stored as a tuple.
+    """
+
+    column: str
+    operator: str
+    value: object
+
+    def __post_init__(self):
+        if isinstance(self.value, (list, set, frozenset)):
+            values = self.value
+            if not isinstance(values, list):
+                values = sorted(values, key=repr)
+            object.__setattr__(self, "value", tuple(values))
+
+    def mask(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """
+        Evaluates the condition on every row.
+
+        Args:
+            dataframe (pd.DataFrame): The data.
+
+        Returns:
+            np.ndarray: The boolean mask of the matching rows.
+        """
+        values = dataframe[self.column]
+        if self.operator == "contains":
+            return np.array(
+                [items is not None and self.value in items for items in values.tolist()],
+                dtype=bool,
+            )
+        if self.operator == "in":
+            return values.isin(list(self.value)).to_numpy()
+        comparisons = {
+            "==": values.__eq__,
+            "!=": values.__ne__,
+            "<": values.__lt__,
+            "<=": values.__le__,
+            ">": values.__gt__,
+            ">=": values.__ge__,
+        }
+        return comparisons[self.operator](self.value).fillna(False).to_numpy(dtype=bool)
+
+
+class AggregationSpec(NamedTuple):
+    """
+    A declarative aggregation: the measures of the rows matching every
+    filter, grouped by the group keys. List columns, such as ``Types``, are
+    exploded so that each item is its own group; bucket names can be used as
+    columns.
+    """
+
+    name: str
+    group_by: tuple[str, ...]
+    measures: tuple[Measure, ...]
+    filters: tuple[Filter, ...] = ()
+
+
+class AggregationPass(NamedTuple):
+    """
+    One grouped pass of a plan, shared by the specs with the same group keys
+    and filters. Passes with the same filters and exploded columns read the
+    same scan of the data.
+    """
+
+    scan: tuple
+    group_by: tuple[str, ...]
+    measures: tuple[Measure, ...]
+    specs: tuple[str, ...]
+
+
+def parse_measure(text: str) -> Measure:
+    """
+    Parses a measure written as ``"<column> <function>"``, such as
+    ``"HP median"``, ``"Special Attack std"`` or ``"Speed p90"`` for a
+    percentile. ``"count"`` alone counts the rows.
+
+    Args:
+        text (str): The measure.
+
+    Returns:
+        Measure: The measure, named after the text.
+
+    Raises:
+        ValueError: If the function is unknown or the text is not a valid name.
+    """
+    validate_name(text, "measure")
+    column, _, function = text.strip().rpartition(" ")
+    if not column:
+        if function in ("count", "size"):
+            return Measure(text, None, "size")
+        raise ValueError(f"Invalid measure {text!r}, expected '<column> <function>'")
+    percentile = _PERCENTILE.fullmatch(function)
+    if percentile:
+        return Measure(text, column, "quantile", float(percentile.group(1)) / 100)
+    if function not in AGGREGATION_FUNCTIONS or function == "quantile":
+        raise ValueError(
+            f"Invalid measure {text!r}, expected one of "
+            f"{[f for f in AGGREGATION_FUNCTIONS if f != 'quantile'] + ['pNN']}"
+        )
+    return Measure(text, column, function)
+
+
+class AggregationEngine:
+    """
+    Plans aggregation specs into the fewest grouped passes and runs them.
+
+    Specs with the same group keys and filters share one grouped pass, with
+    every distinct measure computed once. Passes with the same filters and
+    exploded list columns share one scan: the filter masks, the bucket
+    columns and the exploded data are materialized once for all of them.
+    """
+
+    def __init__(
+        self,
+        buckets: Iterable[Bucket] = (),
+        list_columns: Iterable[str] = LIST_COLUMNS,
+    ):
+        """
+        Args:
+            buckets (Iterable[Bucket]): The derived columns the specs may use.
+            list_columns (Iterable[str]): The list columns exploded when
+                grouped by.
+        """
+        self.buckets = {bucket.name: bucket for bucket in buckets}
+        self.list_columns = frozenset(list_columns)
+
+    def plan(self, specs: Iterable[AggregationSpec]) -> list[AggregationPass]:
+        """
+        Groups the specs into grouped passes.
+
+        Args:
+            specs (Iterable[AggregationSpec]): The aggregations to run.
+
+        Returns:
+            list[AggregationPass]: The passes, in the order of their first spec.
+
+        Raises:
+            ValueError: If a spec has no group keys, an invalid or duplicate
+                name, or a measure or filter has an unknown function or operator.
+        """
+        passes = {}
+        for spec in specs:
+            validate_name(spec.name, "aggregation")
+            if not spec.group_by:
+                raise ValueError(f"Aggregation {spec.name!r} has no group keys")
+            measure_names = [
+                validate_name(measure.name, "measure") for measure in spec.measures
+            ]
+            if len(set(measure_names)) != len(measure_names):
+                raise ValueError(
+                    f"Aggregation {spec.name!r} has duplicate measure names"
+                )
+            for measure in spec.measures:
+                if measure.function not in AGGREGATION_FUNCTIONS:
+                    raise ValueError(
+                        f"Unknown function {measure.function!r} in {spec.name!r}, "
+                        f"expected one of {list(AGGREGATION_FUNCTIONS)}"
+                    )
+            for row_filter in spec.filters:
+                if row_filter.operator not in FILTER_OPERATORS:
+                    raise ValueError(
+                        f"Unknown operator {row_filter.operator!r} in {spec.name!r}, "
+                        f"expected one of {list(FILTER_OPERATORS)}"
+                    )
+            filters = tuple(sorted(set(spec.filters), key=repr))
+            group_by = tuple(spec.group_by)
+            exploded = tuple(
+                column for column in group_by if column in self.list_columns
+            )
+            scan, measures, names = passes.get(
+                (filters, group_by), ((filters, exploded), {}, [])
+            )
+            for measure in spec.measures:
+                measures.setdefault(measure.key, measure)
+            names.append(spec.name)
+            passes[(filters, group_by)] = (scan, measures, names)
+        return [
+            AggregationPass(scan, group_by, tuple(measures.values()), tuple(names))
+            for (_, group_by), (scan, measures, names) in passes.items()
+        ]
+
+    def _column(
+        self, dataframe: pd.DataFrame, column: str, derived: dict[str, pd.Categorical]
+    ):
+        """
+        Returns a column of the data, deriving bucket columns once.
+
+        Args:
+            dataframe (pd.DataFrame): The data.
+            column (str): The column or bucket name.
+            derived (dict[str, pd.Categorical]): The bucket columns derived so far.
+
+        Returns:
+            The values of the column.
+        """
+        if column in dataframe:
+            return dataframe[column].array
+        if column not in derived:
+            bucket = self.buckets[column]
+            derived[column] = bucket.apply(dataframe[bucket.column])
+        return derived[column]
+
+    def _scan(
+        self,
+        dataframe: pd.DataFrame,
+        scan: tuple,
+        columns: set[str],
+        masks: dict[Filter, np.ndarray],
+        derived: dict[str, pd.Categorical],
+    ) -> pd.DataFrame:
+        """
+        Materializes the rows and columns read by the passes of a scan.
+
+        Args:
+            dataframe (pd.DataFrame): The data.
+            scan (tuple): The filters and exploded columns of the scan.
+            columns (set[str]): The columns read by its passes.
+            masks (dict[Filter, np.ndarray]): The filter masks computed so far.
+            derived (dict[str, pd.Categorical]): The bucket columns derived so far.
+
+        Returns:
+            pd.DataFrame: The scanned data.
+        """
+        filters, exploded = scan
+        frame = pd.DataFrame(
+            {column: self._column(dataframe, column, derived) for column in sorted(columns)}
+        )
+        if filters:
+            mask = np.ones(len(frame), dtype=bool)
+            for row_filter in filters:
+                if row_filter not in masks:
+                    masks[row_filter] = row_filter.mask(
+                        frame if row_filter.column in frame else dataframe
+                    )
+                mask &= masks[row_filter]
+            frame = frame[mask]
+        for column in exploded:
+            frame = frame.explode(column)
+        return frame
+
+    def _run_pass(self, frame: pd.DataFrame, aggregation_pass: AggregationPass) -> pd.DataFrame:
+        """
+        Computes every measure of a pass on one grouping of the scanned data.
+
+        Args:
+            frame (pd.DataFrame): The scanned data.
+            aggregation_pass (AggregationPass): The pass.
+
+        Returns:
+            pd.DataFrame: The measures, keyed by ``Measure.key``, indexed by
+                the group keys.
+        """
+        group_by = list(aggregation_pass.group_by)
+        grouped = frame.groupby(group_by, sort=True, observed=True)
+        named = {
+            measure.key: (measure.column or group_by[0], measure.function)
+            for measure in aggregation_pass.measures
+            if measure.function != "quantile"
+        }
+        result = grouped.agg(**named)
+        quantiles = {}
+        for measure in aggregation_pass.measures:
+            if measure.function == "quantile":
+                quantiles.setdefault(measure.q, []).append(measure)
+        for q, measures in quantiles.items():
+            columns = sorted({measure.column for measure in measures})
+            values = grouped[columns].quantile(q)
+            for measure in measures:
+                result[measure.key] = values[measure.column].astype("float64")
+        return result
+
+    def run(
+        self, dataframe: pd.DataFrame, specs: Iterable[AggregationSpec]
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Runs the aggregation specs.
+
+        Args:
+            dataframe (pd.DataFrame): The data.
+            specs (Iterable[AggregationSpec]): The aggregations to run.
+
+        Returns:
+            dict[str, pd.DataFrame]: The measures of each spec, one column per
+                measure name, indexed by its group keys, by spec name.
+
+        Raises:
+            KeyError: If a spec reads a column that is not in the data.
+        """
+        specs = list(specs)
+        passes = self.plan(specs)
+        scan_columns = {}
+        for aggregation_pass in passes:
+            columns = scan_columns.setdefault(aggregation_pass.scan, set())
+            columns.update(aggregation_pass.group_by)
+            columns.update(
+                measure.column
+                for measure in aggregation_pass.measures
+                if measure.column is not None
+            )
+            columns.update(
+                row_filter.column
+                for row_filter in aggregation_pass.scan[0]
+                if row_filter.column in self.buckets
+            )
+        masks = {}
+        derived = {}
+        scans = {
+            scan: self._scan(dataframe, scan, columns, masks, derived)
+            for scan, columns in scan_columns.items()
+        }
+        pass_results = {}
+        for aggregation_pass in passes:
+            result = self._run_pass(scans[aggregation_pass.scan], aggregation_pass)
+            for name in aggregation_pass.specs:
+                pass_results[name] = result
+        results = {}
+        for spec in specs:
+            result = pass_results[spec.name]
+            spec_result = pd.DataFrame(
+                {measure.name: result[measure.key] for measure in spec.measures},
+                index=result.index,
+            )
+            results[spec.name] = spec_result
+        return results
@@ -0,0 +1,245 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, NamedTuple
+
+import requests
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+
+class ResponseCache:
+    """
+    Persistent SQLite cache of HTTP response bodies keyed by URL.
+
+    Entries younger than the TTL are served without touching the network,
+    stale entries are revalidated with ``If-None-Match``/``If-Modified-Since``
+    and the least recently used entries are evicted once the stored bodies
+    exceed the byte budget.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float, max_bytes: int):
+        """
+        Args:
+            path (str): The path of the SQLite database file.
+            ttl_seconds (float): How long an entry is served without revalidation.
+            max_bytes (int): The maximum total size of the cached bodies.
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses (accessed_at)"
+        )
+        self._connection.commit()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def get(self, url: str) -> CacheEntry | None:
+        """
+        Looks up a cached response and marks it as recently used.
+
+        Args:
+            url (str): The URL of the response.
+
+        Returns:
+            CacheEntry | None: The cached entry, or None if it is not cached.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+            self._connection.commit()
+        return CacheEntry(*row)
+
+    def is_fresh(self, entry: CacheEntry, max_age: float | None = None) -> bool:
+        """
+        Checks whether an entry can be served without revalidation.
+
+        Args:
+            entry (CacheEntry): The cached entry.
+            max_age (float | None): The maximum age, in seconds, of a fresh
+                entry. Defaults to the TTL.
+
+        Returns:
+            bool: True if the entry is younger than the maximum age, False otherwise.
+        """
+        if max_age is None:
+            max_age = self.ttl_seconds
+        return time.time() - entry.fetched_at < max_age
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        """
+        Stores a response body and evicts the least recently used entries
+        if the byte budget is exceeded.
+
+        Args:
+            url (str): The URL of the response.
+            body (bytes): The response body.
+            etag (str | None): The ``ETag`` header of the response.
+            last_modified (str | None): The ``Last-Modified`` header of the response.
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now, now, len(body)),
+            )
+            self._evict()
+            self._connection.commit()
+
+    def refresh(self, url: str):
+        """
+        Marks an entry as freshly validated after a ``304 Not Modified``.
+
+        Args:
+            url (str): The URL of the response.
+        """
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self._connection.commit()
+
+    def _evict(self):
+        """
+        Deletes the least recently used entries until the byte budget is met.
+        Must be called with the lock held.
+        """
+        total_size = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+        rows = self._connection.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        evicted_urls = []
+        for url, size in rows:
+            if total_size <= self.max_bytes:
+                break
+            evicted_urls.append((url,))
+            total_size -= size
+        self._connection.executemany("DELETE FROM responses WHERE url = ?", evicted_urls)
+
+    def _increment(self, counter: str):
+        """
+        Increments one of the hit/miss counters.
+
+        Args:
+            counter (str): The name of the counter attribute.
+        """
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def fetch(
+        self,
+        url: str,
+        send_request: Callable[[dict], requests.Response],
+        max_age: float | None = None,
+    ) -> bytes:
+        """
+        Returns the body of a URL from the cache, revalidating or downloading
+        it through ``send_request`` when needed.
+
+        Args:
+            url (str): The URL to fetch.
+            send_request (Callable[[dict], requests.Response]): Sends the
+                request with the given extra headers and returns the response.
+            max_age (float | None): The maximum age, in seconds, of an entry
+                served without revalidation. Defaults to the TTL; ``0``
+                always revalidates.
+
+        Returns:
+            bytes: The response body.
+        """
+        entry = self.get(url)
+        if entry is not None and self.is_fresh(entry, max_age):
+            self._increment("hits")
+            return entry.body
+
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        response = send_request(headers)
+        if entry is not None and response.status_code == 304:
+            self._increment("revalidations")
+            self.refresh(url)
+            return entry.body
+
+        self._increment("misses")
+        self.put(
+            url,
+            response.content,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        return response.content
+
+    def stats(self) -> dict:
+        """
+        Returns the hit and miss counters of the cache.
+
+        Returns:
+            dict: The hits, revalidations, misses and hit rate.
+        """
+        lookups = self.hits + self.revalidations + self.misses
+        return {
+            "hits": self.hits,
+            "revalidations": self.revalidations,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.revalidations) / lookups, 4)
+            if lookups
+            else 0.0,
+        }
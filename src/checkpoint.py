@@ -0,0 +1,96 @@
+import json
+import logging
+import os
+import time
+
+
+class CheckpointStore:
+    """
+    Local checkpoint of the Pokémon records that were already extracted.
+
+    Records are appended to a JSON Lines file as soon as they are built, so
+    an interrupted run keeps everything it finished, and a small state file
+    tracks the high-water mark of extracted IDs.
+    """
+
+    RECORDS_FILE = "records.jsonl"
+    STATE_FILE = "state.json"
+
+    def __init__(self, directory: str, logger: logging.Logger):
+        """
+        Args:
+            directory (str): The directory holding the checkpoint files.
+            logger (logging.Logger): The logger.
+        """
+        self.directory = directory
+        self.logger = logger
+        self.records_path = os.path.join(directory, self.RECORDS_FILE)
+        self.state_path = os.path.join(directory, self.STATE_FILE)
+        os.makedirs(directory, exist_ok=True)
+        self.records = self._load_records()
+        self.high_water_mark = max(self.records, default=0)
+
+    def _load_records(self) -> dict[int, dict]:
+        """
+        Loads the persisted records, ignoring a truncated trailing line left
+        by a crash.
+
+        Returns:
+            dict[int, dict]: The records indexed by Pokémon ID.
+        """
+        records = {}
+        if not os.path.exists(self.records_path):
+            return records
+        with open(self.records_path, encoding="utf-8") as records_file:
+            for line in records_file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    self.logger.warning(
+                        f"Skipping corrupted checkpoint line in {self.records_path}"
+                    )
+                    continue
+                records[record["ID"]] = record
+        return records
+
+    def extracted_ids(self) -> set[int]:
+        """
+        Returns the IDs of the Pokémon already in the checkpoint.
+
+        Returns:
+            set[int]: The extracted IDs.
+        """
+        return set(self.records)
+
+    def append(self, records: list[dict]):
+        """
+        Durably appends newly extracted records and updates the high-water mark.
+
+        Args:
+            records (list[dict]): The records to persist.
+        """
+        if not records:
+            return
+        with open(self.records_path, "a", encoding="utf-8") as records_file:
+            for record in records:
+                records_file.write(json.dumps(record) + "\n")
+            records_file.flush()
+            os.fsync(records_file.fileno())
+        for record in records:
+            self.records[record["ID"]] = record
+        self.high_water_mark = max(self.high_water_mark, *self.records)
+        self._write_state()
+
+    def _write_state(self):
+        """
+        Atomically writes the checkpoint state file.
+        """
+        state = {
+            "high_water_mark": self.high_water_mark,
+            "extracted_count": len(self.records),
+            "updated_at": time.time(),
+        }
+        temporary_path = f"{self.state_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as state_file:
+            json.dump(state, state_file)
+        os.replace(temporary_path, self.state_path)
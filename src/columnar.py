@@ -0,0 +1,275 @@
+from collections.abc import Iterable
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+from .decoding import POKEMON_SCHEMA, schema_columns
+
+
+POKEMON_COLUMNS = schema_columns(POKEMON_SCHEMA)
+BATCH_SIZE = 4096
+
+
+def _smallest_int_dtype(values: np.ndarray) -> np.dtype:
+    """
+    Finds the smallest integer dtype that holds all the given values.
+
+    Args:
+        values (np.ndarray): The integer values.
+
+    Returns:
+        np.dtype: The smallest fitting dtype, unsigned if no value is negative.
+    """
+    if not values.size:
+        return np.dtype(np.uint8)
+    low, high = int(values.min()), int(values.max())
+    candidates = (
+        (np.uint8, np.uint16, np.uint32, np.uint64)
+        if low >= 0
+        else (np.int8, np.int16, np.int32, np.int64)
+    )
+    for dtype in candidates:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+class PokemonColumnBuilder:
+    """
+    Accumulates Pokémon records into typed column buffers and builds a
+    DataFrame with compact dtypes from them.
+
+    Records are buffered and converted ``batch_size`` at a time, one numpy
+    call per column, instead of being appended value by value.
+
+    Column kinds:
+        - ``int``: int64 chunks plus a missing-value mask, downcast to the
+          smallest integer dtype that fits (nullable if values are missing).
+        - ``str``: plain Python strings.
+        - ``category``: strings stored as a pandas categorical.
+        - ``list``: lists of strings, dictionary-encoded by distinct list.
+          Rows of the DataFrame with equal lists share one list object, which
+          must not be mutated; ``list_layout`` gives the offsets + values form.
+    """
+
+    def __init__(
+        self, columns: dict[str, str] = POKEMON_COLUMNS, batch_size: int = BATCH_SIZE
+    ):
+        """
+        Args:
+            columns (dict[str, str]): The kind of each column, by column name.
+            batch_size (int): The number of records converted at a time.
+        """
+        self.columns = columns
+        self.batch_size = max(1, batch_size)
+        self._pending = []
+        self._int_chunks = {}
+        self._int_missing = {}
+        self._str_values = {}
+        self._list_chunks = {}
+        self._list_dictionaries = {}
+        for column, kind in columns.items():
+            if kind == "int":
+                self._int_chunks[column] = []
+                self._int_missing[column] = []
+            elif kind in ("str", "category"):
+                self._str_values[column] = []
+            elif kind == "list":
+                self._list_chunks[column] = []
+                self._list_dictionaries[column] = {}
+            else:
+                raise ValueError(f"Unknown column kind {kind!r} for column {column!r}")
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length + len(self._pending)
+
+    def append(self, record: dict):
+        """
+        Appends a Pokémon record to the column buffers.
+
+        Args:
+            record (dict): The dictionary of Pokémon data.
+        """
+        self._pending.append(record)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def extend(self, records: Iterable[dict]):
+        """
+        Appends several Pokémon records to the column buffers, holding at most
+        one batch of them at a time.
+
+        Args:
+            records (Iterable[dict]): The dictionaries of Pokémon data.
+        """
+        iterator = iter(records)
+        while batch := list(islice(iterator, self.batch_size - len(self._pending))):
+            self._pending.extend(batch)
+            if len(self._pending) >= self.batch_size:
+                self._flush()
+
+    def _flush(self):
+        """
+        Converts the buffered records into column chunks.
+        """
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        for column, chunks in self._int_chunks.items():
+            values = [record.get(column) for record in batch]
+            try:
+                chunks.append(np.array(values, dtype=np.int64))
+                self._int_missing[column].append(None)
+            except TypeError:
+                missing = np.array([value is None for value in values], dtype=np.bool_)
+                chunks.append(
+                    np.array(
+                        [0 if value is None else value for value in values],
+                        dtype=np.int64,
+                    )
+                )
+                self._int_missing[column].append(missing)
+        for column, values in self._str_values.items():
+            values.extend([record.get(column) for record in batch])
+        for column, chunks in self._list_chunks.items():
+            dictionary = self._list_dictionaries[column]
+            # setdefault gives a new distinct list the next code.
+            codes = (
+                dictionary.setdefault(tuple(record.get(column) or ()), len(dictionary))
+                for record in batch
+            )
+            chunks.append(np.fromiter(codes, dtype=np.int32, count=len(batch)))
+        self._length += len(batch)
+
+    def _int_column(self, column: str) -> np.ndarray | pd.api.extensions.ExtensionArray:
+        """
+        Builds an integer column with the smallest fitting dtype.
+
+        Args:
+            column (str): The column name.
+
+        Returns:
+            np.ndarray | pd.api.extensions.ExtensionArray: The column values,
+                as a nullable integer array if any value is missing.
+        """
+        chunks = self._int_chunks[column]
+        values = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+        masks = self._int_missing[column]
+        if all(mask is None for mask in masks):
+            return values.astype(_smallest_int_dtype(values))
+        missing = np.concatenate([
+            np.zeros(len(chunk), dtype=np.bool_) if mask is None else mask
+            for chunk, mask in zip(chunks, masks)
+        ])
+        dtype = _smallest_int_dtype(values[~missing])
+        return pd.arrays.IntegerArray(values.astype(dtype), missing)
+
+    def _list_codes(self, column: str) -> np.ndarray:
+        """
+        Returns the code of the distinct list of each row, in insertion order.
+
+        Args:
+            column (str): The column name.
+
+        Returns:
+            np.ndarray: The codes, indexing the column's list dictionary.
+        """
+        chunks = self._list_chunks[column]
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int32)
+
+    def _list_column(self, column: str) -> np.ndarray:
+        """
+        Expands a dictionary-encoded list column into per-row lists, building
+        one list per distinct value and sharing it between the rows.
+
+        Args:
+            column (str): The column name.
+
+        Returns:
+            np.ndarray: The list of each row, as an object array.
+        """
+        distinct = np.empty(len(self._list_dictionaries[column]), dtype=object)
+        for items, code in self._list_dictionaries[column].items():
+            distinct[code] = list(items)
+        return distinct[self._list_codes(column)]
+
+    def _row_order(self) -> np.ndarray | None:
+        """
+        Returns the order of the rows by ``ID``, as ``to_dataframe`` sorts them.
+
+        Returns:
+            np.ndarray | None: The row positions, or None if the rows are
+                already ordered.
+        """
+        if "ID" not in self._int_chunks:
+            return None
+        ids = pd.Series(self._int_column("ID"))
+        if ids.is_monotonic_increasing:
+            return None
+        return ids.sort_values(kind="stable").index.to_numpy()
+
+    def list_layout(self, column: str = "Types") -> tuple[np.ndarray, pd.Categorical]:
+        """
+        Returns a list column in offsets + values form, without building the
+        per-row lists. The items of row ``i`` are
+        ``values[offsets[i]:offsets[i + 1]]``, with rows ordered by ``ID``.
+
+        Args:
+            column (str): The list column name.
+
+        Returns:
+            tuple[np.ndarray, pd.Categorical]: The offsets and the values.
+        """
+        self._flush()
+        dictionary = self._list_dictionaries[column]
+        categories = {}
+        for items in dictionary:
+            for item in items:
+                categories.setdefault(item, len(categories))
+        distinct_lengths = np.array(
+            [len(items) for items in dictionary], dtype=np.int64
+        )
+        distinct_values = np.array(
+            [categories[item] for items in dictionary for item in items], dtype=np.int32
+        )
+        distinct_offsets = np.concatenate(([0], np.cumsum(distinct_lengths)))
+        codes = self._list_codes(column)
+        order = self._row_order()
+        if order is not None:
+            codes = codes[order]
+        lengths = distinct_lengths[codes]
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        # Position of each item in distinct_values: its list's start plus its
+        # index within the row.
+        starts = np.repeat(distinct_offsets[codes] - offsets[:-1], lengths)
+        positions = starts + np.arange(offsets[-1])
+        values = pd.Categorical.from_codes(
+            distinct_values[positions], categories=list(categories)
+        )
+        return offsets, values
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """
+        Builds the DataFrame from the column buffers, ordered by ``ID``.
+
+        Returns:
+            pd.DataFrame: The DataFrame of Pokémon data.
+        """
+        self._flush()
+        data = {}
+        for column, kind in self.columns.items():
+            if kind == "int":
+                data[column] = self._int_column(column)
+            elif kind == "str":
+                data[column] = pd.array(self._str_values[column], dtype=object)
+            elif kind == "category":
+                data[column] = pd.Categorical(self._str_values[column])
+            else:
+                data[column] = self._list_column(column)
+        dataframe = pd.DataFrame(data, columns=list(self.columns))
+        if "ID" in dataframe and not dataframe["ID"].is_monotonic_increasing:
+            dataframe = dataframe.sort_values("ID", kind="stable", ignore_index=True)
+        return dataframe
@@ -0,0 +1,298 @@
+import json
+import logging
+import signal
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+from config import Settings
+from .columnar import PokemonColumnBuilder
+from .extractor import PokemonExtractor
+from .metrics import MetricsRecorder
+from .pipeline import PipelineError, stage_errors
+from .reporter import DataReporter
+from .store import PokemonStore
+from .transformer import DataTransformer
+
+DATAFRAME_ENDPOINTS = {
+    "/types": "by_type",
+    "/statistics": "type_statistics",
+    "/top": "top_5",
+}
+
+
+class _DaemonRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the read-only JSON endpoints of a ``RefreshDaemon``.
+    """
+
+    def do_GET(self):
+        status_code, body = self.server.refresh_daemon.handle_request(
+            urlparse(self.path).path
+        )
+        payload = json.dumps(body).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args):
+        self.server.refresh_daemon.logger.debug(
+            f"{self.address_string()} {format % args}"
+        )
+
+
+class RefreshDaemon:
+    """
+    Keeps the Pokémon data warm in a long-running process.
+
+    The extractor's session and cache, the current records and the per-type
+    aggregates stay in memory between refreshes. Every
+    ``REFRESH_INTERVAL_SECONDS`` the list and the details are revalidated
+    upstream with conditional requests; only the types of the Pokémon that
+    changed are re-aggregated, and the reports are re-emitted only when
+    something changed. A local HTTP endpoint serves the latest aggregates,
+    the health and the metrics of the daemon.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        metrics: MetricsRecorder | None = None,
+        max_count: int | None = None,
+    ):
+        """
+        Args:
+            logger (logging.Logger): The logger of the daemon.
+            metrics (MetricsRecorder | None): The metrics of the daemon's
+                requests. A new recorder is created if None.
+            max_count (int | None): The maximum number of Pokémon to keep
+                refreshed. None refreshes the whole list.
+        """
+        self.logger = logger
+        self.configs = Settings()
+        self.metrics = metrics if metrics is not None else MetricsRecorder()
+        self.max_count = max_count
+        self.extractor = PokemonExtractor(logger, self.metrics)
+        self.transformer = DataTransformer(logger)
+        self.store = None
+        if self.configs.STORE_ENABLED:
+            self.store = PokemonStore(self.configs.STORE_PATH)
+        self.records = {}
+        self.type_aggregates = None
+        self.transformed = None
+        self.status = {
+            "refreshes": 0,
+            "failed_refreshes": 0,
+            "changed_pokemon": 0,
+            "last_refresh_at": None,
+            "last_refresh_seconds": None,
+            "last_error": None,
+        }
+        self.server = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    @property
+    def address(self) -> tuple[str, int] | None:
+        """
+        Returns the host and port the HTTP endpoint listens on, if started.
+        """
+        return None if self.server is None else self.server.server_address[:2]
+
+    def refresh(self) -> set[int]:
+        """
+        Revalidates the Pokémon list and details upstream and applies the
+        changes. Pokémon whose details could not be fetched keep their
+        previous record.
+
+        Returns:
+            set[int]: The IDs of the Pokémon that were added, changed or removed.
+        """
+        started_at = time.perf_counter()
+        entries = list(self.extractor.iter_pokemon_data(max_count=self.max_count))
+        fetched = {
+            record["ID"]: record
+            for record in self.extractor._iter_fetched_records(entries)
+        }
+        records = {}
+        for entry in entries:
+            pokemon_id = self.extractor._extract_pokemon_id(entry["url"])
+            record = fetched.get(pokemon_id, self.records.get(pokemon_id))
+            if record is not None:
+                records[pokemon_id] = record
+        changed_ids = {
+            pokemon_id
+            for pokemon_id in records.keys() | self.records.keys()
+            if records.get(pokemon_id) != self.records.get(pokemon_id)
+        }
+        if changed_ids or self.transformed is None:
+            self._apply(records, changed_ids)
+        # The first load may be served from the cache, later ones are
+        # revalidated with conditional requests.
+        self.extractor.source.revalidate = True
+        with self._lock:
+            self.status["refreshes"] += 1
+            self.status["changed_pokemon"] += len(changed_ids)
+            self.status["last_refresh_at"] = time.time()
+            self.status["last_refresh_seconds"] = round(
+                time.perf_counter() - started_at, 4
+            )
+            self.status["last_error"] = None
+        self.logger.info(
+            f"Refreshed {len(records)} Pokemon, {len(changed_ids)} changed"
+        )
+        return changed_ids
+
+    def _apply(self, records: dict[int, dict], changed_ids: set[int]):
+        """
+        Recomputes the transformed data from the refreshed records,
+        re-aggregating only the types of the changed Pokémon, and re-emits
+        the reports.
+
+        Args:
+            records (dict[int, dict]): The refreshed records, by ID.
+            changed_ids (set[int]): The IDs of the changed Pokémon.
+        """
+        affected_types = {
+            pokemon_type
+            for pokemon_id in changed_ids
+            for record in (records.get(pokemon_id), self.records.get(pokemon_id))
+            if record is not None
+            for pokemon_type in record["Types"] or ()
+        }
+        builder = PokemonColumnBuilder()
+        builder.extend(records[pokemon_id] for pokemon_id in sorted(records))
+        pokemons_dataframe = self.transformer.categorize_experience(
+            builder.to_dataframe()
+        )
+        type_aggregates = self.transformer.update_type_aggregates(
+            self.type_aggregates,
+            pokemons_dataframe,
+            None if self.type_aggregates is None else affected_types,
+        )
+        by_type, type_statistics = self.transformer.summarize_type_aggregates(
+            type_aggregates
+        )
+        transformed = {
+            "pokemon": pokemons_dataframe,
+            "by_type": by_type,
+            "type_statistics": type_statistics,
+            "top_5": self.transformer.find_top_pokemon(pokemons_dataframe),
+            "leaderboards": self.transformer.build_leaderboards(pokemons_dataframe),
+        }
+        if self.store is not None:
+            removed_ids = [
+                pokemon_id for pokemon_id in changed_ids if pokemon_id not in records
+            ]
+            self.store.write_dataframe(
+                pokemons_dataframe[pokemons_dataframe["ID"].isin(changed_ids)]
+            )
+            for pokemon_id in removed_ids:
+                self.store.execute("DELETE FROM pokemon WHERE id = ?", (pokemon_id,))
+        with self._lock:
+            self.records = records
+            self.type_aggregates = type_aggregates
+            self.transformed = transformed
+        self.logger.info(
+            f"Recomputed {len(affected_types) if changed_ids else 'all'} types"
+        )
+        DataReporter(self.logger).generate_all_reports(
+            transformed["by_type"],
+            transformed["top_5"],
+            transformed["type_statistics"],
+            transformed["leaderboards"],
+            transformed["pokemon"],
+        )
+
+    def _refresh_safely(self):
+        """
+        Runs a refresh, keeping the previous data served if it fails.
+        """
+        try:
+            with stage_errors("refresh"):
+                self.refresh()
+        except PipelineError as e:
+            self.logger.error(str(e), exc_info=e.__cause__)
+            self.metrics.record_error("refresh", e.__cause__)
+            with self._lock:
+                self.status["failed_refreshes"] += 1
+                self.status["last_error"] = str(e)
+
+    def handle_request(self, path: str) -> tuple[int, dict | list]:
+        """
+        Answers a request to the HTTP endpoint.
+
+        Args:
+            path (str): The request path: ``/health``, ``/metrics``,
+                ``/types``, ``/statistics`` or ``/top``.
+
+        Returns:
+            tuple[int, dict | list]: The HTTP status code and the JSON body.
+        """
+        path = path.rstrip("/") or "/"
+        with self._lock:
+            transformed = self.transformed
+            status = dict(self.status)
+        if path == "/health":
+            status["status"] = "ok" if transformed is not None else "starting"
+            status["pokemon"] = len(self.records)
+            return (200 if transformed is not None else 503), status
+        if path == "/metrics":
+            return 200, {"daemon": status, **self.metrics.to_dict()}
+        if path not in DATAFRAME_ENDPOINTS:
+            return 404, {"error": f"Unknown endpoint {path}"}
+        if transformed is None:
+            return 503, {"error": "Data not loaded yet"}
+        dataframe = transformed[DATAFRAME_ENDPOINTS[path]]
+        return 200, json.loads(dataframe.to_json(orient="records"))
+
+    def start(self):
+        """
+        Starts the HTTP endpoint on ``DAEMON_HOST``:``DAEMON_PORT`` in a
+        background thread.
+        """
+        self.server = ThreadingHTTPServer(
+            (self.configs.DAEMON_HOST, self.configs.DAEMON_PORT), _DaemonRequestHandler
+        )
+        self.server.refresh_daemon = self
+        threading.Thread(
+            target=self.server.serve_forever, name="daemon-http", daemon=True
+        ).start()
+        host, port = self.address
+        self.logger.info(f"Serving Pokemon data on http://{host}:{port}")
+
+    def stop(self):
+        """
+        Asks the refresh loop to stop after the current refresh.
+        """
+        self._stopped.set()
+
+    def close(self):
+        """
+        Stops the HTTP endpoint and closes the extractor and the store.
+        """
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        self.extractor.close()
+        if self.store is not None:
+            self.store.close()
+
+    def serve_forever(self):
+        """
+        Loads the data, starts the HTTP endpoint and refreshes the data every
+        ``REFRESH_INTERVAL_SECONDS`` until stopped by ``stop``, SIGTERM or
+        Ctrl+C.
+        """
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, lambda signum, frame: self.stop())
+        self.start()
+        try:
+            self._refresh_safely()
+            while not self._stopped.wait(self.configs.REFRESH_INTERVAL_SECONDS):
+                self._refresh_safely()
+        finally:
+            self.close()
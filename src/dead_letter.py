@@ -0,0 +1,167 @@
+import json
+import logging
+import os
+import threading
+import time
+
+import pandas as pd
+
+
+class DeadLetterQueue:
+    """
+    Persistent record of the Pokémon whose details could not be fetched.
+
+    Each failed Pokémon is kept by ID with its list entry, the class and
+    message of the last error and the number of failed attempts, so the
+    repair stage can re-fetch only those Pokémon instead of re-running the
+    whole extraction. The file is rewritten atomically on every change and
+    is removed once the queue is empty.
+    """
+
+    def __init__(self, path: str, logger: logging.Logger):
+        """
+        Args:
+            path (str): The path of the dead-letter file.
+            logger (logging.Logger): The logger.
+        """
+        self.path = path
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._entries = self._load_entries()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load_entries(self) -> dict[int, dict]:
+        """
+        Loads the persisted entries, starting empty if the file is missing.
+
+        Returns:
+            dict[int, dict]: The entries indexed by Pokémon ID.
+        """
+        if not os.path.exists(self.path):
+            return {}
+        with open(self.path, encoding="utf-8") as dead_letter_file:
+            entries = json.load(dead_letter_file)
+        return {entry["id"]: entry for entry in entries}
+
+    def entries(self) -> list[dict]:
+        """
+        Returns a copy of the entries, ordered by Pokémon ID.
+
+        Returns:
+            list[dict]: The entries, with the ``id``, ``name``, ``url``,
+                ``error``, ``message``, ``attempts`` and ``last_attempt_at``
+                of each failed Pokémon.
+        """
+        with self._lock:
+            return [dict(self._entries[key]) for key in sorted(self._entries)]
+
+    def record(self, pokemon_id: int, pokemon: dict, error: BaseException):
+        """
+        Records a failed attempt to fetch a Pokémon.
+
+        Args:
+            pokemon_id (int): The ID of the Pokémon.
+            pokemon (dict): The list entry of the Pokémon, with its name and URL.
+            error (BaseException): The error of the attempt.
+        """
+        with self._lock:
+            previous = self._entries.get(pokemon_id, {})
+            self._entries[pokemon_id] = {
+                "id": pokemon_id,
+                "name": pokemon["name"],
+                "url": pokemon["url"],
+                "error": type(error).__name__,
+                "message": str(error),
+                "attempts": previous.get("attempts", 0) + 1,
+                "last_attempt_at": time.time(),
+            }
+            self._write()
+
+    def update(self, entries: list[dict]):
+        """
+        Adds the entries of another dead-letter file, such as the one of a
+        shard, keeping the highest attempt count of each Pokémon.
+
+        Args:
+            entries (list[dict]): The entries to add.
+        """
+        if not entries:
+            return
+        with self._lock:
+            for entry in entries:
+                previous = self._entries.get(entry["id"])
+                if previous is None or entry["attempts"] >= previous["attempts"]:
+                    self._entries[entry["id"]] = dict(entry)
+            self._write()
+
+    def resolve(self, pokemon_ids: list[int]) -> int:
+        """
+        Removes the Pokémon that were fetched since they failed.
+
+        Args:
+            pokemon_ids (list[int]): The IDs of the fetched Pokémon.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            resolved = [
+                pokemon_id for pokemon_id in pokemon_ids if pokemon_id in self._entries
+            ]
+            if not resolved:
+                return 0
+            for pokemon_id in resolved:
+                del self._entries[pokemon_id]
+            self._write()
+        return len(resolved)
+
+    def _write(self):
+        """
+        Atomically writes the entries, removing the file when there are none.
+        Must be called with the lock held.
+        """
+        if not self._entries:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as dead_letter_file:
+            json.dump(
+                [self._entries[key] for key in sorted(self._entries)],
+                dead_letter_file,
+                indent=2,
+            )
+        os.replace(temporary_path, self.path)
+
+
+def patch_records(pokemons_dataframe: pd.DataFrame, records: pd.DataFrame) -> pd.DataFrame:
+    """
+    Patches re-fetched Pokémon records into an existing DataFrame of records.
+    Re-fetched records replace the rows with the same ID, new ones are
+    inserted, and rows stay ordered by ID.
+
+    Args:
+        pokemons_dataframe (pd.DataFrame): The existing Pokémon records.
+        records (pd.DataFrame): The re-fetched Pokémon records.
+
+    Returns:
+        pd.DataFrame: The patched Pokémon records.
+    """
+    if records.empty:
+        return pokemons_dataframe
+    patched = (
+        pd.concat([records, pokemons_dataframe], ignore_index=True)
+        .sort_values("ID", kind="stable")
+        .drop_duplicates(subset="ID", keep="first")
+        .reset_index(drop=True)
+    )
+    # Concatenating categoricals with different categories falls back to object.
+    for column, dtype in pokemons_dataframe.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype) and column in patched:
+            patched[column] = patched[column].astype("category")
+    return patched
@@ -0,0 +1,208 @@
+import json
+import re
+import threading
+from collections.abc import Callable
+from typing import NamedTuple
+
+try:
+    import simdjson
+except ImportError:  # pragma: no cover - optional dependency
+    simdjson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class FieldSpec(NamedTuple):
+    """
+    A field of the Pokémon record and where to find it in the detail payload.
+
+    The path is a dotted list of keys. ``key[*]`` maps the rest of the path
+    over every item of a list, and ``key[sub.path=value]`` picks the first
+    item of a list whose ``sub.path`` equals ``value``.
+    """
+
+    column: str
+    path: str
+    kind: str
+    transform: Callable | None = None
+
+
+POKEMON_SCHEMA = (
+    FieldSpec("ID", "id", "int"),
+    FieldSpec("Name", "name", "str", str.title),
+    FieldSpec("Base Experience", "base_experience", "int"),
+    FieldSpec("Types", "types[*].type.name", "list"),
+    FieldSpec("HP", "stats[stat.name=hp].base_stat", "int"),
+    FieldSpec("Attack", "stats[stat.name=attack].base_stat", "int"),
+    FieldSpec("Defense", "stats[stat.name=defense].base_stat", "int"),
+    FieldSpec("Special Attack", "stats[stat.name=special-attack].base_stat", "int"),
+    FieldSpec("Special Defense", "stats[stat.name=special-defense].base_stat", "int"),
+    FieldSpec("Speed", "stats[stat.name=speed].base_stat", "int"),
+    FieldSpec("Abilities", "abilities[*].ability.name", "list"),
+    FieldSpec("Height", "height", "int"),
+    FieldSpec("Weight", "weight", "int"),
+)
+
+_PATH_STEP = re.compile(r"([A-Za-z_][\w-]*)(?:\[([^\]]*)\])?(?:\.|$)")
+
+
+def compile_path(path: str) -> tuple[tuple, ...]:
+    """
+    Compiles a field path into the steps walked by ``resolve_path``.
+
+    Args:
+        path (str): The field path, such as ``stats[stat.name=hp].base_stat``.
+
+    Returns:
+        tuple[tuple, ...]: The ``("key", name)``, ``("each",)`` and
+            ``("match", steps, value)`` steps of the path.
+
+    Raises:
+        ValueError: If the path is malformed.
+    """
+    steps = []
+    position = 0
+    while position < len(path):
+        step = _PATH_STEP.match(path, position)
+        if step is None:
+            raise ValueError(f"Invalid field path {path!r}")
+        key, selector = step.groups()
+        steps.append(("key", key))
+        if selector == "*":
+            steps.append(("each",))
+        elif selector is not None:
+            match_path, separator, value = selector.partition("=")
+            if not separator:
+                raise ValueError(f"Invalid selector [{selector}] in path {path!r}")
+            steps.append(("match", compile_path(match_path), value))
+        position = step.end()
+    return tuple(steps)
+
+
+def resolve_path(node, steps: tuple[tuple, ...]):
+    """
+    Walks the compiled steps of a path through a decoded document. Only the
+    visited nodes are touched, so lazy documents are never fully materialized.
+
+    Args:
+        node: The decoded document, or a lazy simdjson document.
+        steps (tuple[tuple, ...]): The compiled path.
+
+    Returns:
+        The value at the path, a list of values for ``[*]`` paths, or None if
+        the path is missing.
+    """
+    for position, step in enumerate(steps):
+        if node is None:
+            return None
+        if step[0] == "key":
+            node = node.get(step[1])
+        elif step[0] == "each":
+            rest = steps[position + 1 :]
+            return [resolve_path(item, rest) for item in node]
+        else:
+            _, match_steps, value = step
+            node = next(
+                (item for item in node if resolve_path(item, match_steps) == value),
+                None,
+            )
+    return node
+
+
+def loads(body: bytes):
+    """
+    Fully decodes a JSON document with the fastest available parser.
+
+    Args:
+        body (bytes): The JSON document.
+
+    Returns:
+        The decoded document.
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+class ProjectedDecoder:
+    """
+    Decodes Pokémon detail payloads into records holding only the schema's
+    fields.
+
+    With ``pysimdjson`` installed, payloads are parsed into lazy documents
+    and only the schema paths are converted to Python objects, skipping the
+    ``moves`` and ``sprites`` that make up most of each payload. Otherwise
+    the payload is decoded by ``orjson`` (or the standard library) and then
+    projected.
+    """
+
+    def __init__(self, schema: tuple[FieldSpec, ...] = POKEMON_SCHEMA):
+        """
+        Args:
+            schema (tuple[FieldSpec, ...]): The fields of the record.
+        """
+        self.schema = schema
+        self._fields = [
+            (field.column, compile_path(field.path), field.transform)
+            for field in schema
+        ]
+        self._local = threading.local()
+        if simdjson is not None:
+            self.backend = "simdjson"
+        elif orjson is not None:
+            self.backend = "orjson"
+        else:
+            self.backend = "json"
+
+    def project(self, document) -> dict:
+        """
+        Builds a record from a decoded payload.
+
+        Args:
+            document: The decoded payload, or a lazy simdjson document.
+
+        Returns:
+            dict: The value of each schema field, None where it is missing.
+        """
+        record = {}
+        for column, steps, transform in self._fields:
+            value = resolve_path(document, steps)
+            if transform is not None and value is not None:
+                value = transform(value)
+            record[column] = value
+        return record
+
+    def decode(self, body: bytes) -> dict:
+        """
+        Decodes a detail payload straight into a record.
+
+        Args:
+            body (bytes): The JSON payload.
+
+        Returns:
+            dict: The value of each schema field, None where it is missing.
+        """
+        if self.backend != "simdjson":
+            return self.project(loads(body))
+        # A simdjson parser is not thread-safe and reuses its buffers, so each
+        # thread keeps its own and the projection copies the values out.
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = simdjson.Parser()
+        return self.project(parser.parse(body))
+
+
+def schema_columns(schema: tuple[FieldSpec, ...] = POKEMON_SCHEMA) -> dict[str, str]:
+    """
+    Returns the column kinds of a schema, as used by ``PokemonColumnBuilder``.
+
+    Args:
+        schema (tuple[FieldSpec, ...]): The fields of the record.
+
+    Returns:
+        dict[str, str]: The kind of each column, by column name.
+    """
+    return {field.column: field.kind for field in schema}
@@ -1,15 +1,47 @@
 import logging
+import random
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
-import requests
 
 from config import Settings
+from .checkpoint import CheckpointStore
+from .columnar import PokemonColumnBuilder
+from .dead_letter import DeadLetterQueue
+from .decoding import ProjectedDecoder, loads
+from .metrics import MetricsRecorder
+from .sharding import ShardSpec
+from .sources import build_source
 
 
 class PokemonExtractor:
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, metrics: MetricsRecorder | None = None):
         self.configs = Settings()
         self.logger = logger
+        self.metrics = metrics
+        self.source = build_source(self.configs, logger, metrics)
+        self.decoder = ProjectedDecoder()
+        self.dead_letters: DeadLetterQueue | None = None
+
+    def close(self):
+        """
+        Closes the source of PokeAPI documents.
+        """
+        self.source.close()
+
+    def _get_json(self, url: str) -> dict:
+        """
+        Reads and decodes a JSON document from the configured source.
+
+        Args:
+            url (str): The API URL of the document.
+
+        Returns:
+            dict: The decoded JSON document.
+        """
+        return loads(self.source.get_bytes(url))
 
     def fetch_pokemon_data(self, limit: int = 100, offset: int = 0) -> list[dict]:
         """
@@ -23,9 +55,64 @@ class PokemonExtractor:
             list[dict]: A list of Pokémon and their detailed data.
         """
         url = f"{self.configs.BASE_URL}/pokemon?limit={limit}&offset={offset}"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json().get("results", [])
+        return self._get_json(url).get("results", [])
+
+    def iter_pokemon_data(
+        self, page_size: int | None = None, max_count: int | None = None
+    ) -> Iterator[dict]:
+        """
+        Lazily iterates over the Pokémon list, following the API's ``next``
+        links page by page.
+
+        Args:
+            page_size (int | None): The number of entries requested per page.
+                Defaults to ``PAGE_SIZE``.
+            max_count (int | None): The maximum number of entries to yield.
+                None fetches the whole list.
+
+        Yields:
+            dict: The list entry of each Pokémon, with its name and URL.
+        """
+        page_size = page_size or self.configs.PAGE_SIZE
+        if max_count is not None:
+            page_size = max(1, min(page_size, max_count))
+        url = f"{self.configs.BASE_URL}/pokemon?limit={page_size}&offset=0"
+        yielded = 0
+        while url:
+            self.logger.info(f"Fetching Pokemon list page {url}")
+            page = self._get_json(url)
+            for pokemon in page.get("results", []):
+                if max_count is not None and yielded >= max_count:
+                    return
+                yield pokemon
+                yielded += 1
+            url = page.get("next")
+
+    def iter_pokemon_records(
+        self, page_size: int | None = None, max_count: int | None = None
+    ) -> Iterator[dict]:
+        """
+        Lazily iterates over fully built Pokémon records. The details of each
+        list page are fetched concurrently before its records are yielded.
+
+        Args:
+            page_size (int | None): The number of entries requested per page.
+                Defaults to ``PAGE_SIZE``.
+            max_count (int | None): The maximum number of Pokémon to fetch.
+                None fetches the whole list.
+
+        Yields:
+            dict: The dictionary of each Pokémon's data, ordered by ID within a page.
+        """
+        page_size = page_size or self.configs.PAGE_SIZE
+        page = []
+        for pokemon in self.iter_pokemon_data(page_size, max_count):
+            page.append(pokemon)
+            if len(page) == page_size:
+                yield from self._fetch_pokemon_records(page)
+                page = []
+        if page:
+            yield from self._fetch_pokemon_records(page)
 
     def _extract_pokemon_id(self, pokemon_url: str) -> int:
         """
@@ -39,74 +126,239 @@ class PokemonExtractor:
         """
         return int(pokemon_url.split("/")[-2])
 
-    def _fetch_pokemon_details(self, pokemon_id: int) -> dict:
+    def filter_shard(
+        self, pokemons_data: Iterable[dict], shard: ShardSpec
+    ) -> Iterator[dict]:
+        """
+        Keeps the list entries of the Pokémon that belong to a shard, so that
+        several workers can extract disjoint slices of the same list.
+
+        Args:
+            pokemons_data (Iterable[dict]): The list entries of the Pokémon.
+            shard (ShardSpec): The shard extracted by this worker.
+
+        Yields:
+            dict: The list entries of the shard's Pokémon.
         """
-        Fetches the details of a Pokémon from the PokeAPI.
+        for pokemon in pokemons_data:
+            if shard.contains(self._extract_pokemon_id(pokemon["url"])):
+                yield pokemon
+
+    def _fetch_pokemon_projection(self, pokemon_id: int) -> dict:
+        """
+        Fetches the details of a Pokémon and decodes only the fields of the
+        decoder's schema, without building the full payload.
 
         Args:
             pokemon_id (int): The ID of the Pokémon.
 
         Returns:
-            dict: The details of the Pokémon.
+            dict: The dictionary of Pokémon data.
         """
         detail_url = f"{self.configs.BASE_URL}/pokemon/{pokemon_id}"
         self.logger.info(f"Fetching details for Pokemon {pokemon_id}")
-        response = requests.get(detail_url)
-        response.raise_for_status()
-        pokemon_data = response.json()
-        return pokemon_data
+        return self.decoder.decode(self.source.get_bytes(detail_url))
 
     def _build_pokemon_dict(self, pokemon_data: dict) -> dict:
         """
-        Builds a dictionary of Pokémon data.
+        Builds a dictionary of Pokémon data from its decoded details.
 
         Args:
             pokemon_data (dict): The data of the Pokémon.
 
         Returns:
-            dict: The dictionary of Pokémon data.
+            dict: The dictionary of Pokémon data, with the fields of the
+                decoder's schema.
+        """
+        return self.decoder.project(pokemon_data)
+
+    def _fetch_pokemon_record(self, pokemon: dict) -> dict | None:
+        """
+        Fetches and builds the record of a single Pokémon from a list entry.
+
+        Args:
+            pokemon (dict): The list entry of the Pokémon, with its name and URL.
+
+        Failures are recorded in the attached dead-letter queue, if any, and
+        Pokémon fetched after failing are removed from it.
+
+        Returns:
+            dict | None: The dictionary of Pokémon data, or None if it failed.
+        """
+        pokemon_id = None
+        try:
+            pokemon_id = self._extract_pokemon_id(pokemon["url"])
+            record = self._fetch_pokemon_projection(pokemon_id)
+        except Exception as e:
+            self.logger.error(
+                f"Error fetching details for Pokemon {pokemon['name']}: {e}"
+            )
+            if self.metrics is not None:
+                self.metrics.record_error("pokemon", e)
+            if self.dead_letters is not None and pokemon_id is not None:
+                self.dead_letters.record(pokemon_id, pokemon, e)
+            return None
+        if self.dead_letters is not None:
+            self.dead_letters.resolve([pokemon_id])
+        return record
+
+    def _repair_delay(self, attempt: int) -> float:
+        """
+        Returns the exponential backoff before a repair attempt, with jitter.
+
+        Args:
+            attempt (int): The zero-based number of the attempt.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if attempt == 0:
+            return 0.0
+        delay = min(
+            self.configs.BACKOFF_MAX, self.configs.BACKOFF_FACTOR * 2 ** (attempt - 1)
+        )
+        return delay + random.uniform(0, self.configs.BACKOFF_JITTER)
+
+    def _repair_pokemon_record(self, entry: dict) -> dict | None:
+        """
+        Re-fetches a dead-lettered Pokémon, retrying up to
+        ``REPAIR_MAX_ATTEMPTS`` times with exponential backoff.
+
+        Args:
+            entry (dict): The dead-letter entry of the Pokémon.
+
+        Returns:
+            dict | None: The dictionary of Pokémon data, or None if every
+                attempt failed.
+        """
+        pokemon = {"name": entry["name"], "url": entry["url"]}
+        for attempt in range(max(1, self.configs.REPAIR_MAX_ATTEMPTS)):
+            time.sleep(self._repair_delay(attempt))
+            record = self._fetch_pokemon_record(pokemon)
+            if record is not None:
+                return record
+        return None
+
+    def repair_dead_letters(self, dead_letters: DeadLetterQueue) -> list[dict]:
+        """
+        Re-fetches only the Pokémon in a dead-letter queue. Repaired Pokémon
+        are removed from the queue; the attempts of the others are counted in it.
+        The queue replaces the extractor's own only for the duration of the call.
+
+        Args:
+            dead_letters (DeadLetterQueue): The Pokémon that failed to be fetched.
+
+        Returns:
+            list[dict]: The repaired Pokémon records, ordered by ID.
         """
-        pokemon_dict = {
-            "ID": pokemon_data["id"],
-            "Name": pokemon_data["name"].title(),  # apply title case
-            "Base Experience": pokemon_data["base_experience"],
-            "Types": [
-                pokemon_type["type"]["name"] for pokemon_type in pokemon_data["types"]
-            ],
-            "HP": None,
-            "Attack": None,
-            "Defense": None,
-        }
-        for pokemon_stat in pokemon_data["stats"]:
-            if pokemon_stat["stat"]["name"] == "hp":
-                pokemon_dict["HP"] = pokemon_stat["base_stat"]
-            elif pokemon_stat["stat"]["name"] == "attack":
-                pokemon_dict["Attack"] = pokemon_stat["base_stat"]
-            elif pokemon_stat["stat"]["name"] == "defense":
-                pokemon_dict["Defense"] = pokemon_stat["base_stat"]
+        previous_dead_letters = self.dead_letters
+        self.dead_letters = dead_letters
+        try:
+            entries = dead_letters.entries()
+            max_workers = max(1, min(self.configs.MAX_WORKERS, len(entries)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(self._repair_pokemon_record, entries)
+                repaired = [record for record in results if record is not None]
+        finally:
+            self.dead_letters = previous_dead_letters
+        repaired.sort(key=lambda record: record["ID"])
+        self.logger.info(
+            f"Repaired {len(repaired)} of {len(entries)} dead-lettered Pokemon"
+        )
+        return repaired
 
-        return pokemon_dict
+    def _iter_fetched_records(self, pokemons_data: list[dict]) -> Iterator[dict]:
+        """
+        Fetches the records of the given Pokémon, concurrently when
+        ``MAX_WORKERS`` is greater than one, and yields them in list order as
+        they complete.
+
+        Args:
+            pokemons_data (list[dict]): The list entries of the Pokémon.
+
+        Yields:
+            dict: The Pokémon records that were fetched.
+        """
+        max_workers = max(1, min(self.configs.MAX_WORKERS, len(pokemons_data)))
+        if max_workers == 1:
+            results = map(self._fetch_pokemon_record, pokemons_data)
+            yield from (record for record in results if record is not None)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self._fetch_pokemon_record, pokemons_data)
+            yield from (record for record in results if record is not None)
+
+    def _fetch_pokemon_records(self, pokemons_data: list[dict]) -> list[dict]:
+        """
+        Fetches the records of the given Pokémon.
+
+        Args:
+            pokemons_data (list[dict]): The list entries of the Pokémon.
+
+        Returns:
+            list[dict]: The Pokémon records that were fetched, ordered by ID.
+        """
+        pokemon_list = list(self._iter_fetched_records(pokemons_data))
+        pokemon_list.sort(key=lambda record: record["ID"])
+        return pokemon_list
+
+    def build_pokemons_dataframe(self, pokemons_data: Iterable[dict]) -> pd.DataFrame:
+        """
+        Builds a DataFrame of Pokémon data. Records are appended straight into
+        typed column buffers, so the DataFrame gets compact dtypes.
+
+        Args:
+            pokemons_data (Iterable[dict]): The list entries of the Pokémon, such
+                as the output of ``fetch_pokemon_data`` or ``iter_pokemon_data``.
 
-    def build_pokemons_dataframe(self, pokemons_data: list[dict]) -> pd.DataFrame:
+        Returns:
+            pd.DataFrame: The DataFrame of Pokémon data, ordered by ID.
         """
-        Builds a DataFrame of Pokémon data.
+        builder = PokemonColumnBuilder()
+        builder.extend(self._iter_fetched_records(list(pokemons_data)))
+        return builder.to_dataframe()
+
+    def build_incremental_dataframe(
+        self, pokemons_data: Iterable[dict], checkpoint: CheckpointStore
+    ) -> pd.DataFrame:
+        """
+        Builds a DataFrame of Pokémon data, fetching only the Pokémon missing
+        from the checkpoint. New records are persisted page by page, so an
+        interrupted run resumes where it stopped.
 
         Args:
-            pokemons_data (list[dict]): The data of the Pokémon.
+            pokemons_data (Iterable[dict]): The list entries of the Pokémon.
+            checkpoint (CheckpointStore): The checkpoint of extracted records.
 
         Returns:
-            pd.DataFrame: The DataFrame of Pokémon data.
+            pd.DataFrame: The DataFrame of the listed Pokémon, ordered by ID.
         """
-        pokemon_list = []
+        extracted_ids = checkpoint.extracted_ids()
+        self.logger.info(
+            f"Resuming from checkpoint with {len(extracted_ids)} Pokemon "
+            f"(high-water mark {checkpoint.high_water_mark})"
+        )
+        listed_ids = []
+        missing_page = []
         for pokemon in pokemons_data:
-            try:
-                pokemon_id = self._extract_pokemon_id(pokemon["url"])
-                pokemon_details = self._fetch_pokemon_details(pokemon_id)
-                pokemon_dict = self._build_pokemon_dict(pokemon_details)
-                pokemon_list.append(pokemon_dict)
-            except Exception as e:
-                self.logger.error(
-                    f"Error fetching details for Pokemon {pokemon['name']}: {e}"
-                )
-        pokemon_dataframe = pd.DataFrame(pokemon_list)
-        return pokemon_dataframe
+            pokemon_id = self._extract_pokemon_id(pokemon["url"])
+            listed_ids.append(pokemon_id)
+            if pokemon_id in extracted_ids:
+                continue
+            missing_page.append(pokemon)
+            if len(missing_page) == self.configs.PAGE_SIZE:
+                checkpoint.append(self._fetch_pokemon_records(missing_page))
+                missing_page = []
+        if missing_page:
+            checkpoint.append(self._fetch_pokemon_records(missing_page))
+
+        builder = PokemonColumnBuilder()
+        builder.extend(
+            checkpoint.records[pokemon_id]
+            for pokemon_id in sorted(set(listed_ids))
+            if pokemon_id in checkpoint.records
+        )
+        self.logger.info(
+            f"Fetched {len(checkpoint.records) - len(extracted_ids)} new Pokemon"
+        )
+        return builder.to_dataframe()
@@ -0,0 +1,119 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Settings
+
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread-safe token bucket that throttles outgoing requests on the client side.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Args:
+            rate (float): The number of tokens added per second. Zero or less
+                disables throttling.
+            burst (int): The maximum number of tokens the bucket can hold.
+        """
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a token is available and consumes it.
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated_at
+                self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+
+class ThrottledRetry(Retry):
+    """
+    Retry policy that takes a token from the rate limiter before every retry.
+
+    urllib3 retries inside the adapter, below the session, so without this
+    the retries of throttled and failed requests would bypass the client-side
+    rate limit, exactly when the upstream is already overloaded.
+    """
+
+    def __init__(
+        self, *args, rate_limiter: TokenBucketRateLimiter | None = None, **kwargs
+    ):
+        """
+        Args:
+            rate_limiter (TokenBucketRateLimiter | None): The limiter shared
+                with the first attempts. None retries without throttling.
+        """
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+
+    def new(self, **kwargs) -> "ThrottledRetry":
+        retry = super().new(**kwargs)
+        retry.rate_limiter = self.rate_limiter
+        return retry
+
+    def sleep(self, response=None):
+        """
+        Waits for the backoff or ``Retry-After`` delay, then for a token.
+        """
+        super().sleep(response)
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+
+def build_session(
+    configs: Settings, rate_limiter: TokenBucketRateLimiter | None = None
+) -> requests.Session:
+    """
+    Builds a pooled HTTP session that retries throttled and failed requests
+    with exponential backoff, jitter and ``Retry-After`` handling.
+
+    Args:
+        configs (Settings): The application settings.
+        rate_limiter (TokenBucketRateLimiter | None): The limiter every retry
+            takes a token from. The caller still throttles the first attempt.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    retry = ThrottledRetry(
+        total=configs.MAX_RETRIES,
+        backoff_factor=configs.BACKOFF_FACTOR,
+        backoff_max=configs.BACKOFF_MAX,
+        backoff_jitter=configs.BACKOFF_JITTER,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        rate_limiter=rate_limiter,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=max(1, configs.MAX_WORKERS),
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
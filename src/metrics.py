@@ -0,0 +1,185 @@
+import bisect
+import cProfile
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+class MetricsRecorder:
+    """
+    Collects per-stage timings and hot-path counters of a pipeline run and
+    writes them as a structured JSON report.
+    """
+
+    def __init__(
+        self, profile_stages: list[str] | None = None, trace_memory: bool = False
+    ):
+        """
+        Args:
+            profile_stages (list[str] | None): The stages to run under cProfile.
+            trace_memory (bool): Whether to trace the peak Python memory of
+                every stage with tracemalloc.
+        """
+        self.profile_stages = set(profile_stages or [])
+        self.trace_memory = trace_memory
+        self.started_at = time.time()
+        self.stages = {}
+        self.requests = 0
+        self.bytes_downloaded = 0
+        self.retries = 0
+        self.status_codes = {}
+        self.latency_histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_total_ms = 0.0
+        self.errors = {}
+        self.cache = None
+        self._profiles = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measures the wall and CPU time of a pipeline stage, optionally under
+        cProfile and tracemalloc.
+
+        Args:
+            name (str): The stage name.
+        """
+        profiler = cProfile.Profile() if name in self.profile_stages else None
+        if self.trace_memory:
+            tracemalloc.start()
+        start_wall = time.perf_counter()
+        start_cpu = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+                self._profiles[name] = profiler
+            stage_metrics = {
+                "wall_seconds": round(time.perf_counter() - start_wall, 4),
+                "cpu_seconds": round(time.process_time() - start_cpu, 4),
+            }
+            if self.trace_memory:
+                stage_metrics["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            self.stages[name] = stage_metrics
+
+    def record_request(
+        self, latency_seconds: float, size: int, status_code: int, retries: int = 0
+    ):
+        """
+        Records a completed HTTP request.
+
+        Args:
+            latency_seconds (float): The request latency, including retries.
+            size (int): The number of body bytes downloaded.
+            status_code (int): The final status code.
+            retries (int): The number of retries the request needed.
+        """
+        latency_ms = latency_seconds * 1000
+        with self._lock:
+            self.requests += 1
+            self.bytes_downloaded += size
+            self.retries += retries
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+            self.latency_histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+            self.latency_total_ms += latency_ms
+
+    def record_error(self, scope: str, error: BaseException):
+        """
+        Counts an error by scope and exception type.
+
+        Args:
+            scope (str): Where the error happened, e.g. ``request`` or ``pokemon``.
+            error (BaseException): The error.
+        """
+        with self._lock:
+            errors = self.errors.setdefault(scope, {})
+            error_type = type(error).__name__
+            errors[error_type] = errors.get(error_type, 0) + 1
+
+    def set_cache_stats(self, cache_stats: dict):
+        """
+        Records the response cache counters.
+
+        Args:
+            cache_stats (dict): The output of ``ResponseCache.stats``.
+        """
+        self.cache = cache_stats
+
+    def _peak_memory_bytes(self) -> int | None:
+        """
+        Returns the peak resident memory of the process.
+
+        Returns:
+            int | None: The peak RSS in bytes, or None if unavailable.
+        """
+        if resource is None:
+            return None
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    def to_dict(self) -> dict:
+        """
+        Builds the metrics report.
+
+        Returns:
+            dict: The metrics report.
+        """
+        buckets = [f"<={bucket}ms" for bucket in LATENCY_BUCKETS_MS]
+        buckets.append(f">{LATENCY_BUCKETS_MS[-1]}ms")
+        return {
+            "started_at": self.started_at,
+            "finished_at": time.time(),
+            "stages": self.stages,
+            "http": {
+                "requests": self.requests,
+                "bytes_downloaded": self.bytes_downloaded,
+                "retries": self.retries,
+                "status_codes": {
+                    str(status_code): count
+                    for status_code, count in sorted(self.status_codes.items())
+                },
+                "mean_latency_ms": round(self.latency_total_ms / self.requests, 2)
+                if self.requests
+                else None,
+                "latency_histogram": dict(zip(buckets, self.latency_histogram)),
+            },
+            "errors": self.errors,
+            "cache": self.cache,
+            "peak_memory_bytes": self._peak_memory_bytes(),
+        }
+
+    def write(self, output_dir: str, file_name: str) -> str:
+        """
+        Atomically writes the metrics report, and the cProfile stats of the
+        profiled stages as ``profile_{stage}.prof``, to a directory.
+
+        Args:
+            output_dir (str): The output directory.
+            file_name (str): The file name of the metrics report.
+
+        Returns:
+            str: The path of the metrics report.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        for stage_name, profiler in self._profiles.items():
+            profiler.dump_stats(os.path.join(output_dir, f"profile_{stage_name}.prof"))
+        metrics_path = os.path.join(output_dir, file_name)
+        temporary_path = os.path.join(output_dir, f".{file_name}.tmp")
+        with open(temporary_path, "w", encoding="utf-8") as metrics_file:
+            json.dump(self.to_dict(), metrics_file, indent=2)
+        os.replace(temporary_path, metrics_path)
+        return metrics_path
@@ -0,0 +1,277 @@
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+
+import pandas as pd
+
+from config import Settings
+from .columnar import PokemonColumnBuilder
+from .transformer import DataTransformer
+
+_END_OF_STREAM = object()
+TOP_POKEMON = 5
+TOP_COLUMN = "Base Experience"
+
+
+class PipelineError(Exception):
+    """
+    A pipeline stage failed. The original exception is the ``__cause__``.
+    """
+
+    def __init__(self, stage: str, error: BaseException):
+        """
+        Args:
+            stage (str): The name of the failed stage.
+            error (BaseException): The exception raised by the stage.
+        """
+        super().__init__(f"Stage '{stage}' failed: {error!r}")
+        self.stage = stage
+
+
+class PipelineCancelled(Exception):
+    """
+    Raised inside the stages, and from ``run``, when the pipeline was cancelled.
+    """
+
+
+@contextmanager
+def stage_errors(stage: str):
+    """
+    Wraps the exceptions raised by a stage in a ``PipelineError`` naming it.
+
+    Args:
+        stage (str): The name of the stage.
+
+    Raises:
+        PipelineError: If the stage raised an exception.
+    """
+    try:
+        yield
+    except PipelineError:
+        raise
+    except Exception as e:
+        raise PipelineError(stage, e) from e
+
+
+class StreamingPipeline:
+    """
+    Runs extraction and transformation concurrently. An extraction thread
+    pushes chunks of records into a bounded queue, so it blocks when the
+    transformation falls behind, and a transformation thread folds every
+    chunk into the per-type aggregate state and the running top Pokemon as it
+    arrives. Only the final aggregates are left for the end of the stream.
+
+    The first stage to fail cancels the others, and its exception is raised
+    from ``run`` as a ``PipelineError``.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+        self.configs = Settings()
+        self.cancelled = threading.Event()
+        self._errors = []
+        self._errors_lock = threading.Lock()
+        self.max_queue_depth = 0
+
+    def cancel(self):
+        """
+        Asks every stage to stop at its next queue operation.
+        """
+        self.cancelled.set()
+
+    def _put(self, chunks: queue.Queue, item: object):
+        """
+        Puts an item into a bounded queue, waiting while it is full.
+
+        Args:
+            chunks (queue.Queue): The queue.
+            item (object): The item.
+
+        Raises:
+            PipelineCancelled: If the pipeline is cancelled while waiting.
+        """
+        while True:
+            if self.cancelled.is_set():
+                raise PipelineCancelled()
+            try:
+                chunks.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            self.max_queue_depth = max(self.max_queue_depth, chunks.qsize())
+            return
+
+    def _get(self, chunks: queue.Queue) -> object:
+        """
+        Takes an item from a queue, waiting while it is empty.
+
+        Args:
+            chunks (queue.Queue): The queue.
+
+        Returns:
+            object: The item.
+
+        Raises:
+            PipelineCancelled: If the pipeline is cancelled while waiting.
+        """
+        while True:
+            if self.cancelled.is_set():
+                raise PipelineCancelled()
+            try:
+                return chunks.get(timeout=0.1)
+            except queue.Empty:
+                continue
+
+    def _run_stage(self, stage: str, target: Callable[[], None]):
+        """
+        Runs a stage, recording its failure and cancelling the pipeline.
+
+        Args:
+            stage (str): The name of the stage.
+            target (Callable[[], None]): The body of the stage.
+        """
+        try:
+            target()
+        except PipelineCancelled:
+            pass
+        except BaseException as e:
+            with self._errors_lock:
+                self._errors.append((stage, e))
+            self.cancel()
+
+    def _chunks(self, records: Iterable[dict]) -> Iterator[list[dict]]:
+        """
+        Groups records into chunks of ``PIPELINE_CHUNK_SIZE``.
+
+        Args:
+            records (Iterable[dict]): The Pokemon records.
+
+        Yields:
+            list[dict]: The chunks of records.
+        """
+        chunk = []
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == self.configs.PIPELINE_CHUNK_SIZE:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run(self, records: Iterable[dict]) -> dict:
+        """
+        Streams the records through extraction and transformation.
+
+        Args:
+            records (Iterable[dict]): The Pokemon records, fetched lazily,
+                such as ``PokemonExtractor.iter_pokemon_records()``.
+
+        Returns:
+            dict: The transformed DataFrames, by name, as returned by the
+                barrier ``transform`` stage.
+
+        Raises:
+            PipelineError: If a stage failed.
+            PipelineCancelled: If the pipeline was cancelled by ``cancel``.
+            KeyboardInterrupt: If interrupted; the stages are cancelled first.
+        """
+        transformer = DataTransformer(self.logger)
+        chunks = queue.Queue(maxsize=self.configs.PIPELINE_QUEUE_SIZE)
+        builder = PokemonColumnBuilder()
+        state = transformer.new_aggregate_state()
+        top = [None]
+
+        def extract():
+            try:
+                for chunk in self._chunks(records):
+                    self._put(chunks, chunk)
+                self._put(chunks, _END_OF_STREAM)
+            finally:
+                # Stops a generator of records, and its pending fetches, on
+                # cancellation instead of leaving it to the garbage collector.
+                if hasattr(records, "close"):
+                    records.close()
+
+        def transform():
+            end_of_stream = False
+            while not end_of_stream:
+                chunk = self._get(chunks)
+                if chunk is _END_OF_STREAM:
+                    break
+                # Chunks queued while the previous batch was transformed are
+                # folded together, so a lagging transformation catches up
+                # with fewer grouped passes.
+                while True:
+                    try:
+                        queued = chunks.get_nowait()
+                    except queue.Empty:
+                        break
+                    if queued is _END_OF_STREAM:
+                        end_of_stream = True
+                        break
+                    chunk = chunk + queued
+                builder.extend(chunk)
+                chunk_builder = PokemonColumnBuilder()
+                chunk_builder.extend(chunk)
+                chunk_dataframe = transformer.categorize_experience(
+                    chunk_builder.to_dataframe()
+                )
+                transformer.aggregate_chunk(state, chunk_dataframe)
+                # Only the ranking columns of the running top are kept; its
+                # rows are taken from the full DataFrame at end of stream.
+                candidates = chunk_dataframe[["ID", TOP_COLUMN]].astype("float64")
+                if top[0] is not None:
+                    candidates = pd.concat([top[0], candidates], ignore_index=True)
+                top[0] = transformer._select_top(candidates, TOP_POKEMON, TOP_COLUMN)
+
+        started_at = time.perf_counter()
+        threads = [
+            threading.Thread(
+                target=self._run_stage, args=(stage, target), name=f"pipeline-{stage}"
+            )
+            for stage, target in (("extract", extract), ("transform", transform))
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=0.1)
+        except KeyboardInterrupt:
+            self.logger.warning("Pipeline interrupted, cancelling stages")
+            self.cancel()
+            for thread in threads:
+                thread.join()
+            raise
+        if self._errors:
+            stage, error = self._errors[0]
+            raise PipelineError(stage, error) from error
+        if self.cancelled.is_set():
+            raise PipelineCancelled("Pipeline cancelled")
+
+        top_ids = [] if top[0] is None else top[0]["ID"].tolist()
+        with stage_errors("transform"):
+            pokemons_dataframe = transformer.categorize_experience(
+                builder.to_dataframe()
+            )
+            by_type, type_statistics = transformer.finalize_aggregates(state)
+            top_5 = transformer._select_top(
+                pokemons_dataframe[pokemons_dataframe["ID"].isin(top_ids)],
+                TOP_POKEMON,
+                TOP_COLUMN,
+            )
+            leaderboards = transformer.build_leaderboards(pokemons_dataframe)
+        self.logger.info(
+            f"Pipeline streamed {len(pokemons_dataframe)} Pokemon in "
+            f"{time.perf_counter() - started_at:.2f} s "
+            f"(max queue depth {self.max_queue_depth})"
+        )
+        return {
+            "pokemon": pokemons_dataframe,
+            "by_type": by_type,
+            "type_statistics": type_statistics,
+            "top_5": top_5,
+            "leaderboards": leaderboards,
+        }
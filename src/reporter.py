@@ -1,26 +1,365 @@
+import hashlib
+import importlib.util
+import json
 import logging
 import os
+import tempfile
+from collections.abc import Callable
 
-import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from config import Settings
 
 
+OUTPUT_FORMAT_EXTENSIONS = {
+    "csv": "csv",
+    "parquet": "parquet",
+    "feather": "feather",
+}
+PYARROW_FORMATS = ("parquet", "feather")
+MANIFEST_VERSION = 1
+
+
 class DataReporter:
+    EXPECTED_REPORTS = [
+        "graph_pokemon_by_type.png",
+        "top_5_pokemon",
+        "type_statistics",
+    ]
+
     def __init__(self, logger: logging.Logger):
         self.logger = logger
         self.configs = Settings()
+        if self.configs.OUTPUT_FORMAT not in OUTPUT_FORMAT_EXTENSIONS:
+            raise ValueError(
+                f"Unsupported output format {self.configs.OUTPUT_FORMAT!r}, "
+                f"expected one of {sorted(OUTPUT_FORMAT_EXTENSIONS)}"
+            )
+        if (
+            self.configs.OUTPUT_FORMAT in PYARROW_FORMATS
+            and importlib.util.find_spec("pyarrow") is None
+        ):
+            raise ImportError(
+                f"Output format {self.configs.OUTPUT_FORMAT!r} requires pyarrow, "
+                "install it with 'pip install -r requirements-optional.txt'"
+            )
+        self._written_reports = set()
+        self.manifest = {}
         self.__clean_reports_directory()
 
     def __clean_reports_directory(self):
         """
-        Cleans the reports directory.
+        Prepares the reports directory: removes temporary files left behind by
+        interrupted writes and loads the manifest of the previous run. Reports
+        themselves are kept, so unchanged ones need not be regenerated.
+        """
+        os.makedirs(self.configs.OUTPUT_DIR, exist_ok=True)
+        for report in os.listdir(self.configs.OUTPUT_DIR):
+            if report.startswith(".") and report.endswith(".tmp"):
+                os.remove(os.path.join(self.configs.OUTPUT_DIR, report))
+        self.manifest = self._load_manifest()
+
+    def _manifest_path(self) -> str:
+        """
+        Returns the path of the report manifest.
+
+        Returns:
+            str: The path of the manifest file in the output directory.
+        """
+        return os.path.join(self.configs.OUTPUT_DIR, self.configs.MANIFEST_FILE)
+
+    def _load_manifest(self) -> dict[str, dict]:
+        """
+        Loads the manifest entries of the reports written by previous runs.
+
+        Returns:
+            dict[str, dict]: The manifest entries, by report file name. Empty
+                if there is no manifest or it cannot be read.
+        """
+        try:
+            with open(self._manifest_path()) as manifest_file:
+                manifest = json.load(manifest_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable report manifest: {e}")
+            return {}
+        if manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("reports", {})
+
+    def _save_manifest(self):
+        """
+        Atomically writes the manifest of the current reports.
+        """
+        manifest = {"version": MANIFEST_VERSION, "reports": self.manifest}
+
+        def write(path: str):
+            with open(path, "w") as manifest_file:
+                json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+        self._write_atomically(self.configs.MANIFEST_FILE, write)
+
+    def _fingerprint(self, job_name: str, data: object, file_names: list[str]) -> str:
+        """
+        Computes the fingerprint of a report job's input. It covers the data,
+        the job, its output files and the output settings, so any change to
+        them invalidates the reports.
+
+        Args:
+            job_name (str): The name of the report method.
+            data (object): The input DataFrame, or a dict of DataFrames.
+            file_names (list[str]): The file names of the job's reports.
+
+        Returns:
+            str: The hexadecimal SHA-256 fingerprint.
+        """
+        digest = hashlib.sha256()
+        digest.update(
+            repr(
+                (
+                    job_name,
+                    file_names,
+                    self.configs.OUTPUT_FORMAT,
+                    self.configs.OUTPUT_COMPRESSION,
+                )
+            ).encode()
+        )
+        frames = data if isinstance(data, dict) else {"": data}
+        for name in sorted(frames):
+            dataframe = frames[name]
+            digest.update(name.encode())
+            digest.update(repr(list(dataframe.columns)).encode())
+            digest.update(repr(dataframe.dtypes.astype(str).tolist()).encode())
+            # List columns such as Types are not hashable by pandas.
+            hashable = dataframe.apply(
+                lambda column: column.astype(str) if column.dtype == object else column
+            )
+            row_hashes = pd.util.hash_pandas_object(hashable, index=True)
+            digest.update(row_hashes.values.tobytes())
+        return digest.hexdigest()
+
+    def _file_digest(self, file_name: str) -> str:
+        """
+        Computes the SHA-256 hash of a report file.
+
+        Args:
+            file_name (str): The file name of the report.
+
+        Returns:
+            str: The hexadecimal SHA-256 hash.
+        """
+        digest = hashlib.sha256()
+        with open(os.path.join(self.configs.OUTPUT_DIR, file_name), "rb") as report:
+            for block in iter(lambda: report.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _manifest_entry(self, file_name: str, fingerprint: str) -> dict:
+        """
+        Describes a freshly written report for the manifest.
+
+        Args:
+            file_name (str): The file name of the report.
+            fingerprint (str): The fingerprint of the job's input.
+
+        Returns:
+            dict: The input fingerprint, output hash, size and modification time.
+        """
+        stat = os.stat(os.path.join(self.configs.OUTPUT_DIR, file_name))
+        return {
+            "input": fingerprint,
+            "sha256": self._file_digest(file_name),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+        }
+
+    def _matches_manifest(self, file_name: str) -> bool:
+        """
+        Checks that a report on disk is the one recorded in the manifest. The
+        hash is only recomputed when the size or modification time changed.
+
+        Args:
+            file_name (str): The file name of the report.
+
+        Returns:
+            bool: True if the report exists and matches its manifest entry.
+        """
+        entry = self.manifest.get(file_name)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(os.path.join(self.configs.OUTPUT_DIR, file_name))
+        except FileNotFoundError:
+            return False
+        if stat.st_size != entry["size"]:
+            return False
+        if stat.st_mtime_ns == entry["mtime_ns"]:
+            return True
+        return self._file_digest(file_name) == entry["sha256"]
+
+    def _is_up_to_date(self, file_names: list[str], fingerprint: str) -> bool:
+        """
+        Checks whether a report job can be skipped.
+
+        Args:
+            file_names (list[str]): The file names of the job's reports.
+            fingerprint (str): The fingerprint of the job's input.
+
+        Returns:
+            bool: True if every report was built from the same input and is
+                unchanged on disk.
         """
-        list_reports = os.listdir(self.configs.OUTPUT_DIR)
-        for report in list_reports:
+        return all(
+            self.manifest.get(file_name, {}).get("input") == fingerprint
+            and self._matches_manifest(file_name)
+            for file_name in file_names
+        )
+
+    def _list_reports(self) -> list[str]:
+        """
+        Lists the reports in the output directory. Hidden files, such as the
+        manifest, and subdirectories, such as the run metrics, are not reports.
+
+        Returns:
+            list[str]: The file names of the reports.
+        """
+        return [
+            report
+            for report in os.listdir(self.configs.OUTPUT_DIR)
+            if not report.startswith(".")
+            and os.path.isfile(os.path.join(self.configs.OUTPUT_DIR, report))
+        ]
+
+    def _prune_stale_reports(self, list_expected_reports: list[str]):
+        """
+        Removes the reports and manifest entries that the current run does not
+        produce, such as dropped leaderboards or files of another output format.
+
+        Args:
+            list_expected_reports (list[str]): The file names of the expected reports.
+        """
+        expected = set(list_expected_reports)
+        for report in self._list_reports():
+            if report in expected:
+                continue
+            self.logger.info(f"Removing stale report {report}")
             os.remove(os.path.join(self.configs.OUTPUT_DIR, report))
+        for report in set(self.manifest) - expected:
+            del self.manifest[report]
+
+    def _report_file_name(self, report: str) -> str:
+        """
+        Returns the file name of a report, adding the extension of the
+        configured output format to table reports.
+
+        Args:
+            report (str): The report name, or a file name with an extension.
+
+        Returns:
+            str: The file name of the report.
+        """
+        if os.path.splitext(report)[1]:
+            return report
+        return f"{report}.{OUTPUT_FORMAT_EXTENSIONS[self.configs.OUTPUT_FORMAT]}"
+
+    def _write_atomically(self, file_name: str, write: Callable[[str], None]) -> str:
+        """
+        Writes a report to a temporary file in the output directory and then
+        atomically renames it into place, so readers never see partial files.
+
+        Args:
+            file_name (str): The file name of the report.
+            write (Callable[[str], None]): Writes the report to the given path.
+
+        Returns:
+            str: The path of the report.
+        """
+        os.makedirs(self.configs.OUTPUT_DIR, exist_ok=True)
+        report_path = os.path.join(self.configs.OUTPUT_DIR, file_name)
+        file_descriptor, temporary_path = tempfile.mkstemp(
+            prefix=f".{file_name}.", suffix=".tmp", dir=self.configs.OUTPUT_DIR
+        )
+        os.close(file_descriptor)
+        try:
+            write(temporary_path)
+            os.replace(temporary_path, report_path)
+        except BaseException:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+            raise
+        self._written_reports.add(file_name)
+        return report_path
+
+    def _write_dataframe(self, dataframe: pd.DataFrame, report: str) -> str:
+        """
+        Writes a DataFrame in the configured output format.
+
+        Args:
+            dataframe (pd.DataFrame): The DataFrame to write.
+            report (str): The report name, without extension.
+
+        Returns:
+            str: The path of the report.
+        """
+        output_format = self.configs.OUTPUT_FORMAT
+        compression = self.configs.OUTPUT_COMPRESSION
+
+        def write(path: str):
+            if output_format == "parquet":
+                dataframe.to_parquet(path, index=False, compression=compression)
+            elif output_format == "feather":
+                dataframe.reset_index(drop=True).to_feather(path, compression=compression)
+            else:
+                dataframe.to_csv(path, index=False)
+
+        return self._write_atomically(self._report_file_name(report), write)
+
+    def _new_figure(self, figsize: tuple[float, float]) -> Figure:
+        """
+        Creates a standalone figure drawn by the Agg backend, without touching
+        pyplot's global state.
+
+        Args:
+            figsize (tuple[float, float]): The figure size in inches.
+
+        Returns:
+            Figure: The new figure.
+        """
+        figure = Figure(figsize=figsize, layout="tight")
+        FigureCanvasAgg(figure)
+        return figure
+
+    def _style_axes(self, ax):
+        """
+        Applies a white grid style to the axes.
+
+        Args:
+            ax (matplotlib.axes.Axes): The axes to style.
+        """
+        ax.set_facecolor("white")
+        ax.set_axisbelow(True)
+        ax.grid(True, color="#dddddd")
+        for spine in ax.spines.values():
+            spine.set_visible(False)
+
+    def _save_figure(self, figure: Figure, file_name: str) -> str:
+        """
+        Saves a figure as a PNG report.
+
+        Args:
+            figure (Figure): The figure to save.
+            file_name (str): The file name of the chart.
+
+        Returns:
+            str: The path of the chart.
+        """
+        return self._write_atomically(
+            file_name, lambda path: figure.savefig(path, format="png")
+        )
 
     def generate_type_distribution_chart(self, pokemon_by_type_dataframe: pd.DataFrame):
         """
@@ -30,44 +369,104 @@ class DataReporter:
             pokemon_by_type_dataframe (pd.DataFrame): The Pokemon data.
         """
         self.logger.info("Building graph bar pokemon by type")
-        os.makedirs(self.configs.OUTPUT_DIR, exist_ok=True)
-        chart_path = os.path.join(self.configs.OUTPUT_DIR, "graph_pokemon_by_type.png")
         try:
-            plt.figure(figsize=(12, 8))
-            sns.set_theme(style="whitegrid")
-            ax = sns.barplot(
+            figure = self._new_figure((12, 8))
+            ax = figure.subplots()
+            self._style_axes(ax)
+            sns.barplot(
                 x="Count",
                 y="Type",
                 data=pokemon_by_type_dataframe.sort_values("Count", ascending=False),
                 palette="viridis",
                 hue="Type",
                 legend=False,
+                ax=ax,
             )
 
             ax.set_title("Pokémon Distribution by Type", fontsize=16)
             ax.set_xlabel("Number of Pokémon", fontsize=12)
             ax.set_ylabel("Type", fontsize=12)
 
-            plt.tight_layout()
-            plt.savefig(chart_path)
-            plt.close()
+            chart_path = self._save_figure(figure, "graph_pokemon_by_type.png")
             self.logger.info(f"Graph saved to {chart_path}")
         except Exception as e:
             self.logger.error(f"Failed to generate graph: {str(e)}")
 
+    def generate_category_breakdown_chart(self, pokemon_dataframe: pd.DataFrame):
+        """
+        Generates a stacked bar chart of the experience categories of each type.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The transformed Pokemon data.
+        """
+        self.logger.info("Building graph pokemon by type and category")
+        try:
+            category_by_type = (
+                pokemon_dataframe[["Types", "Category"]]
+                .explode("Types")
+                .groupby(["Types", "Category"], observed=False)
+                .size()
+                .unstack("Category", fill_value=0)
+            )
+            category_by_type = category_by_type.loc[
+                category_by_type.sum(axis=1).sort_values().index
+            ]
+            figure = self._new_figure((12, 8))
+            ax = figure.subplots()
+            self._style_axes(ax)
+            category_by_type.plot.barh(
+                stacked=True, ax=ax, colormap="viridis", width=0.8
+            )
+
+            ax.set_title("Pokémon Experience Category by Type", fontsize=16)
+            ax.set_xlabel("Number of Pokémon", fontsize=12)
+            ax.set_ylabel("Type", fontsize=12)
+
+            chart_path = self._save_figure(figure, "graph_pokemon_by_category.png")
+            self.logger.info(f"Graph saved to {chart_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to generate category graph: {str(e)}")
+
+    def generate_stat_distribution_chart(self, pokemon_dataframe: pd.DataFrame):
+        """
+        Generates histograms of the HP, Attack and Defense stats.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The transformed Pokemon data.
+        """
+        self.logger.info("Building graph stat distribution")
+        try:
+            figure = self._new_figure((15, 5))
+            stat_columns = ["HP", "Attack", "Defense"]
+            for ax, column in zip(figure.subplots(1, len(stat_columns)), stat_columns):
+                self._style_axes(ax)
+                sns.histplot(
+                    pokemon_dataframe[column].astype("float64").dropna(),
+                    bins=20,
+                    color="#3b528b",
+                    ax=ax,
+                )
+                ax.set_title(column, fontsize=14)
+                ax.set_xlabel(column, fontsize=12)
+                ax.set_ylabel("Number of Pokémon", fontsize=12)
+            figure.suptitle("Pokémon Stat Distribution", fontsize=16)
+
+            chart_path = self._save_figure(figure, "graph_stat_distribution.png")
+            self.logger.info(f"Graph saved to {chart_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to generate stat distribution graph: {str(e)}")
+
     def export_top_5_pokemon_csv(self, pokemon_top_5_dataframe: pd.DataFrame):
         """
-        Exports the top 5 Pokemon to a CSV file.
+        Exports the top 5 Pokemon in the configured output format.
 
         Args:
             pokemon_top_5_dataframe (pd.DataFrame): The Pokemon data.
         """
-        self.logger.info("Exporting top 5 pokemon to csv")
-        os.makedirs(self.configs.OUTPUT_DIR, exist_ok=True)
-        csv_path = os.path.join(self.configs.OUTPUT_DIR, "top_5_pokemon.csv")
+        self.logger.info("Exporting top 5 pokemon")
         try:
-            pokemon_top_5_dataframe.to_csv(csv_path, index=False)
-            self.logger.info(f"Top 5 pokemon saved to {csv_path}")
+            report_path = self._write_dataframe(pokemon_top_5_dataframe, "top_5_pokemon")
+            self.logger.info(f"Top 5 pokemon saved to {report_path}")
         except Exception as e:
             self.logger.error(f"Failed to export top 5 pokemon: {str(e)}")
 
@@ -75,43 +474,127 @@ class DataReporter:
         self, pokemon_type_statistics_dataframe: pd.DataFrame
     ):
         """
-        Exports the type statistics to a CSV file.
+        Exports the type statistics in the configured output format.
 
         Args:
             pokemon_type_statistics_dataframe (pd.DataFrame): The Pokemon data.
         """
-        self.logger.info("Exporting type statistics to csv")
-        os.makedirs(self.configs.OUTPUT_DIR, exist_ok=True)
-        csv_path = os.path.join(self.configs.OUTPUT_DIR, "type_statistics.csv")
+        self.logger.info("Exporting type statistics")
         try:
-            pokemon_type_statistics_dataframe.to_csv(csv_path, index=False)
-            self.logger.info(f"Type statistics saved to {csv_path}")
+            report_path = self._write_dataframe(
+                pokemon_type_statistics_dataframe, "type_statistics"
+            )
+            self.logger.info(f"Type statistics saved to {report_path}")
         except Exception as e:
             self.logger.error(f"Failed to export type statistics: {str(e)}")
 
-    def _validate_reports_directory(self) -> bool:
+    def export_pokemon_records(self, pokemon_dataframe: pd.DataFrame):
+        """
+        Exports the full enriched Pokemon table in the configured output format.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The transformed Pokemon data.
+        """
+        self.logger.info("Exporting pokemon records")
+        try:
+            report_path = self._write_dataframe(pokemon_dataframe, "pokemon_records")
+            self.logger.info(f"Pokemon records saved to {report_path}")
+        except Exception as e:
+            self.logger.error(f"Failed to export pokemon records: {str(e)}")
+
+    def export_leaderboards(self, leaderboards: dict[str, pd.DataFrame]) -> list[str]:
         """
-        Validates the reports directory.
+        Exports each leaderboard to its own file in the configured output format.
+
+        Args:
+            leaderboards (dict[str, pd.DataFrame]): The leaderboards, by report name.
+
+        Returns:
+            list[str]: The report names of the exported leaderboards.
+        """
+        self.logger.info(f"Exporting {len(leaderboards)} leaderboards")
+        for name, leaderboard_dataframe in leaderboards.items():
+            try:
+                report_path = self._write_dataframe(leaderboard_dataframe, name)
+                self.logger.info(f"Leaderboard {name} saved to {report_path}")
+            except Exception as e:
+                self.logger.error(f"Failed to export leaderboard {name}: {str(e)}")
+        return list(leaderboards)
+
+    def _run_report_jobs(self, report_jobs: list[tuple[Callable, object, list[str]]]):
+        """
+        Runs the report jobs one after another. With ``INCREMENTAL_REPORTS``,
+        jobs whose input fingerprint and reports match the manifest are
+        skipped. The manifest is updated with the reports each job actually
+        wrote.
+
+        Args:
+            report_jobs (list[tuple[Callable, object, list[str]]]): The report
+                methods, their input data and the reports they write.
+        """
+        pending_jobs = []
+        for job, data, reports in report_jobs:
+            file_names = [self._report_file_name(report) for report in reports]
+            fingerprint = self._fingerprint(job.__name__, data, file_names)
+            if self.configs.INCREMENTAL_REPORTS and self._is_up_to_date(
+                file_names, fingerprint
+            ):
+                self.logger.info(f"Skipping unchanged reports {file_names}")
+                continue
+            pending_jobs.append((job, data, file_names, fingerprint))
+        if not pending_jobs:
+            return
+
+        for job, data, _, _ in pending_jobs:
+            job(data)
+
+        for _, _, file_names, fingerprint in pending_jobs:
+            for file_name in file_names:
+                if file_name in self._written_reports:
+                    self.manifest[file_name] = self._manifest_entry(
+                        file_name, fingerprint
+                    )
+                else:
+                    self.manifest.pop(file_name, None)
+
+    def _validate_reports_directory(
+        self, list_expected_reports: list[str] | None = None
+    ) -> bool:
+        """
+        Validates the reports directory against the manifest: every expected
+        report must exist unchanged since it was recorded, and no other report
+        may be present.
+
+        Args:
+            list_expected_reports (list[str] | None): The expected reports.
+                Defaults to ``EXPECTED_REPORTS``.
 
         Returns:
             bool: True if the reports directory is valid, False otherwise.
         """
+        if list_expected_reports is None:
+            list_expected_reports = self.EXPECTED_REPORTS
         list_expected_reports = [
-            "graph_pokemon_by_type.png",
-            "top_5_pokemon.csv",
-            "type_statistics.csv",
+            self._report_file_name(report) for report in list_expected_reports
         ]
-        list_reports = os.listdir(self.configs.OUTPUT_DIR)
+        list_reports = self._list_reports()
+        is_valid = len(list_reports) == len(list_expected_reports)
         for report in list_expected_reports:
             if report not in list_reports:
                 self.logger.error(f"Report {report} not found")
-        return len(list_reports) == len(list_expected_reports)
+                is_valid = False
+            elif not self._matches_manifest(report):
+                self.logger.error(f"Report {report} does not match the manifest")
+                is_valid = False
+        return is_valid
 
     def generate_all_reports(
         self,
         pokemon_by_type_dataframe: pd.DataFrame,
         pokemon_top_5_dataframe: pd.DataFrame,
         pokemon_type_statistics_dataframe: pd.DataFrame,
+        leaderboards: dict[str, pd.DataFrame] | None = None,
+        pokemon_dataframe: pd.DataFrame | None = None,
     ) -> bool:
         """
         Generates all reports.
@@ -120,12 +603,50 @@ class DataReporter:
             pokemon_by_type_dataframe (pd.DataFrame): The Pokemon data by type.
             pokemon_top_5_dataframe (pd.DataFrame): The Pokemon data top 5.
             pokemon_type_statistics_dataframe (pd.DataFrame): The Pokemon data type statistics.
+            leaderboards (dict[str, pd.DataFrame] | None): Extra leaderboards, by report name.
+            pokemon_dataframe (pd.DataFrame | None): The full transformed Pokemon data.
         """
         self.logger.info("Generating all reports")
-        self.generate_type_distribution_chart(pokemon_by_type_dataframe)
-        self.export_top_5_pokemon_csv(pokemon_top_5_dataframe)
-        self.export_type_statistics_csv(pokemon_type_statistics_dataframe)
-        if not self._validate_reports_directory():
+        report_jobs = [
+            (
+                self.generate_type_distribution_chart,
+                pokemon_by_type_dataframe,
+                ["graph_pokemon_by_type.png"],
+            ),
+            (self.export_top_5_pokemon_csv, pokemon_top_5_dataframe, ["top_5_pokemon"]),
+            (
+                self.export_type_statistics_csv,
+                pokemon_type_statistics_dataframe,
+                ["type_statistics"],
+            ),
+        ]
+        for name, leaderboard_dataframe in (leaderboards or {}).items():
+            report_jobs.append(
+                (self.export_leaderboards, {name: leaderboard_dataframe}, [name])
+            )
+        if pokemon_dataframe is not None:
+            report_jobs += [
+                (self.export_pokemon_records, pokemon_dataframe, ["pokemon_records"]),
+                (
+                    self.generate_category_breakdown_chart,
+                    pokemon_dataframe,
+                    ["graph_pokemon_by_category.png"],
+                ),
+                (
+                    self.generate_stat_distribution_chart,
+                    pokemon_dataframe,
+                    ["graph_stat_distribution.png"],
+                ),
+            ]
+        list_expected_reports = [
+            self._report_file_name(report)
+            for _, _, reports in report_jobs
+            for report in reports
+        ]
+        self._run_report_jobs(report_jobs)
+        self._prune_stale_reports(list_expected_reports)
+        self._save_manifest()
+        if not self._validate_reports_directory(list_expected_reports):
             self.logger.error("Reports directory validation failed")
             return False
         self.logger.info("All reports generated successfully")
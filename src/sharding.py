@@ -0,0 +1,135 @@
+import os
+from typing import NamedTuple
+
+import pandas as pd
+
+
+class ShardSpec(NamedTuple):
+    """
+    The slice of the Pokémon list extracted by one worker: the IDs whose
+    remainder modulo ``count`` is ``index``, optionally restricted to
+    explicit inclusive ID ranges.
+    """
+
+    index: int = 0
+    count: int = 1
+    id_ranges: tuple[tuple[int, int], ...] = ()
+
+    def contains(self, pokemon_id: int) -> bool:
+        """
+        Checks whether a Pokémon belongs to the shard.
+
+        Args:
+            pokemon_id (int): The ID of the Pokémon.
+
+        Returns:
+            bool: True if the shard extracts the Pokémon.
+        """
+        if pokemon_id % self.count != self.index:
+            return False
+        if not self.id_ranges:
+            return True
+        return any(start <= pokemon_id <= end for start, end in self.id_ranges)
+
+    @property
+    def name(self) -> str:
+        """
+        Returns a file-name-safe label of the shard, such as ``shard-2-of-4``
+        or ``ids-1-151_387-493``.
+        """
+        parts = []
+        if self.count > 1:
+            parts.append(f"shard-{self.index}-of-{self.count}")
+        if self.id_ranges:
+            parts.append(
+                "ids-" + "_".join(f"{start}-{end}" for start, end in self.id_ranges)
+            )
+        return ".".join(parts) or "all"
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """
+    Parses a ``i/N`` shard spec, where ``i`` is the zero-based shard index.
+
+    Args:
+        value (str): The shard spec, such as ``2/4``.
+
+    Returns:
+        tuple[int, int]: The shard index and the number of shards.
+
+    Raises:
+        ValueError: If the spec is malformed or the index is out of range.
+    """
+    index, separator, count = value.partition("/")
+    if not separator:
+        raise ValueError(f"Invalid shard {value!r}, expected i/N")
+    index, count = int(index), int(count)
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {value!r}, expected 0 <= i < N")
+    return index, count
+
+
+def parse_id_ranges(value: str) -> tuple[tuple[int, int], ...]:
+    """
+    Parses a comma-separated list of inclusive ID ranges or single IDs.
+
+    Args:
+        value (str): The ranges, such as ``1-151,387-493,800``.
+
+    Returns:
+        tuple[tuple[int, int], ...]: The ``(start, end)`` ranges, sorted.
+
+    Raises:
+        ValueError: If a range is malformed or empty.
+    """
+    id_ranges = []
+    for part in value.split(","):
+        start, _, end = part.strip().partition("-")
+        start = int(start)
+        end = int(end) if end else start
+        if end < start:
+            raise ValueError(f"Invalid ID range {part!r}")
+        id_ranges.append((start, end))
+    return tuple(sorted(id_ranges))
+
+
+def partial_file_name(artifact: str, shard: ShardSpec) -> str:
+    """
+    Returns the file name of a shard's partial output.
+
+    Args:
+        artifact (str): The file name of the canonical artifact.
+        shard (ShardSpec): The shard.
+
+    Returns:
+        str: The partial file name, such as ``pokemon_records.shard-2-of-4.pkl``.
+    """
+    stem, extension = os.path.splitext(artifact)
+    return f"{stem}.{shard.name}{extension}"
+
+
+def merge_partials(paths: list[str]) -> pd.DataFrame:
+    """
+    Merges the partial outputs of the shards into the canonical DataFrame.
+    The result does not depend on the order the shards finished in: the
+    partials are read in file name order, Pokémon extracted by more than one
+    shard are kept once (from the first partial) and rows are ordered by ID.
+
+    Args:
+        paths (list[str]): The paths of the pickled partial DataFrames.
+
+    Returns:
+        pd.DataFrame: The merged Pokémon records.
+
+    Raises:
+        FileNotFoundError: If there are no partials to merge.
+    """
+    if not paths:
+        raise FileNotFoundError("No partial outputs to merge")
+    partials = [pd.read_pickle(path) for path in sorted(paths)]
+    merged = pd.concat(partials, ignore_index=True)
+    return (
+        merged.sort_values("ID", kind="stable")
+        .drop_duplicates(subset="ID", keep="first")
+        .reset_index(drop=True)
+    )
@@ -0,0 +1,348 @@
+import json
+import logging
+import os
+import tarfile
+import threading
+import time
+import zipfile
+from abc import ABC, abstractmethod
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from config import Settings
+from .cache import ResponseCache
+from .http_client import TokenBucketRateLimiter, build_session
+from .metrics import MetricsRecorder
+
+SOURCES = ("http", "local")
+DUMP_API_ROOT = "api/v2"
+DUMP_INDEX_FILE = "index.json"
+
+
+class PokemonSource(ABC):
+    """
+    Where the extractor reads PokeAPI documents from. Resources are addressed
+    by their API URL, so every backend serves the same list and detail
+    documents to ``PokemonExtractor``.
+
+    When ``revalidate`` is set, every read is checked against the upstream
+    instead of being served from a local cache, as the refresh daemon does.
+    """
+
+    revalidate = False
+
+    @abstractmethod
+    def get_bytes(self, url: str) -> bytes:
+        """
+        Reads the raw JSON document of an API resource.
+
+        Args:
+            url (str): The API URL of the resource.
+
+        Returns:
+            bytes: The JSON document.
+        """
+
+    def close(self):
+        """
+        Releases the resources held by the source.
+        """
+
+
+class HttpPokemonSource(PokemonSource):
+    """
+    Reads documents from the PokeAPI over a pooled, throttled HTTP session,
+    optionally through the persistent response cache.
+    """
+
+    def __init__(
+        self,
+        configs: Settings,
+        logger: logging.Logger,
+        metrics: MetricsRecorder | None = None,
+    ):
+        self.configs = configs
+        self.logger = logger
+        self.metrics = metrics
+        self.rate_limiter = TokenBucketRateLimiter(
+            configs.RATE_LIMIT_PER_SECOND, configs.RATE_LIMIT_BURST
+        )
+        self.session = build_session(configs, self.rate_limiter)
+        self.cache = None
+        if configs.CACHE_ENABLED:
+            self.cache = ResponseCache(
+                configs.CACHE_PATH, configs.CACHE_TTL_SECONDS, configs.CACHE_MAX_BYTES
+            )
+
+    def close(self):
+        """
+        Closes the pooled HTTP session and the response cache.
+        """
+        self.session.close()
+        if self.cache is not None:
+            self.logger.info(f"Response cache stats: {self.cache.stats()}")
+            if self.metrics is not None:
+                self.metrics.set_cache_stats(self.cache.stats())
+            self.cache.close()
+
+    def _get(self, url: str, headers: dict | None = None) -> requests.Response:
+        """
+        Sends a throttled GET request through the pooled session.
+
+        Args:
+            url (str): The URL to request.
+            headers (dict | None): Extra request headers.
+
+        Returns:
+            requests.Response: The successful response.
+
+        Raises:
+            requests.exceptions.RequestException: If the request still fails
+                after all retries.
+        """
+        self.rate_limiter.acquire()
+        started_at = time.perf_counter()
+        try:
+            response = self.session.get(
+                url, headers=headers, timeout=self.configs.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            if self.metrics is not None:
+                self.metrics.record_error("request", e)
+            raise
+        if self.metrics is not None:
+            retries = getattr(getattr(response.raw, "retries", None), "history", ())
+            self.metrics.record_request(
+                time.perf_counter() - started_at,
+                len(response.content),
+                response.status_code,
+                len(retries),
+            )
+        return response
+
+    def get_bytes(self, url: str) -> bytes:
+        """
+        Fetches a document, serving it from the response cache when enabled.
+        With ``revalidate``, cached documents are revalidated with a
+        conditional request.
+
+        Args:
+            url (str): The URL to request.
+
+        Returns:
+            bytes: The response body.
+        """
+        if self.cache is None:
+            return self._get(url).content
+        return self.cache.fetch(
+            url,
+            lambda headers: self._get(url, headers),
+            max_age=0 if self.revalidate else None,
+        )
+
+
+class LocalDumpPokemonSource(PokemonSource):
+    """
+    Reads documents from a local snapshot of the PokeAPI in the ``api-data``
+    layout (``api/v2/pokemon/index.json`` and ``api/v2/pokemon/{id}/index.json``),
+    either as a directory or as a zip/tar archive. Archive members are
+    streamed on demand, so the dump is never unpacked to disk.
+
+    List URLs are answered from the dump's full index, sliced by their
+    ``limit``/``offset`` query and linked with ``next`` like the API pages.
+    """
+
+    def __init__(self, path: str, logger: logging.Logger):
+        """
+        Args:
+            path (str): The dump directory or archive. It may contain the
+                ``api/v2`` tree at its root or under any leading directories,
+                such as ``api-data-master/data/``.
+            logger (logging.Logger): The logger of the source.
+
+        Raises:
+            FileNotFoundError: If the path holds no PokeAPI dump.
+        """
+        self.path = path
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._archive = None
+        self._members = {}
+        if os.path.isdir(path):
+            self._root = self._find_directory_root(path)
+        elif zipfile.is_zipfile(path):
+            self._archive = zipfile.ZipFile(path)
+            self._members = {name: name for name in self._archive.namelist()}
+            self._root = self._find_archive_root()
+        elif os.path.isfile(path) and tarfile.is_tarfile(path):
+            self._archive = tarfile.open(path, mode="r:*")
+            self._members = {
+                member.name: member
+                for member in self._archive.getmembers()
+                if member.isfile()
+            }
+            self._root = self._find_archive_root()
+        else:
+            raise FileNotFoundError(f"No PokeAPI dump found at {path!r}")
+        self._list_results = None
+        self.logger.info(f"Reading Pokemon from local dump {path}")
+
+    def _find_directory_root(self, path: str) -> str:
+        """
+        Finds the directory holding the ``api/v2`` tree of a dump.
+
+        Args:
+            path (str): The dump directory.
+
+        Returns:
+            str: The directory that contains ``api/v2``.
+        """
+        marker = os.path.join(*DUMP_API_ROOT.split("/"), "pokemon", DUMP_INDEX_FILE)
+        for directory, subdirectories, _ in os.walk(path):
+            if os.path.isfile(os.path.join(directory, marker)):
+                return directory
+            # Pokémon detail directories never contain the api/v2 tree.
+            subdirectories[:] = [name for name in subdirectories if not name.isdigit()]
+        raise FileNotFoundError(f"No PokeAPI dump found at {path!r}")
+
+    def _find_archive_root(self) -> str:
+        """
+        Finds the member prefix of the ``api/v2`` tree of an archived dump.
+
+        Returns:
+            str: The prefix, empty or ending with a slash.
+        """
+        marker = f"{DUMP_API_ROOT}/pokemon/{DUMP_INDEX_FILE}"
+        for name in self._members:
+            normalized = name.removeprefix("./")
+            if normalized == marker or normalized.endswith(f"/{marker}"):
+                return name[: -len(marker)]
+        self._archive.close()
+        raise FileNotFoundError(f"No PokeAPI dump found at {self.path!r}")
+
+    def close(self):
+        """
+        Closes the dump archive, if any.
+        """
+        if self._archive is not None:
+            self._archive.close()
+
+    def _read_resource(self, resource: str) -> bytes:
+        """
+        Reads the ``index.json`` document of a resource in the dump.
+
+        Args:
+            resource (str): The resource path, relative to ``api/v2``.
+
+        Returns:
+            bytes: The JSON document.
+
+        Raises:
+            FileNotFoundError: If the dump has no such resource.
+        """
+        relative = f"{DUMP_API_ROOT}/{resource}/{DUMP_INDEX_FILE}"
+        if self._archive is None:
+            file_path = os.path.join(self._root, *relative.split("/"))
+            try:
+                with open(file_path, "rb") as file:
+                    return file.read()
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"Resource {resource!r} not found in dump {self.path!r}"
+                ) from None
+        member = self._members.get(self._root + relative)
+        if member is None:
+            raise FileNotFoundError(
+                f"Resource {resource!r} not found in dump {self.path!r}"
+            )
+        with self._lock:
+            if isinstance(self._archive, zipfile.ZipFile):
+                return self._archive.read(member)
+            return self._archive.extractfile(member).read()
+
+    def _resource_path(self, url: str) -> str:
+        """
+        Maps an API URL, absolute or relative, to its resource path.
+
+        Args:
+            url (str): The API URL, such as ``https://pokeapi.co/api/v2/pokemon/25``
+                or ``/api/v2/pokemon/?offset=20&limit=20``.
+
+        Returns:
+            str: The resource path relative to ``api/v2``, such as ``pokemon/25``.
+        """
+        path = urlparse(url).path.strip("/")
+        _, found, resource = path.partition(DUMP_API_ROOT)
+        return (resource if found else path).strip("/")
+
+    def _list_page(self, resource: str, query: dict) -> bytes:
+        """
+        Builds a list page from the dump's full index of a resource.
+
+        Args:
+            resource (str): The list resource, such as ``pokemon``.
+            query (dict): The parsed query string of the list URL.
+
+        Returns:
+            bytes: The JSON page with ``count``, ``next`` and ``results``.
+        """
+        if self._list_results is None:
+            self._list_results = json.loads(self._read_resource(resource))["results"]
+        results = self._list_results
+        offset = int(query.get("offset", ["0"])[0])
+        limit = int(query.get("limit", [str(len(results))])[0])
+        next_url = None
+        if offset + limit < len(results):
+            next_url = (
+                f"/{DUMP_API_ROOT}/{resource}/?offset={offset + limit}&limit={limit}"
+            )
+        page = {
+            "count": len(results),
+            "next": next_url,
+            "results": results[offset : offset + limit],
+        }
+        return json.dumps(page).encode()
+
+    def get_bytes(self, url: str) -> bytes:
+        """
+        Reads a list page or a detail document from the dump.
+
+        Args:
+            url (str): The API URL of the resource.
+
+        Returns:
+            bytes: The JSON document.
+        """
+        resource = self._resource_path(url)
+        if resource == "pokemon":
+            return self._list_page(resource, parse_qs(urlparse(url).query))
+        return self._read_resource(resource)
+
+
+def build_source(
+    configs: Settings, logger: logging.Logger, metrics: MetricsRecorder | None = None
+) -> PokemonSource:
+    """
+    Builds the source selected by ``SOURCE``.
+
+    Args:
+        configs (Settings): The application settings.
+        logger (logging.Logger): The logger of the source.
+        metrics (MetricsRecorder | None): The recorder of request metrics.
+
+    Returns:
+        PokemonSource: The HTTP source, or the local dump source at
+            ``LOCAL_DUMP_PATH``.
+
+    Raises:
+        ValueError: If ``SOURCE`` is not a supported source.
+    """
+    if configs.SOURCE == "http":
+        return HttpPokemonSource(configs, logger, metrics)
+    if configs.SOURCE == "local":
+        return LocalDumpPokemonSource(configs.LOCAL_DUMP_PATH, logger)
+    raise ValueError(
+        f"Unsupported source {configs.SOURCE!r}, expected one of {list(SOURCES)}"
+    )
@@ -0,0 +1,303 @@
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from .decoding import POKEMON_SCHEMA
+
+POKEMON_TABLE_COLUMNS = {
+    "ID": "id",
+    "Name": "name",
+    "Base Experience": "base_experience",
+    "Height": "height",
+    "Weight": "weight",
+    "Category": "category",
+}
+STAT_COLUMNS = [
+    field.column for field in POKEMON_SCHEMA if field.path.startswith("stats[")
+]
+STAT_TABLE_COLUMNS = {
+    column: column.lower().replace(" ", "_") for column in STAT_COLUMNS
+}
+LIST_TABLES = {
+    "Types": ("pokemon_type", "type"),
+    "Abilities": ("pokemon_ability", "ability"),
+}
+
+
+def _column_values(series: pd.Series) -> list:
+    """
+    Converts a DataFrame column into values SQLite can bind.
+
+    Args:
+        series (pd.Series): The column.
+
+    Returns:
+        list: The Python values of the column, with None for missing values.
+    """
+    return [None if pd.isna(value) else value for value in series.tolist()]
+
+
+class PokemonStore:
+    """
+    Persistent SQLite store of extracted Pokémon with a normalized schema:
+    one ``pokemon`` row per Pokémon, its types and abilities in
+    ``pokemon_type``/``pokemon_ability`` and its base stats in ``stats``, one
+    column per stat of ``POKEMON_SCHEMA``.
+    Types, base experience and category are indexed, so lookups and per-type
+    aggregations do not need the DataFrame in memory or a re-fetch.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): The path of the SQLite database file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS pokemon (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                base_experience INTEGER,
+                height INTEGER,
+                weight INTEGER,
+                category TEXT
+            );
+            CREATE TABLE IF NOT EXISTS pokemon_type (
+                pokemon_id INTEGER NOT NULL REFERENCES pokemon (id) ON DELETE CASCADE,
+                slot INTEGER NOT NULL,
+                type TEXT NOT NULL,
+                PRIMARY KEY (pokemon_id, slot)
+            );
+            CREATE TABLE IF NOT EXISTS pokemon_ability (
+                pokemon_id INTEGER NOT NULL REFERENCES pokemon (id) ON DELETE CASCADE,
+                slot INTEGER NOT NULL,
+                ability TEXT NOT NULL,
+                PRIMARY KEY (pokemon_id, slot)
+            );
+            CREATE TABLE IF NOT EXISTS stats (
+                pokemon_id INTEGER PRIMARY KEY REFERENCES pokemon (id) ON DELETE CASCADE
+            );
+            CREATE INDEX IF NOT EXISTS idx_pokemon_type_type
+                ON pokemon_type (type, pokemon_id);
+            CREATE INDEX IF NOT EXISTS idx_pokemon_base_experience
+                ON pokemon (base_experience);
+            CREATE INDEX IF NOT EXISTS idx_pokemon_category ON pokemon (category);
+            """
+        )
+        # Stats added to the schema after the store was created become new columns.
+        existing_columns = {
+            row[1] for row in self._connection.execute("PRAGMA table_info(stats)")
+        }
+        for name in STAT_TABLE_COLUMNS.values():
+            if name not in existing_columns:
+                self._connection.execute(f"ALTER TABLE stats ADD COLUMN {name} INTEGER")
+        self._connection.commit()
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM pokemon").fetchone()[0]
+
+    def write_dataframe(self, pokemon_dataframe: pd.DataFrame) -> int:
+        """
+        Bulk-inserts Pokémon records, such as the output of
+        ``PokemonExtractor.build_pokemons_dataframe``, in one transaction.
+        Pokémon already in the store are replaced.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The Pokémon data.
+
+        Returns:
+            int: The number of Pokémon written.
+        """
+        ids = _column_values(pokemon_dataframe["ID"])
+        columns = [
+            (column, name)
+            for column, name in POKEMON_TABLE_COLUMNS.items()
+            if column in pokemon_dataframe
+        ]
+        pokemon_rows = zip(
+            *(_column_values(pokemon_dataframe[column]) for column, _ in columns)
+        )
+        list_rows = {
+            column: [
+                (pokemon_id, slot, item)
+                for pokemon_id, items in zip(ids, pokemon_dataframe[column].tolist())
+                for slot, item in enumerate(items or (), start=1)
+            ]
+            for column in LIST_TABLES
+            if column in pokemon_dataframe
+        }
+        stat_columns = [
+            (column, name)
+            for column, name in STAT_TABLE_COLUMNS.items()
+            if column in pokemon_dataframe
+        ]
+        stat_rows = zip(
+            ids,
+            *(_column_values(pokemon_dataframe[column]) for column, _ in stat_columns),
+        )
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM pokemon WHERE id = ?", [(pokemon_id,) for pokemon_id in ids]
+            )
+            self._connection.executemany(
+                f"INSERT INTO pokemon ({', '.join(name for _, name in columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                pokemon_rows,
+            )
+            for column, rows in list_rows.items():
+                table, value_column = LIST_TABLES[column]
+                self._connection.executemany(
+                    f"INSERT INTO {table} (pokemon_id, slot, {value_column}) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+            stat_names = ["pokemon_id", *(name for _, name in stat_columns)]
+            self._connection.executemany(
+                f"INSERT INTO stats ({', '.join(stat_names)}) "
+                f"VALUES ({', '.join('?' for _ in stat_names)})",
+                stat_rows,
+            )
+        return len(ids)
+
+    def execute(self, sql: str, params: tuple = ()) -> int:
+        """
+        Runs a data-modifying statement in its own transaction.
+
+        Args:
+            sql (str): The SQL statement.
+            params (tuple): The statement parameters.
+
+        Returns:
+            int: The number of rows changed.
+        """
+        with self._lock, self._connection:
+            return self._connection.execute(sql, params).rowcount
+
+    def query(self, sql: str, params: tuple | dict = ()) -> pd.DataFrame:
+        """
+        Runs an ad-hoc query.
+
+        Args:
+            sql (str): The SQL query.
+            params (tuple | dict): The query parameters.
+
+        Returns:
+            pd.DataFrame: The query result.
+        """
+        with self._lock:
+            return pd.read_sql_query(sql, self._connection, params=params)
+
+    def _load(self, id_filter: str = "", params: tuple = ()) -> pd.DataFrame:
+        """
+        Rebuilds the Pokémon records matching an ID filter.
+
+        Args:
+            id_filter (str): A SQL condition on ``id``, such as
+                ``id IN (SELECT ...)``, or empty to load every Pokémon.
+            params (tuple): The parameters of the condition.
+
+        Returns:
+            pd.DataFrame: The Pokémon data, ordered by ID.
+        """
+        where = f"WHERE {id_filter}" if id_filter else ""
+        child_where = (
+            f"WHERE pokemon_id IN (SELECT id FROM pokemon {where})" if where else ""
+        )
+        select = ", ".join(
+            [f'{name} AS "{column}"' for column, name in POKEMON_TABLE_COLUMNS.items()]
+            + [f'{name} AS "{column}"' for column, name in STAT_TABLE_COLUMNS.items()]
+        )
+        pokemon = self.query(
+            f"SELECT {select} FROM pokemon LEFT JOIN stats ON stats.pokemon_id = id "
+            f"{where} ORDER BY id",
+            params,
+        )
+        pokemon_ids = pokemon["ID"].tolist()
+        for column, (table, value_column) in LIST_TABLES.items():
+            items = self.query(
+                f"SELECT pokemon_id, {value_column} FROM {table} {child_where} "
+                "ORDER BY pokemon_id, slot",
+                params,
+            )
+            grouped = items.groupby("pokemon_id")[value_column].agg(list).to_dict()
+            pokemon[column] = [grouped.get(pokemon_id, []) for pokemon_id in pokemon_ids]
+        for column in ["ID", "Base Experience", "Height", "Weight", *STAT_COLUMNS]:
+            pokemon[column] = pokemon[column].astype("Int64")
+        if pokemon["Category"].isna().all():
+            pokemon = pokemon.drop(columns="Category")
+        ordered_columns = [
+            column
+            for column in [field.column for field in POKEMON_SCHEMA] + ["Category"]
+            if column in pokemon
+        ]
+        return pokemon[ordered_columns]
+
+    def to_dataframe(self, ids: list[int] | None = None) -> pd.DataFrame:
+        """
+        Rebuilds Pokémon records in the layout of ``build_pokemons_dataframe``,
+        plus ``Category`` when it is stored.
+
+        Args:
+            ids (list[int] | None): The IDs to load, in the order of the
+                result. None loads every Pokémon, ordered by ID.
+
+        Returns:
+            pd.DataFrame: The Pokémon data.
+        """
+        if ids is None:
+            return self._load()
+        if not ids:
+            return self._load("0")
+        pokemon = self._load(
+            f"id IN ({', '.join('?' for _ in ids)})", tuple(ids)
+        ).set_index("ID", drop=False)
+        stored_ids = [pokemon_id for pokemon_id in ids if pokemon_id in pokemon.index]
+        return pokemon.loc[stored_ids].reset_index(drop=True)
+
+    def get_pokemon(self, pokemon_id: int) -> dict | None:
+        """
+        Looks up a single Pokémon.
+
+        Args:
+            pokemon_id (int): The ID of the Pokémon.
+
+        Returns:
+            dict | None: The Pokémon record, or None if it is not stored.
+        """
+        pokemon = self.to_dataframe([pokemon_id])
+        if pokemon.empty:
+            return None
+        return pokemon.iloc[0].to_dict()
+
+    def pokemon_by_type(self, pokemon_type: str) -> pd.DataFrame:
+        """
+        Loads the Pokémon of a type through the type index.
+
+        Args:
+            pokemon_type (str): The type name, such as ``fire``.
+
+        Returns:
+            pd.DataFrame: The Pokémon of the type, ordered by ID.
+        """
+        return self._load(
+            "id IN (SELECT pokemon_id FROM pokemon_type WHERE type = ?)",
+            (pokemon_type,),
+        ).reset_index(drop=True)
@@ -1,15 +1,50 @@
 import logging
+from collections.abc import Iterable
 
 import pandas as pd
 
+from config import Settings
+from .aggregates import TypeAggregateState
+from .aggregation import (
+    AggregationEngine,
+    AggregationSpec,
+    Bucket,
+    Measure,
+    parse_measure,
+    sql_identifier,
+)
+from .store import POKEMON_TABLE_COLUMNS, STAT_TABLE_COLUMNS, PokemonStore
+
+TYPE_STATISTICS_COLUMNS = ["HP", "Attack", "Defense"]
+
 
 class DataTransformer:
     def __init__(self, logger: logging.Logger):
         self.logger = logger
+        self.configs = Settings()
+        self.experience_bucket = Bucket.from_upper_bounds(
+            "Category", "Base Experience", self.configs.EXPERIENCE_BUCKETS
+        )
+        self.type_measures = [
+            parse_measure(measure) for measure in self.configs.TYPE_STATISTICS_MEASURES
+        ]
+        self.engine = AggregationEngine([self.experience_bucket])
+
+    def _log_dataframe(self, message: str, dataframe: pd.DataFrame):
+        """
+        Logs a DataFrame dump at DEBUG level, formatting it only when the
+        level is enabled.
+
+        Args:
+            message (str): The message preceding the dump.
+            dataframe (pd.DataFrame): The DataFrame to dump.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"{message}: \n {dataframe}")
 
     def categorize_experience(self, pokemon_dataframe: pd.DataFrame) -> pd.DataFrame:
         """
-        Categorizes Pokemon experience.
+        Categorizes Pokemon experience into the ``EXPERIENCE_BUCKETS``.
 
         Args:
             pokemon_dataframe (pd.DataFrame): The Pokemon data.
@@ -18,14 +53,236 @@ class DataTransformer:
             pd.DataFrame: The Pokemon data with experience categorized.
         """
         self.logger.info("Categorizing Pokemon experience")
-        pokemon_dataframe["Category"] = pokemon_dataframe["Base Experience"].apply(
-            lambda x: "Weak" if x < 50 else "Medium" if x < 100 else "Strong"
+        pokemon_dataframe["Category"] = self.experience_bucket.apply(
+            pokemon_dataframe["Base Experience"]
         )
         self.logger.info("Pokemon experience categorized.")
-        self.logger.info(f"Pokemon experience: \n {pokemon_dataframe}")
+        self._log_dataframe("Pokemon experience", pokemon_dataframe)
         return pokemon_dataframe
 
-    def count_pokemon_by_type(self, pokemon_dataframe: pd.DataFrame) -> pd.DataFrame:   
+    def aggregate(
+        self, pokemon_dataframe: pd.DataFrame, specs: Iterable[AggregationSpec]
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Runs declarative aggregations. Specs with the same group keys and
+        filters share a single grouped pass, so adding a measure costs no
+        extra scan of the data.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The Pokemon data.
+            specs (Iterable[AggregationSpec]): The aggregations to run. The
+                ``Category`` bucket can be used as a column.
+
+        Returns:
+            dict[str, pd.DataFrame]: The result of each spec, by spec name.
+        """
+        return self.engine.run(pokemon_dataframe, specs)
+
+    def _type_spec(self, pokemon_dataframe: pd.DataFrame) -> AggregationSpec:
+        """
+        Builds the per-type aggregation behind the type counts and statistics:
+        the count and mean stats of every type, plus the
+        ``TYPE_STATISTICS_MEASURES``, for the columns of the data.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The Pokemon data.
+
+        Returns:
+            AggregationSpec: The aggregation spec.
+        """
+        measures = [Measure("Count")]
+        measures += [
+            Measure(column, column, "mean")
+            for column in TYPE_STATISTICS_COLUMNS
+            if column in pokemon_dataframe
+        ]
+        measures += [
+            measure
+            for measure in self.type_measures
+            if measure.column is None or measure.column in pokemon_dataframe
+        ]
+        return AggregationSpec("type_aggregates", ("Types",), tuple(measures))
+
+    def _aggregate_by_type(self, pokemon_dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Explodes the Pokemon types once and computes the count, the mean
+        stats and the extra measures of every type in a single grouped pass.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The Pokemon data.
+
+        Returns:
+            pd.DataFrame: The measures of each type, indexed by type.
+        """
+        return self.aggregate(pokemon_dataframe, [self._type_spec(pokemon_dataframe)])[
+            "type_aggregates"
+        ]
+
+    def _type_counts(self, type_aggregates: pd.DataFrame) -> pd.DataFrame:
+        """
+        Builds the Pokemon count by type from the type aggregates.
+
+        Args:
+            type_aggregates (pd.DataFrame): The output of ``_aggregate_by_type``.
+
+        Returns:
+            pd.DataFrame: The Pokemon count by type, most common types first.
+        """
+        pokemon_count_by_type = (
+            type_aggregates["Count"]
+            .rename_axis("Type")
+            .reset_index()
+            .sort_values(["Count", "Type"], ascending=[False, True], ignore_index=True)
+        )
+        return pokemon_count_by_type
+
+    def _type_statistics(self, type_aggregates: pd.DataFrame) -> pd.DataFrame:
+        """
+        Builds the mean stats by type from the type aggregates.
+
+        Args:
+            type_aggregates (pd.DataFrame): The output of ``_aggregate_by_type``.
+
+        Returns:
+            pd.DataFrame: The type statistics.
+        """
+        stat_columns = [
+            column
+            for column in TYPE_STATISTICS_COLUMNS
+            + [measure.name for measure in self.type_measures]
+            if column in type_aggregates
+        ]
+        return type_aggregates[stat_columns].reset_index().round(2)
+
+    def new_aggregate_state(self) -> TypeAggregateState:
+        """
+        Creates an empty mergeable per-type aggregate state, with the
+        ``TYPE_STATISTICS_MEASURES``.
+
+        Returns:
+            TypeAggregateState: The empty state.
+
+        Raises:
+            ValueError: If a configured measure cannot be computed chunk by
+                chunk, such as a median or a percentile.
+        """
+        return TypeAggregateState(
+            TYPE_STATISTICS_COLUMNS,
+            list(self.experience_bucket.labels),
+            self.type_measures,
+        )
+
+    def aggregate_chunk(
+        self, state: TypeAggregateState, pokemon_dataframe: pd.DataFrame
+    ) -> TypeAggregateState:
+        """
+        Categorizes a chunk of Pokemon data and adds it to an aggregate state.
+
+        Args:
+            state (TypeAggregateState): The aggregate state to update.
+            pokemon_dataframe (pd.DataFrame): A chunk of Pokemon data.
+
+        Returns:
+            TypeAggregateState: The updated state.
+        """
+        if "Category" not in pokemon_dataframe:
+            pokemon_dataframe = self.categorize_experience(pokemon_dataframe)
+        return state.update(pokemon_dataframe)
+
+    def finalize_aggregates(
+        self, state: TypeAggregateState
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Produces the type counts and statistics from an aggregate state.
+
+        Args:
+            state (TypeAggregateState): The aggregate state.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The Pokemon count by type and
+                the type statistics.
+        """
+        return self.summarize_type_aggregates(state.to_type_aggregates())
+
+    def summarize_type_aggregates(
+        self, type_aggregates: pd.DataFrame
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Produces the type counts and statistics from per-type aggregates.
+
+        Args:
+            type_aggregates (pd.DataFrame): The per-type aggregates, such as
+                the output of ``update_type_aggregates``.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The Pokemon count by type and
+                the type statistics.
+        """
+        pokemons_by_type_dataframe = self._type_counts(type_aggregates)
+        pokemons_type_statistics_dataframe = self._type_statistics(type_aggregates)
+        self._log_dataframe("Pokemon count by type", pokemons_by_type_dataframe)
+        self._log_dataframe("Type statistics", pokemons_type_statistics_dataframe)
+        return pokemons_by_type_dataframe, pokemons_type_statistics_dataframe
+
+    def update_type_aggregates(
+        self,
+        type_aggregates: pd.DataFrame | None,
+        pokemon_dataframe: pd.DataFrame,
+        pokemon_types: Iterable[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Recomputes the per-type aggregates of some types only, from the
+        Pokemon that have at least one of them, and keeps the others as they
+        are.
+
+        Args:
+            type_aggregates (pd.DataFrame | None): The current per-type
+                aggregates, or None to compute them from scratch.
+            pokemon_dataframe (pd.DataFrame): The Pokemon data.
+            pokemon_types (Iterable[str] | None): The types to recompute.
+                None recomputes every type.
+
+        Returns:
+            pd.DataFrame: The count and mean stats of each type, indexed by type.
+        """
+        if type_aggregates is None or pokemon_types is None:
+            return self._aggregate_by_type(pokemon_dataframe)
+        pokemon_types = set(pokemon_types)
+        has_type = [
+            not pokemon_types.isdisjoint(types or ())
+            for types in pokemon_dataframe["Types"].tolist()
+        ]
+        updated = self._aggregate_by_type(pokemon_dataframe[has_type])
+        updated = updated[updated.index.isin(pokemon_types)]
+        kept = type_aggregates[~type_aggregates.index.isin(pokemon_types)]
+        if updated.empty:
+            return kept
+        if kept.empty:
+            return updated
+        return pd.concat([kept, updated]).sort_index()
+
+    def transform_chunks(
+        self, pokemon_chunks: Iterable[pd.DataFrame]
+    ) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Computes the type counts and statistics one chunk at a time, keeping
+        only the per-type aggregate state in memory.
+
+        Args:
+            pokemon_chunks (Iterable[pd.DataFrame]): The chunks of Pokemon data.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: The Pokemon count by type and
+                the type statistics.
+        """
+        self.logger.info("Transforming Pokemon data in chunks")
+        state = self.new_aggregate_state()
+        for pokemon_dataframe in pokemon_chunks:
+            self.aggregate_chunk(state, pokemon_dataframe)
+        self.logger.info("Chunked Pokemon data transformation complete.")
+        return self.finalize_aggregates(state)
+
+    def count_pokemon_by_type(self, pokemon_dataframe: pd.DataFrame) -> pd.DataFrame:
         """
         Counts the number of Pokemon by type.
 
@@ -36,11 +293,11 @@ class DataTransformer:
             pd.DataFrame: The Pokemon count by type.
         """
         self.logger.info("Counting Pokemon by type")
-        exploded_df = pokemon_dataframe.explode("Types")
-        pokemon_count_by_type = exploded_df["Types"].value_counts().reset_index()
-        pokemon_count_by_type.columns = ["Type", "Count"]
+        pokemon_count_by_type = self._type_counts(
+            self._aggregate_by_type(pokemon_dataframe)
+        )
         self.logger.info("Type analysis complete.")
-        self.logger.info(f"Pokemon count by type: \n {pokemon_count_by_type}")
+        self._log_dataframe("Pokemon count by type", pokemon_count_by_type)
         return pokemon_count_by_type
 
     def calculate_type_statistics(
@@ -56,45 +313,253 @@ class DataTransformer:
             pd.DataFrame: The type statistics.
         """
         self.logger.info("Calculating type statistics")
-        exploded_df = pokemon_dataframe.explode("Types")
-        type_statistics = (
-            exploded_df.groupby("Types")
-            .agg(
-                {
-                    "HP": "mean",
-                    "Attack": "mean",
-                    "Defense": "mean",
-                }
-            )
-            .reset_index()
+        type_statistics = self._type_statistics(
+            self._aggregate_by_type(pokemon_dataframe)
         )
-        type_statistics = type_statistics.round(2)
         self.logger.info("Type statistics calculation complete.")
-        self.logger.info(f"Type statistics: \n {type_statistics}")
+        self._log_dataframe("Type statistics", type_statistics)
         return type_statistics
 
-    def find_top_pokemon(self, pokemon_dataframe: pd.DataFrame) -> pd.DataFrame:
+    def _select_top(
+        self, pokemon_dataframe: pd.DataFrame, k: int, column: str
+    ) -> pd.DataFrame:
+        """
+        Selects the k rows with the largest values of a column without a full
+        sort. Ties are broken by ``ID`` (or by original order without an ID).
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The Pokemon data.
+            k (int): The number of rows to select.
+            column (str): The ranking column.
+
+        Returns:
+            pd.DataFrame: The top k rows, best first.
         """
-        Finds the top 5 Pokemon by base experience.
+        candidates = pokemon_dataframe.nlargest(k, column, keep="all")
+        if "ID" in candidates:
+            candidates = candidates.sort_values(
+                [column, "ID"], ascending=[False, True], kind="stable"
+            )
+        else:
+            candidates = candidates.sort_values(column, ascending=False, kind="stable")
+        return candidates.head(k)
+
+    def find_top_pokemon(
+        self,
+        pokemon_dataframe: pd.DataFrame,
+        k: int = 5,
+        column: str = "Base Experience",
+        by_type: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Finds the top k Pokemon by a ranking column, globally or per type.
 
         Args:
             pokemon_dataframe (pd.DataFrame): The Pokemon data.
+            k (int): The number of Pokemon to keep (per type if ``by_type``).
+            column (str): The ranking column.
+            by_type (bool): Whether to rank the Pokemon of each type separately.
 
         Returns:
-            pd.DataFrame: The top Pokemon.
+            pd.DataFrame: The top Pokemon. Per-type rankings have a leading
+                ``Type`` column.
         """
-        self.logger.info("Finding top Pokemon")
-        top_pokemon = pokemon_dataframe.sort_values(
-            "Base Experience", ascending=False
-        ).head(5)
+        self.logger.info(f"Finding top {k} Pokemon by {column}")
+        if by_type:
+            exploded_df = pokemon_dataframe.explode("Types").rename(
+                columns={"Types": "Type"}
+            )
+            top_by_type = [
+                self._select_top(type_df, k, column)
+                for _, type_df in exploded_df.groupby("Type", sort=True)
+            ]
+            top_pokemon = (
+                pd.concat(top_by_type) if top_by_type else exploded_df.head(0)
+            )
+            top_pokemon = top_pokemon[
+                ["Type", *top_pokemon.columns.drop("Type")]
+            ].reset_index(drop=True)
+        else:
+            top_pokemon = self._select_top(pokemon_dataframe, k, column)
         self.logger.info("Top Pokemon found.")
-        self.logger.info(f"Top Pokemon: \n {top_pokemon}")
+        self._log_dataframe("Top Pokemon", top_pokemon)
         return top_pokemon
 
+    def build_leaderboards(
+        self, pokemon_dataframe: pd.DataFrame
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Builds the configured leaderboards: the top ``TOP_K`` Pokemon for each
+        column in ``LEADERBOARD_COLUMNS``, and per type if ``LEADERBOARD_BY_TYPE``.
+
+        Args:
+            pokemon_dataframe (pd.DataFrame): The Pokemon data.
+
+        Returns:
+            dict[str, pd.DataFrame]: The leaderboards, by report name.
+        """
+        leaderboards = {}
+        k = self.configs.TOP_K
+        for column in self.configs.LEADERBOARD_COLUMNS:
+            slug = column.lower().replace(" ", "_")
+            leaderboards[f"top_{k}_by_{slug}"] = self.find_top_pokemon(
+                pokemon_dataframe, k, column
+            )
+            if self.configs.LEADERBOARD_BY_TYPE:
+                leaderboards[f"top_{k}_by_{slug}_per_type"] = self.find_top_pokemon(
+                    pokemon_dataframe, k, column, by_type=True
+                )
+        return leaderboards
+
+    def categorize_store(self, store: PokemonStore) -> int:
+        """
+        Categorizes the experience of the stored Pokemon with a single SQL
+        update, using the same thresholds as ``categorize_experience``. Rows
+        already in the right category are not rewritten.
+
+        Args:
+            store (PokemonStore): The Pokemon store.
+
+        Returns:
+            int: The number of Pokemon whose category changed.
+        """
+        self.logger.info("Categorizing stored Pokemon experience")
+        # Missing experience falls into the last category, as in pandas.
+        category = self.experience_bucket.sql_case("base_experience")
+        return store.execute(
+            f"UPDATE pokemon SET category = {category} WHERE category IS NOT {category}"
+        )
+
+    def _store_measure_sql(self, measure: Measure) -> str:
+        """
+        Builds the SQL expression of a ``TYPE_STATISTICS_MEASURES`` measure
+        over the ``pokemon_type``, ``pokemon`` and ``stats`` join. A standard
+        deviation is computed as its variance, whose square root is taken in
+        pandas as SQLite has no ``SQRT``.
+
+        Args:
+            measure (Measure): The measure.
+
+        Returns:
+            str: The SQL aggregate expression.
+
+        Raises:
+            ValueError: If the measure cannot be computed in SQL, such as a
+                median or a percentile, or its column is not stored.
+        """
+        if measure.function == "size":
+            return "COUNT(*)"
+        if measure.column in STAT_TABLE_COLUMNS:
+            column = f"stats.{STAT_TABLE_COLUMNS[measure.column]}"
+        elif measure.column in POKEMON_TABLE_COLUMNS and measure.column not in (
+            "Name",
+            "Category",
+        ):
+            column = f"pokemon.{POKEMON_TABLE_COLUMNS[measure.column]}"
+        else:
+            raise ValueError(
+                f"Measure {measure.name!r} reads a column that is not stored"
+            )
+        expressions = {
+            "count": f"COUNT({column})",
+            "sum": f"COALESCE(SUM({column}), 0)",
+            "mean": f"AVG({column})",
+            "min": f"MIN({column})",
+            "max": f"MAX({column})",
+            "std": (
+                f"CASE WHEN COUNT({column}) > 1 THEN "
+                f"(SUM(1.0 * {column} * {column}) "
+                f"- 1.0 * SUM({column}) * SUM({column}) "
+                f"/ COUNT({column})) / (COUNT({column}) - 1) END"
+            ),
+        }
+        if measure.function not in expressions:
+            raise ValueError(
+                f"Measure {measure.name!r} cannot be computed in the store, "
+                f"only {['size', *expressions]} can be pushed down to SQL"
+            )
+        return expressions[measure.function]
+
+    def transform_store(
+        self, store: PokemonStore, k: int = 5, column: str = "Base Experience"
+    ) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """
+        Computes the type counts, the type statistics and the top k Pokemon
+        inside the store with SQL, without loading every Pokemon. The results
+        match ``transform_pokemon_data``.
+
+        Args:
+            store (PokemonStore): The Pokemon store.
+            k (int): The number of top Pokemon to keep.
+            column (str): The ranking column, ``Base Experience`` or a stat.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: The Pokemon count
+                by type, the type statistics and the top Pokemon.
+        """
+        self.logger.info("Transforming stored Pokemon data")
+        measures = {
+            measure.name: self._store_measure_sql(measure)
+            for measure in self.type_measures
+        }
+        self.categorize_store(store)
+        pokemons_by_type_dataframe = store.query(
+            "SELECT type AS Type, COUNT(*) AS Count FROM pokemon_type "
+            "GROUP BY type ORDER BY Count DESC, Type ASC"
+        )
+        stat_averages = ", ".join(
+            [
+                f"AVG(stats.{STAT_TABLE_COLUMNS[stat]}) AS {sql_identifier(stat)}"
+                for stat in TYPE_STATISTICS_COLUMNS
+            ]
+            + [
+                f"{expression} AS {sql_identifier(name)}"
+                for name, expression in measures.items()
+            ]
+        )
+        pokemons_type_statistics_dataframe = store.query(
+            f"SELECT pokemon_type.type AS Types, {stat_averages} "
+            "FROM pokemon_type "
+            "LEFT JOIN pokemon ON pokemon.id = pokemon_type.pokemon_id "
+            "LEFT JOIN stats ON stats.pokemon_id = pokemon_type.pokemon_id "
+            "GROUP BY pokemon_type.type ORDER BY pokemon_type.type"
+        ).astype({stat: "float64" for stat in TYPE_STATISTICS_COLUMNS})
+        for measure in self.type_measures:
+            values = pokemons_type_statistics_dataframe[measure.name]
+            if measure.function == "std":
+                values = values.astype("float64").clip(lower=0.0) ** 0.5
+            elif measure.function in ("sum", "min", "max"):
+                values = values.astype("Int64")
+            elif measure.function == "mean":
+                values = values.astype("float64")
+            pokemons_type_statistics_dataframe[measure.name] = values
+        pokemons_type_statistics_dataframe = pokemons_type_statistics_dataframe.round(2)
+        if column == "Base Experience":
+            ranking = "pokemon.base_experience"
+        else:
+            ranking = f"stats.{STAT_TABLE_COLUMNS[column]}"
+        top_ids = store.query(
+            "SELECT pokemon.id FROM pokemon "
+            "LEFT JOIN stats ON stats.pokemon_id = pokemon.id "
+            f"WHERE {ranking} IS NOT NULL ORDER BY {ranking} DESC, pokemon.id ASC "
+            "LIMIT ?",
+            (k,),
+        )["id"]
+        pokemons_top_dataframe = store.to_dataframe(top_ids.tolist())
+        self._log_dataframe("Pokemon count by type", pokemons_by_type_dataframe)
+        self._log_dataframe("Type statistics", pokemons_type_statistics_dataframe)
+        self._log_dataframe("Top Pokemon", pokemons_top_dataframe)
+        self.logger.info("Stored Pokemon data transformation complete.")
+        return (
+            pokemons_by_type_dataframe,
+            pokemons_type_statistics_dataframe,
+            pokemons_top_dataframe,
+        )
 
     def transform_pokemon_data(self, pokemon_dataframe: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         """
-        Transforms the Pokemon data.
+        Transforms the Pokemon data. The type counts, the type statistics and
+        the ``TYPE_STATISTICS_MEASURES`` share a single explode and grouped pass.
 
         Args:
             pokemon_dataframe (pd.DataFrame): The Pokemon data.
@@ -104,8 +569,11 @@ class DataTransformer:
         """
         self.logger.info("Transforming Pokemon data")
         pokemon_dataframe = self.categorize_experience(pokemon_dataframe)
-        pokemons_by_type_dataframe = self.count_pokemon_by_type(pokemon_dataframe)
-        pokemons_type_statistics_dataframe = self.calculate_type_statistics(pokemon_dataframe)
+        type_aggregates = self._aggregate_by_type(pokemon_dataframe)
+        pokemons_by_type_dataframe = self._type_counts(type_aggregates)
+        self._log_dataframe("Pokemon count by type", pokemons_by_type_dataframe)
+        pokemons_type_statistics_dataframe = self._type_statistics(type_aggregates)
+        self._log_dataframe("Type statistics", pokemons_type_statistics_dataframe)
         pokemons_top_5_dataframe = self.find_top_pokemon(pokemon_dataframe)
         self.logger.info("Pokemon data transformation complete.")
-        return pokemon_dataframe, pokemons_by_type_dataframe, pokemons_type_statistics_dataframe, pokemons_top_5_dataframe
\ No newline at end of file
+        return pokemon_dataframe, pokemons_by_type_dataframe, pokemons_type_statistics_dataframe, pokemons_top_5_dataframe
@@ -0,0 +1,26 @@
+import os
+import sys
+from logging import Logger
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.extractor import PokemonExtractor
+from tests.helpers import write_pokemon_dump
+
+
+@pytest.fixture
+def dump_dir(tmp_path):
+    """Writes a five-Pokémon dump in the api-data layout under data/."""
+    write_pokemon_dump(
+        tmp_path / "api-data" / "data" / "api" / "v2" / "pokemon",
+        {i: "grass" for i in range(1, 6)},
+    )
+    return tmp_path / "api-data"
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    """An extractor with the response cache disabled."""
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    return PokemonExtractor(Logger("test_extractor"))
@@ -0,0 +1,56 @@
+import json
+
+
+def pokemon_payload(
+    pokemon_id: int, pokemon_type: str = "grass", hp: int | None = None
+) -> dict:
+    return {
+        "id": pokemon_id,
+        "name": f"pokemon-{pokemon_id}",
+        "base_experience": 50 + pokemon_id,
+        "types": [{"slot": 1, "type": {"name": pokemon_type}}],
+        "stats": [
+            {"base_stat": hp or 40 + pokemon_id, "stat": {"name": "hp"}},
+            {"base_stat": 50, "stat": {"name": "attack"}},
+            {"base_stat": 60, "stat": {"name": "defense"}},
+        ],
+    }
+
+
+def write_pokemon_dump(api_dir, types: dict[int, str]):
+    """Writes the index and detail documents of a dump in the api-data layout."""
+    api_dir.mkdir(parents=True)
+    index = {
+        "count": len(types),
+        "next": None,
+        "previous": None,
+        "results": [
+            {"name": f"pokemon-{i}", "url": f"/api/v2/pokemon/{i}/"} for i in types
+        ],
+    }
+    (api_dir / "index.json").write_text(json.dumps(index))
+    for i, pokemon_type in types.items():
+        (api_dir / str(i)).mkdir()
+        (api_dir / str(i) / "index.json").write_text(
+            json.dumps(pokemon_payload(i, pokemon_type))
+        )
+    return api_dir
+
+
+def pokemon_record(pokemon_id):
+    return {
+        "ID": pokemon_id,
+        "Name": f"Pokemon-{pokemon_id}",
+        "Base Experience": pokemon_id * 10,
+        "Types": ["normal"],
+        "HP": pokemon_id,
+        "Attack": pokemon_id,
+        "Defense": pokemon_id,
+    }
+
+
+def list_entries(ids):
+    return [
+        {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+        for i in ids
+    ]
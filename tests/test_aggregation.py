@@ -0,0 +1,144 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.aggregation import (
+    AggregationEngine,
+    AggregationSpec,
+    Bucket,
+    Filter,
+    Measure,
+    parse_measure,
+    sql_identifier,
+)
+
+EXPERIENCE = Bucket.from_upper_bounds(
+    "Category", "Base Experience", {"Weak": 50, "Medium": 100, "Strong": None}
+)
+
+
+@pytest.fixture
+def pokemon():
+    return pd.DataFrame({
+        "ID": [1, 2, 3, 4, 5],
+        "Types": [["grass", "poison"], ["fire"], ["fire", "flying"], ["water"], ["grass"]],
+        "Base Experience": [64, 62, 240, 45, 150],
+        "HP": [45, 39, 78, 44, 60],
+        "Speed": [45, 65, 100, 43, 30],
+    })
+
+
+def test_specs_with_the_same_keys_share_a_pass_and_a_scan():
+    engine = AggregationEngine([EXPERIENCE])
+    specs = [
+        AggregationSpec("counts", ("Types",), (Measure("Count"),)),
+        AggregationSpec("stats", ("Types",), (Measure("HP", "HP", "mean"), Measure("N"))),
+        AggregationSpec("by_category", ("Types", "Category"), (Measure("Count"),)),
+    ]
+
+    passes = engine.plan(specs)
+
+    assert [p.specs for p in passes] == [("counts", "stats"), ("by_category",)]
+    assert len(passes[0].measures) == 2
+    assert passes[0].scan == passes[1].scan
+
+
+def test_measures_match_pandas(pokemon):
+    measures = tuple(
+        parse_measure(text)
+        for text in ["count", "HP mean", "HP median", "HP std", "Speed min", "Speed max", "Speed p90"]
+    )
+
+    result = AggregationEngine().run(
+        pokemon, [AggregationSpec("by_type", ("Types",), measures)]
+    )["by_type"]
+
+    grouped = pokemon.explode("Types").groupby("Types")
+    assert result.index.tolist() == ["fire", "flying", "grass", "poison", "water"]
+    assert result["count"].tolist() == grouped.size().tolist()
+    assert result["HP median"].tolist() == grouped["HP"].median().tolist()
+    pd.testing.assert_series_equal(
+        result["Speed p90"], grouped["Speed"].quantile(0.9), check_names=False
+    )
+    assert result["HP std"].isna().tolist() == [False, True, False, True, True]
+
+
+def test_buckets_and_filters(pokemon):
+    engine = AggregationEngine([EXPERIENCE])
+    spec = AggregationSpec(
+        "grass_or_fast",
+        ("Category",),
+        (Measure("Count"),),
+        (Filter("Speed", ">=", 40), Filter("Types", "contains", "grass")),
+    )
+
+    result = engine.run(pokemon, [spec])["grass_or_fast"]
+
+    assert result["Count"].to_dict() == {"Medium": 1}
+    assert "Category" not in pokemon
+
+
+def test_in_filters_with_list_values_share_a_pass(pokemon):
+    specs = [
+        AggregationSpec(
+            name, ("Types",), (Measure("Count"),), (Filter("ID", "in", [1, 3, 5]),)
+        )
+        for name in ("first", "second")
+    ]
+
+    passes = AggregationEngine().plan(specs)
+    result = AggregationEngine().run(pokemon, specs)
+
+    assert len(passes) == 1
+    assert result["first"]["Count"].to_dict() == {
+        "fire": 1,
+        "flying": 1,
+        "grass": 2,
+        "poison": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "upper_bounds",
+    [{"Weak": 50, "Strong": 100}, {"Strong": None, "Weak": 50}, {"Medium": 100, "Weak": 50, "Strong": None}],
+)
+def test_invalid_buckets_are_rejected(upper_bounds):
+    with pytest.raises(ValueError):
+        Bucket.from_upper_bounds("Category", "Base Experience", upper_bounds)
+
+
+def test_parse_measure():
+    assert parse_measure("Special Attack p25") == Measure(
+        "Special Attack p25", "Special Attack", "quantile", 0.25
+    )
+    assert parse_measure("HP max") == Measure("HP max", "HP", "max")
+    with pytest.raises(ValueError):
+        parse_measure("HP mode")
+
+
+def test_sql_quoting_escapes_labels_and_names():
+    bucket = Bucket.from_upper_bounds(
+        "Category", "Base Experience", {"Rookie's": 50, "Veteran": None}
+    )
+
+    assert bucket.sql_case("xp") == (
+        "CASE WHEN xp < 50.0 THEN 'Rookie''s' ELSE 'Veteran' END"
+    )
+    assert sql_identifier('HP "max"') == '"HP ""max"""'
+
+
+@pytest.mark.parametrize(
+    "measures",
+    [
+        (Measure("", "HP", "max"),),
+        (Measure("HP\nmax", "HP", "max"),),
+        (Measure("HP", "HP", "max"), Measure("HP", "HP", "min")),
+    ],
+)
+def test_invalid_measure_names_are_rejected(measures):
+    spec = AggregationSpec("stats", ("Types",), measures)
+
+    with pytest.raises(ValueError):
+        AggregationEngine().plan([spec])
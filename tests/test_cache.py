@@ -0,0 +1,90 @@
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.cache import ResponseCache
+
+URL = "https://pokeapi.co/api/v2/pokemon/25"
+
+
+def _response(body: bytes, status_code: int = 200, headers: dict | None = None):
+    response = MagicMock()
+    response.content = body
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=60, max_bytes=1024)
+    yield cache
+    cache.close()
+
+
+def test_fresh_entry_is_served_without_request(cache):
+    send_request = MagicMock(return_value=_response(b'{"id": 25}'))
+
+    assert cache.fetch(URL, send_request) == b'{"id": 25}'
+    assert cache.fetch(URL, send_request) == b'{"id": 25}'
+
+    assert send_request.call_count == 1
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(cache):
+    cache.ttl_seconds = 0
+    first = _response(b'{"id": 25}', headers={"ETag": '"abc"'})
+    not_modified = _response(b"", status_code=304)
+    send_request = MagicMock(side_effect=[first, not_modified])
+
+    cache.fetch(URL, send_request)
+    body = cache.fetch(URL, send_request)
+
+    assert body == b'{"id": 25}'
+    send_request.assert_called_with({"If-None-Match": '"abc"'})
+    assert cache.stats()["revalidations"] == 1
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    cache.put("a", b"x" * 400)
+    time.sleep(0.01)
+    cache.put("b", b"x" * 400)
+    time.sleep(0.01)
+    cache.get("a")
+    cache.put("c", b"x" * 400)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_cache_persists_between_instances(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = ResponseCache(path, ttl_seconds=60, max_bytes=1024)
+    first.put(URL, b"{}")
+    first.close()
+
+    second = ResponseCache(path, ttl_seconds=60, max_bytes=1024)
+    entry = second.get(URL)
+    second.close()
+
+    assert entry.body == b"{}"
+
+
+def test_zero_max_age_revalidates_a_fresh_entry(cache):
+    first = _response(b'{"id": 25}', headers={"ETag": '"abc"'})
+    not_modified = _response(b"", status_code=304)
+    send_request = MagicMock(side_effect=[first, not_modified])
+
+    cache.fetch(URL, send_request)
+    body = cache.fetch(URL, send_request, max_age=0)
+
+    assert body == b'{"id": 25}'
+    send_request.assert_called_with({"If-None-Match": '"abc"'})
+    assert cache.stats()["revalidations"] == 1
@@ -0,0 +1,71 @@
+import os
+import sys
+from logging import Logger
+from unittest.mock import patch
+
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.checkpoint import CheckpointStore
+from tests.helpers import list_entries, pokemon_record
+
+
+def test_checkpoint_persists_records_and_high_water_mark(tmp_path):
+    checkpoint = CheckpointStore(str(tmp_path), Logger("test_checkpoint"))
+    checkpoint.append([pokemon_record(3), pokemon_record(1)])
+
+    reloaded = CheckpointStore(str(tmp_path), Logger("test_checkpoint"))
+
+    assert reloaded.extracted_ids() == {1, 3}
+    assert reloaded.high_water_mark == 3
+    assert reloaded.records[3]["Types"] == ["normal"]
+
+
+def test_checkpoint_ignores_truncated_line(tmp_path):
+    checkpoint = CheckpointStore(str(tmp_path), Logger("test_checkpoint"))
+    checkpoint.append([pokemon_record(1)])
+    with open(checkpoint.records_path, "a", encoding="utf-8") as records_file:
+        records_file.write('{"ID": 2, "Na')
+
+    reloaded = CheckpointStore(str(tmp_path), Logger("test_checkpoint"))
+
+    assert reloaded.extracted_ids() == {1}
+
+
+def test_build_incremental_dataframe_fetches_only_missing(extractor, tmp_path):
+    checkpoint = CheckpointStore(str(tmp_path), Logger("test_checkpoint"))
+    checkpoint.append([pokemon_record(1), pokemon_record(2)])
+
+    with patch.object(
+        extractor, "_fetch_pokemon_record", side_effect=lambda p: pokemon_record(
+            extractor._extract_pokemon_id(p["url"])
+        )
+    ) as mock_fetch:
+        result = extractor.build_incremental_dataframe(
+            list_entries([1, 2, 3, 4]), checkpoint
+        )
+
+    assert result["ID"].tolist() == [1, 2, 3, 4]
+    assert sorted(
+        extractor._extract_pokemon_id(call.args[0]["url"])
+        for call in mock_fetch.call_args_list
+    ) == [3, 4]
+    assert CheckpointStore(str(tmp_path), Logger("test_checkpoint")).high_water_mark == 4
+
+
+def test_build_incremental_dataframe_resumes_after_crash(extractor, tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor.configs, "PAGE_SIZE", 2)
+    checkpoint = CheckpointStore(str(tmp_path), Logger("test_checkpoint"))
+
+    def crash_on_third(pokemon):
+        pokemon_id = extractor._extract_pokemon_id(pokemon["url"])
+        if pokemon_id == 3:
+            raise KeyboardInterrupt
+        return pokemon_record(pokemon_id)
+
+    with patch.object(extractor, "_fetch_pokemon_record", side_effect=crash_on_third):
+        with pytest.raises(KeyboardInterrupt):
+            extractor.build_incremental_dataframe(list_entries([1, 2, 3, 4]), checkpoint)
+
+    resumed = CheckpointStore(str(tmp_path), Logger("test_checkpoint"))
+    assert resumed.extracted_ids() == {1, 2}
@@ -0,0 +1,124 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.columnar import PokemonColumnBuilder
+
+RECORDS = [
+    {
+        "ID": 6,
+        "Name": "Charizard",
+        "Base Experience": 240,
+        "Types": ["fire", "flying"],
+        "HP": 78,
+        "Attack": 84,
+        "Defense": 78,
+    },
+    {
+        "ID": 1,
+        "Name": "Bulbasaur",
+        "Base Experience": 64,
+        "Types": ["grass", "poison"],
+        "HP": 45,
+        "Attack": 49,
+        "Defense": 49,
+    },
+    {
+        "ID": 4,
+        "Name": "Charmander",
+        "Base Experience": 62,
+        "Types": ["fire"],
+        "HP": 39,
+        "Attack": 52,
+        "Defense": None,
+    },
+]
+
+
+def test_to_dataframe_matches_list_of_dicts():
+    builder = PokemonColumnBuilder()
+    builder.extend(RECORDS)
+
+    result = builder.to_dataframe()
+    expected = pd.DataFrame(RECORDS).sort_values("ID", ignore_index=True)
+
+    assert result["ID"].tolist() == [1, 4, 6]
+    assert result["Name"].tolist() == expected["Name"].tolist()
+    assert result["Types"].tolist() == expected["Types"].tolist()
+    assert result["HP"].tolist() == expected["HP"].tolist()
+    assert result["Defense"].isna().tolist() == [False, True, False]
+
+
+def test_to_dataframe_uses_compact_dtypes():
+    builder = PokemonColumnBuilder()
+    builder.extend(RECORDS)
+
+    result = builder.to_dataframe()
+
+    assert result["HP"].dtype == np.uint8
+    assert result["Base Experience"].dtype == np.uint8
+    assert result["Defense"].dtype == "UInt8"
+
+
+def test_category_column():
+    builder = PokemonColumnBuilder({"ID": "int", "Name": "category"})
+    builder.extend(RECORDS)
+
+    result = builder.to_dataframe()
+
+    assert isinstance(result["Name"].dtype, pd.CategoricalDtype)
+    assert result["Name"].tolist() == ["Bulbasaur", "Charmander", "Charizard"]
+
+
+def test_empty_builder():
+    result = PokemonColumnBuilder().to_dataframe()
+
+    assert len(result) == 0
+    assert list(result.columns) == [
+        "ID",
+        "Name",
+        "Base Experience",
+        "Types",
+        "HP",
+        "Attack",
+        "Defense",
+        "Special Attack",
+        "Special Defense",
+        "Speed",
+        "Abilities",
+        "Height",
+        "Weight",
+    ]
+
+
+def test_batches_keep_missing_values_and_list_order():
+    records = [
+        dict(record, ID=record["ID"] + 10 * i) for i in range(3) for record in RECORDS
+    ]
+    builder = PokemonColumnBuilder(batch_size=2)
+    builder.extend(records)
+
+    result = builder.to_dataframe()
+    expected = pd.DataFrame(records).sort_values("ID", ignore_index=True)
+
+    assert len(builder) == 9
+    assert result["ID"].tolist() == expected["ID"].tolist()
+    assert result["Defense"].isna().tolist() == expected["Defense"].isna().tolist()
+    assert result["Types"].tolist() == expected["Types"].tolist()
+    assert result["Types"].iloc[0] is result["Types"].iloc[3]
+
+
+def test_list_layout_matches_the_list_column():
+    builder = PokemonColumnBuilder()
+    builder.extend(RECORDS)
+
+    offsets, values = builder.list_layout("Types")
+
+    assert offsets.tolist() == [0, 2, 3, 5]
+    assert values.tolist() == ["grass", "poison", "fire", "fire", "flying"]
+    assert sorted(values.categories) == ["fire", "flying", "grass", "poison"]
+    rows = [values[start:end].tolist() for start, end in zip(offsets, offsets[1:])]
+    assert rows == builder.to_dataframe()["Types"].tolist()
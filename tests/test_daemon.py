@@ -0,0 +1,100 @@
+import json
+import os
+import sys
+import urllib.error
+import urllib.request
+from logging import Logger
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from tests.helpers import pokemon_payload, write_pokemon_dump
+from src.daemon import RefreshDaemon
+from src.transformer import DataTransformer
+
+TYPES = {1: "grass", 2: "grass", 3: "fire", 4: "fire", 5: "water"}
+
+
+@pytest.fixture
+def api_dir(tmp_path):
+    return write_pokemon_dump(tmp_path / "api-data" / "api" / "v2" / "pokemon", TYPES)
+
+
+@pytest.fixture
+def daemon(tmp_path, api_dir, monkeypatch):
+    monkeypatch.setenv("SOURCE", "local")
+    monkeypatch.setenv("LOCAL_DUMP_PATH", str(tmp_path / "api-data"))
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setenv("DAEMON_PORT", "0")
+    daemon = RefreshDaemon(Logger("test_daemon"))
+    yield daemon
+    daemon.close()
+
+
+def test_refresh_recomputes_only_the_changed_types(daemon, api_dir):
+    assert daemon.refresh() == set(TYPES)
+    water = daemon.type_aggregates.loc["water"].copy()
+    (api_dir / "3" / "index.json").write_text(
+        json.dumps(pokemon_payload(3, TYPES[3], hp=100))
+    )
+
+    assert daemon.refresh() == {3}
+
+    expected = DataTransformer(Logger("test_daemon")).transform_pokemon_data(
+        daemon.transformed["pokemon"].drop(columns="Category")
+    )
+    pd.testing.assert_frame_equal(daemon.transformed["type_statistics"], expected[2])
+    pd.testing.assert_series_equal(daemon.type_aggregates.loc["water"], water)
+    assert daemon.refresh() == set()
+    assert daemon.status["refreshes"] == 3
+
+
+def test_reports_are_emitted_on_the_first_load(daemon, tmp_path):
+    daemon.refresh()
+
+    assert os.path.exists(tmp_path / "output" / "type_statistics.csv")
+
+
+def test_failed_refresh_keeps_serving_the_previous_data(daemon, api_dir):
+    daemon.refresh()
+    (api_dir / "index.json").unlink()
+    daemon.extractor.source._list_results = None
+
+    daemon._refresh_safely()
+
+    status_code, health = daemon.handle_request("/health")
+    assert status_code == 200
+    assert health["failed_refreshes"] == 1
+    assert "refresh" in health["last_error"]
+    assert daemon.handle_request("/types")[0] == 200
+
+
+def test_http_endpoint_serves_the_aggregates(daemon):
+    def get(path):
+        host, port = daemon.address
+        try:
+            with urllib.request.urlopen(f"http://{host}:{port}{path}") as response:
+                return response.status, json.load(response)
+        except urllib.error.HTTPError as e:
+            return e.code, json.load(e)
+
+    daemon.start()
+    assert get("/health")[0] == 503
+
+    daemon.refresh()
+
+    status_code, health = get("/health")
+    assert status_code == 200
+    assert health["status"] == "ok"
+    assert health["pokemon"] == 5
+    status_code, types = get("/types")
+    assert status_code == 200
+    assert {row["Type"]: row["Count"] for row in types} == {
+        "fire": 2,
+        "grass": 2,
+        "water": 1,
+    }
+    assert [row["Types"] for row in get("/statistics")[1]] == ["fire", "grass", "water"]
+    assert "http" in get("/metrics")[1]
+    assert get("/unknown")[0] == 404
@@ -0,0 +1,98 @@
+import os
+import sys
+from logging import Logger
+from unittest.mock import patch
+
+import pandas as pd
+import requests
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.dead_letter import DeadLetterQueue, patch_records
+from tests.helpers import list_entries, pokemon_record
+
+
+def test_dead_letters_persist_errors_and_attempts(tmp_path):
+    path = str(tmp_path / "dead_letter.json")
+    dead_letters = DeadLetterQueue(path, Logger("test_dead_letter"))
+    entry = list_entries([7])[0]
+
+    dead_letters.record(7, entry, requests.ConnectionError("reset"))
+    dead_letters.record(7, entry, requests.Timeout("timed out"))
+
+    reloaded = DeadLetterQueue(path, Logger("test_dead_letter")).entries()
+    assert len(reloaded) == 1
+    assert reloaded[0]["id"] == 7
+    assert reloaded[0]["error"] == "Timeout"
+    assert reloaded[0]["attempts"] == 2
+
+    assert dead_letters.resolve([7, 8]) == 1
+    assert not os.path.exists(path)
+
+
+def test_failed_fetches_are_dead_lettered(extractor, tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor.configs, "BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(extractor.configs, "BACKOFF_JITTER", 0)
+    extractor.dead_letters = DeadLetterQueue(
+        str(tmp_path / "dead_letter.json"), Logger("test_dead_letter")
+    )
+
+    def fail_on_even(pokemon_id):
+        if pokemon_id % 2 == 0:
+            raise requests.HTTPError("503 Server Error")
+        return pokemon_record(pokemon_id)
+
+    with patch.object(extractor, "_fetch_pokemon_projection", side_effect=fail_on_even):
+        result = extractor.build_pokemons_dataframe(list_entries([1, 2, 3, 4]))
+
+    assert result["ID"].tolist() == [1, 3]
+    assert [entry["id"] for entry in extractor.dead_letters.entries()] == [2, 4]
+    assert {entry["error"] for entry in extractor.dead_letters.entries()} == {"HTTPError"}
+
+
+def test_repair_refetches_only_dead_lettered_pokemon(extractor, tmp_path, monkeypatch):
+    monkeypatch.setattr(extractor.configs, "REPAIR_MAX_ATTEMPTS", 3)
+    monkeypatch.setattr(extractor.configs, "BACKOFF_FACTOR", 0)
+    monkeypatch.setattr(extractor.configs, "BACKOFF_JITTER", 0)
+    dead_letters = DeadLetterQueue(
+        str(tmp_path / "dead_letter.json"), Logger("test_dead_letter")
+    )
+    for pokemon_id, pokemon in zip([2, 4], list_entries([2, 4])):
+        dead_letters.record(pokemon_id, pokemon, requests.ConnectionError("reset"))
+    attempts = {2: 0, 4: 0}
+
+    def recover_on_second_attempt(pokemon_id):
+        attempts[pokemon_id] += 1
+        if pokemon_id == 4 or attempts[pokemon_id] < 2:
+            raise requests.ConnectionError("reset")
+        return pokemon_record(pokemon_id)
+
+    with patch.object(
+        extractor, "_fetch_pokemon_projection", side_effect=recover_on_second_attempt
+    ):
+        repaired = extractor.repair_dead_letters(dead_letters)
+
+    assert [record["ID"] for record in repaired] == [2]
+    assert extractor.dead_letters is None
+    assert attempts == {2: 2, 4: 3}
+    assert [(entry["id"], entry["attempts"]) for entry in dead_letters.entries()] == [
+        (4, 4)
+    ]
+
+
+def test_patch_records_replaces_and_inserts_by_id():
+    existing = pd.DataFrame({
+        "ID": [1, 3],
+        "Name": pd.Categorical(["Bulbasaur", "Venusaur"]),
+        "HP": [45, 0],
+    })
+    repaired = pd.DataFrame({
+        "ID": [2, 3],
+        "Name": pd.Categorical(["Ivysaur", "Venusaur"]),
+        "HP": [60, 80],
+    })
+
+    patched = patch_records(existing, repaired)
+
+    assert patched["ID"].tolist() == [1, 2, 3]
+    assert patched["HP"].tolist() == [45, 60, 80]
+    assert isinstance(patched["Name"].dtype, pd.CategoricalDtype)
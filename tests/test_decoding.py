@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
+
+from src import decoding
+from src.decoding import FieldSpec, ProjectedDecoder, compile_path, schema_columns
+
+PAYLOAD = {
+    "id": 25,
+    "name": "pikachu",
+    "types": [{"slot": 1, "type": {"name": "electric"}}],
+    "stats": [
+        {"base_stat": 35, "stat": {"name": "hp"}},
+        {"base_stat": 90, "stat": {"name": "speed"}},
+    ],
+    "sprites": {"front_default": "https://example.com/25.png"},
+}
+
+
+def test_compile_path_steps():
+    assert compile_path("stats[stat.name=hp].base_stat") == (
+        ("key", "stats"),
+        ("match", (("key", "stat"), ("key", "name")), "hp"),
+        ("key", "base_stat"),
+    )
+    assert compile_path("types[*].type.name")[1] == ("each",)
+
+
+@pytest.mark.parametrize("path", ["stats[hp]", "types..name", "[*]"])
+def test_compile_path_rejects_malformed_paths(path):
+    with pytest.raises(ValueError):
+        compile_path(path)
+
+
+def test_missing_fields_decode_to_none():
+    result = ProjectedDecoder().decode(json.dumps(PAYLOAD).encode())
+
+    assert result["Name"] == "Pikachu"
+    assert result["Types"] == ["electric"]
+    assert result["Speed"] == 90
+    assert result["Attack"] is None
+    assert result["Abilities"] is None
+    assert "sprites" not in result
+
+
+def test_custom_schema_and_stdlib_fallback(monkeypatch):
+    monkeypatch.setattr(decoding, "simdjson", None)
+    monkeypatch.setattr(decoding, "orjson", None)
+    schema = (
+        FieldSpec("ID", "id", "int"),
+        FieldSpec("Sprite", "sprites.front_default", "str"),
+    )
+    decoder = ProjectedDecoder(schema)
+
+    result = decoder.decode(json.dumps(PAYLOAD).encode())
+
+    assert decoder.backend == "json"
+    assert result == {"ID": 25, "Sprite": "https://example.com/25.png"}
+    assert schema_columns(schema) == {"ID": "int", "Sprite": "str"}
@@ -1,15 +1,14 @@
+import json
 import os
 import sys
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from logging import Logger
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 import requests
 
-from src.extractor import PokemonExtractor
 
 MOCK_POKEMON_LIST = [
     {"name": "bulbasaur", "url": "https://pokeapi.co/api/v2/pokemon/1/"},
@@ -19,23 +18,23 @@ MOCK_POKEMON_LIST = [
 MOCK_POKEMON_DETAILS = {"id": 25, "name": "pikachu", "base_experience": 112}
 
 
-@pytest.fixture
-def extractor():
-    return PokemonExtractor(Logger("test_extractor"))
-
-
-@patch("requests.get")
-def test_fetch_pokemon_data(mock_get, extractor):
+def test_fetch_pokemon_data(extractor):
     mock_response = MagicMock()
-    mock_response.json.return_value = {"results": MOCK_POKEMON_LIST}
-    mock_get.return_value = mock_response
+    mock_response.content = json.dumps({"results": MOCK_POKEMON_LIST}).encode()
 
-    result = extractor.fetch_pokemon_data(limit=2, offset=0)
+    with patch.object(
+        extractor.source.session, "get", return_value=mock_response
+    ) as mock_get:
+        result = extractor.fetch_pokemon_data(limit=2, offset=0)
 
     assert len(result) == 2
     assert result[0]["name"] == "bulbasaur"
     assert mock_get.call_count == 1
-    mock_get.assert_called_with("https://pokeapi.co/api/v2/pokemon?limit=2&offset=0")
+    mock_get.assert_called_with(
+        "https://pokeapi.co/api/v2/pokemon?limit=2&offset=0",
+        headers=None,
+        timeout=extractor.configs.REQUEST_TIMEOUT,
+    )
 
 
 def test_extract_pokemon_id(extractor):
@@ -44,30 +43,43 @@ def test_extract_pokemon_id(extractor):
     assert result == 25
 
 
-def test_fetch_pokemon_details(extractor):
+def test_fetch_pokemon_projection(extractor):
     mock_response = MagicMock()
-    mock_response.json.return_value = MOCK_POKEMON_DETAILS
+    mock_response.content = json.dumps(MOCK_POKEMON_DETAILS).encode()
 
-    with patch("requests.get", return_value=mock_response):
-        result = extractor._fetch_pokemon_details(25)
+    with patch.object(extractor.source.session, "get", return_value=mock_response):
+        result = extractor._fetch_pokemon_projection(25)
 
-    assert result["name"] == MOCK_POKEMON_DETAILS["name"]
-    assert result["base_experience"] == MOCK_POKEMON_DETAILS["base_experience"]
+    assert result["Name"] == MOCK_POKEMON_DETAILS["name"].capitalize()
+    assert result["Base Experience"] == MOCK_POKEMON_DETAILS["base_experience"]
 
 
-@patch("requests.get")
-def test_fetch_pokemon_details_error_handling(mock_get, extractor):
-    mock_get.side_effect = requests.exceptions.RequestException("API Error")
+def test_fetch_pokemon_projection_error_handling(extractor):
+    with patch.object(
+        extractor.source.session,
+        "get",
+        side_effect=requests.exceptions.RequestException("API Error"),
+    ):
+        with pytest.raises(requests.exceptions.RequestException):
+            extractor._fetch_pokemon_projection(25)
 
-    with pytest.raises(requests.exceptions.RequestException):
-        extractor._fetch_pokemon_details(25)
 
+def test_fetch_pokemon_projection_raises_http_error(extractor):
+    mock_response = MagicMock()
+    mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("429")
 
-@patch("requests.get")
-def test_build_pokemons_dataframe_error_handling(mock_get, extractor):
-    mock_get.side_effect = requests.exceptions.RequestException("API Error")
+    with patch.object(extractor.source.session, "get", return_value=mock_response):
+        with pytest.raises(requests.exceptions.HTTPError):
+            extractor._fetch_pokemon_projection(25)
 
-    result = extractor.build_pokemons_dataframe(MOCK_POKEMON_LIST)
+
+def test_build_pokemons_dataframe_error_handling(extractor):
+    with patch.object(
+        extractor.source.session,
+        "get",
+        side_effect=requests.exceptions.RequestException("API Error"),
+    ):
+        result = extractor.build_pokemons_dataframe(MOCK_POKEMON_LIST)
 
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 0  # Empty dataframe due to errors
@@ -92,10 +104,148 @@ def test_extract_pokemon_id_invalid_url(extractor, url):
 @pytest.mark.parametrize("limit,offset", [(100, 0), (50, 50), (200, 0)])
 def test_fetch_pokemon_data_pagination(extractor, limit, offset):
     mock_response = MagicMock()
-    mock_response.json.return_value = {"results": MOCK_POKEMON_LIST}
+    mock_response.content = json.dumps({"results": MOCK_POKEMON_LIST}).encode()
 
-    with patch("requests.get", return_value=mock_response) as mock_get:
+    with patch.object(
+        extractor.source.session, "get", return_value=mock_response
+    ) as mock_get:
         extractor.fetch_pokemon_data(limit, offset)
 
     expected_url = f"https://pokeapi.co/api/v2/pokemon?limit={limit}&offset={offset}"
-    mock_get.assert_called_with(expected_url)
+    mock_get.assert_called_with(
+        expected_url, headers=None, timeout=extractor.configs.REQUEST_TIMEOUT
+    )
+
+
+def _mock_pokemon_details(pokemon_id):
+    return {
+        "id": pokemon_id,
+        "name": f"pokemon-{pokemon_id}",
+        "base_experience": pokemon_id * 10,
+        "types": [{"type": {"name": "normal"}}],
+        "stats": [{"stat": {"name": "hp"}, "base_stat": pokemon_id}],
+    }
+
+
+def _mock_pokemon_body(url):
+    return json.dumps(_mock_pokemon_details(int(url.rsplit("/", 1)[1]))).encode()
+
+
+def test_build_pokemons_dataframe_keeps_id_order(extractor):
+    pokemons_data = [
+        {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+        for i in [5, 3, 1, 4, 2]
+    ]
+
+    with patch.object(extractor.source, "get_bytes", side_effect=_mock_pokemon_body):
+        result = extractor.build_pokemons_dataframe(pokemons_data)
+
+    assert result["ID"].tolist() == [1, 2, 3, 4, 5]
+    assert result["HP"].tolist() == [1, 2, 3, 4, 5]
+
+
+def test_build_pokemons_dataframe_logs_failed_pokemon(extractor):
+    def fetch_body(url):
+        if url.endswith("/2"):
+            raise requests.exceptions.RequestException("API Error")
+        return _mock_pokemon_body(url)
+
+    extractor.logger = MagicMock()
+    with patch.object(extractor.source, "get_bytes", side_effect=fetch_body):
+        result = extractor.build_pokemons_dataframe(MOCK_POKEMON_LIST)
+
+    assert result["ID"].tolist() == [1]
+    extractor.logger.error.assert_called_once()
+    assert "ivysaur" in extractor.logger.error.call_args[0][0]
+
+
+def _mock_list_pages(total, page_size):
+    pages = {}
+    for offset in range(0, total, page_size):
+        next_offset = offset + page_size
+        pages[f"https://pokeapi.co/api/v2/pokemon?limit={page_size}&offset={offset}"] = {
+            "next": f"https://pokeapi.co/api/v2/pokemon?limit={page_size}&offset={next_offset}"
+            if next_offset < total
+            else None,
+            "results": [
+                {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+                for i in range(offset + 1, min(next_offset, total) + 1)
+            ],
+        }
+    return pages
+
+
+def test_iter_pokemon_data_follows_next_links(extractor):
+    pages = _mock_list_pages(total=7, page_size=3)
+
+    with patch.object(extractor, "_get_json", side_effect=pages.__getitem__) as mock_get:
+        result = list(extractor.iter_pokemon_data(page_size=3))
+
+    assert [pokemon["name"] for pokemon in result] == [
+        f"pokemon-{i}" for i in range(1, 8)
+    ]
+    assert mock_get.call_count == 3
+
+
+def test_iter_pokemon_data_stops_at_max_count(extractor):
+    pages = _mock_list_pages(total=7, page_size=3)
+
+    with patch.object(extractor, "_get_json", side_effect=pages.__getitem__) as mock_get:
+        result = list(extractor.iter_pokemon_data(page_size=3, max_count=4))
+
+    assert len(result) == 4
+    assert mock_get.call_count == 2
+
+
+def test_iter_pokemon_records_yields_built_records(extractor):
+    pages = _mock_list_pages(total=5, page_size=2)
+
+    with patch.object(extractor, "_get_json", side_effect=pages.__getitem__), patch.object(
+        extractor.source, "get_bytes", side_effect=_mock_pokemon_body
+    ):
+        result = list(extractor.iter_pokemon_records(page_size=2))
+
+    assert [record["ID"] for record in result] == [1, 2, 3, 4, 5]
+
+
+def test_build_pokemon_dict_projects_schema_fields(extractor):
+    details = {
+        "id": 6,
+        "name": "charizard",
+        "base_experience": 240,
+        "height": 17,
+        "weight": 905,
+        "types": [{"type": {"name": "fire"}}, {"type": {"name": "flying"}}],
+        "abilities": [{"ability": {"name": "blaze"}}],
+        "stats": [
+            {"stat": {"name": name}, "base_stat": value}
+            for name, value in [
+                ("hp", 78),
+                ("attack", 84),
+                ("defense", 78),
+                ("special-attack", 109),
+                ("special-defense", 85),
+                ("speed", 100),
+            ]
+        ],
+        "moves": [{"move": {"name": "scratch"}}],
+    }
+
+    result = extractor._build_pokemon_dict(details)
+
+    assert result == {
+        "ID": 6,
+        "Name": "Charizard",
+        "Base Experience": 240,
+        "Types": ["fire", "flying"],
+        "HP": 78,
+        "Attack": 84,
+        "Defense": 78,
+        "Special Attack": 109,
+        "Special Defense": 85,
+        "Speed": 100,
+        "Abilities": ["blaze"],
+        "Height": 17,
+        "Weight": 905,
+    }
+    assert extractor.decoder.decode(json.dumps(details).encode()) == result
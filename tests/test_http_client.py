@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+from unittest.mock import Mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from config import Settings
+from src.http_client import RETRY_STATUS_CODES, TokenBucketRateLimiter, build_session
+
+
+def test_rate_limiter_allows_burst_then_throttles():
+    limiter = TokenBucketRateLimiter(rate=20, burst=3)
+
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.acquire()
+    burst_elapsed = time.monotonic() - start
+    limiter.acquire()
+    total_elapsed = time.monotonic() - start
+
+    assert burst_elapsed < 0.04
+    assert total_elapsed >= 0.04
+
+
+def test_rate_limiter_disabled():
+    limiter = TokenBucketRateLimiter(rate=0, burst=1)
+
+    start = time.monotonic()
+    for _ in range(100):
+        limiter.acquire()
+
+    assert time.monotonic() - start < 0.05
+
+
+def test_build_session_retries_throttled_and_server_errors():
+    configs = Settings(MAX_RETRIES=3, MAX_WORKERS=4)
+
+    session = build_session(configs)
+    adapter = session.get_adapter("https://pokeapi.co/api/v2")
+
+    assert adapter.max_retries.total == 3
+    assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUS_CODES)
+    assert adapter.max_retries.respect_retry_after_header
+    assert adapter._pool_maxsize == 4
+
+
+def test_retries_take_a_token_from_the_rate_limiter():
+    rate_limiter = Mock()
+    session = build_session(Settings(BACKOFF_FACTOR=0), rate_limiter)
+    retry = session.get_adapter("https://pokeapi.co/api/v2").max_retries
+
+    retry = retry.increment("GET", "/api/v2/pokemon/1")
+    retry.sleep()
+
+    assert retry.rate_limiter is rate_limiter
+    rate_limiter.acquire.assert_called_once()
@@ -0,0 +1,270 @@
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT_DIR)
+import main
+
+
+def test_non_plotting_stages_do_not_import_plotting_libraries():
+    code = (
+        "import sys, src\n"
+        "from src import PokemonExtractor, DataTransformer\n"
+        "assert 'matplotlib' not in sys.modules\n"
+        "assert 'seaborn' not in sys.modules\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True, text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture
+def cli(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT_DIR)
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setattr(main.logging.config, "fileConfig", lambda *args, **kwargs: None)
+    return main
+
+
+def test_transform_stage_reads_and_writes_artifacts(tmp_path, cli):
+    pd.DataFrame({
+        "ID": [1, 4],
+        "Name": ["Bulbasaur", "Charmander"],
+        "Base Experience": [64, 62],
+        "Types": [["grass", "poison"], ["fire"]],
+        "HP": [45, 39],
+        "Attack": [49, 52],
+        "Defense": [49, 43],
+    }).to_pickle(tmp_path / main.RECORDS_ARTIFACT)
+
+    exit_code = cli.main(["transform", "--data-dir", str(tmp_path)])
+
+    transformed = pd.read_pickle(tmp_path / main.TRANSFORMED_ARTIFACT)
+    assert exit_code == 0
+    assert transformed["pokemon"]["Category"].tolist() == ["Medium", "Medium"]
+    assert len(transformed["by_type"]) == 3
+
+
+def test_transform_stage_fills_the_store(tmp_path, cli, monkeypatch):
+    from src.store import PokemonStore
+
+    monkeypatch.setenv("STORE_ENABLED", "true")
+    monkeypatch.setenv("STORE_PATH", str(tmp_path / "pokemon.sqlite3"))
+    pd.DataFrame({
+        "ID": [1, 6],
+        "Name": ["Bulbasaur", "Charizard"],
+        "Base Experience": [64, 240],
+        "Types": [["grass", "poison"], ["fire", "flying"]],
+        "HP": [45, 78],
+        "Attack": [49, 84],
+        "Defense": [49, 78],
+    }).to_pickle(tmp_path / main.RECORDS_ARTIFACT)
+
+    assert cli.main(["transform", "--data-dir", str(tmp_path)]) == 0
+
+    store = PokemonStore(str(tmp_path / "pokemon.sqlite3"))
+    assert store.pokemon_by_type("fire")["Category"].tolist() == ["Strong"]
+    store.close()
+
+
+def test_transform_stage_pushes_the_aggregations_down_to_the_store(
+    tmp_path, cli, monkeypatch
+):
+    pd.DataFrame({
+        "ID": [1, 4, 6],
+        "Name": ["Bulbasaur", "Charmander", "Charizard"],
+        "Base Experience": [64, 62, 240],
+        "Types": [["grass", "poison"], ["fire"], ["fire", "flying"]],
+        "HP": [45, 39, 78],
+        "Attack": [49, 52, 84],
+        "Defense": [49, 43, 78],
+    }).to_pickle(tmp_path / main.RECORDS_ARTIFACT)
+    assert cli.main(["transform", "--data-dir", str(tmp_path)]) == 0
+    expected = pd.read_pickle(tmp_path / main.TRANSFORMED_ARTIFACT)
+    monkeypatch.setenv("STORE_ENABLED", "true")
+    monkeypatch.setenv("STORE_PUSHDOWN", "true")
+    monkeypatch.setenv("STORE_PATH", str(tmp_path / "pokemon.sqlite3"))
+
+    assert cli.main(["transform", "--data-dir", str(tmp_path)]) == 0
+
+    transformed = pd.read_pickle(tmp_path / main.TRANSFORMED_ARTIFACT)
+    for name in ("by_type", "type_statistics"):
+        pd.testing.assert_frame_equal(
+            transformed[name], expected[name], check_dtype=False
+        )
+    assert transformed["top_5"]["ID"].tolist() == expected["top_5"]["ID"].tolist()
+    assert transformed["pokemon"]["Category"].tolist() == (
+        expected["pokemon"]["Category"].astype(str).tolist()
+    )
+
+
+def test_stage_writes_metrics_report(tmp_path, cli, monkeypatch):
+    monkeypatch.setenv("PROFILE_STAGES", '["transform"]')
+    pd.DataFrame({
+        "ID": [1],
+        "Name": ["Bulbasaur"],
+        "Base Experience": [64],
+        "Types": [["grass", "poison"]],
+        "HP": [45],
+        "Attack": [49],
+        "Defense": [49],
+    }).to_pickle(tmp_path / main.RECORDS_ARTIFACT)
+
+    cli.main(["transform", "--data-dir", str(tmp_path)])
+
+    metrics_dir = tmp_path / "output" / main.METRICS_SUBDIR
+    with open(metrics_dir / "metrics_transform.json") as metrics_file:
+        metrics = json.load(metrics_file)
+    assert set(metrics["stages"]) == {"startup", "transform"}
+    assert metrics["stages"]["transform"]["wall_seconds"] >= 0
+    assert (metrics_dir / "profile_transform.prof").exists()
+
+
+def test_report_stage_keeps_the_metrics_of_earlier_stages(tmp_path, cli):
+    pd.DataFrame({
+        "ID": [1, 4],
+        "Name": ["Bulbasaur", "Charmander"],
+        "Base Experience": [64, 62],
+        "Types": [["grass", "poison"], ["fire"]],
+        "HP": [45, 39],
+        "Attack": [49, 52],
+        "Defense": [49, 43],
+    }).to_pickle(tmp_path / main.RECORDS_ARTIFACT)
+
+    assert cli.main(["transform", "--data-dir", str(tmp_path)]) == 0
+    assert cli.main(["report", "--data-dir", str(tmp_path)]) == 0
+    assert cli.main(["report", "--data-dir", str(tmp_path)]) == 0
+
+    metrics_dir = tmp_path / "output" / main.METRICS_SUBDIR
+    assert sorted(os.listdir(metrics_dir)) == [
+        "metrics_report.json",
+        "metrics_transform.json",
+    ]
+
+
+def test_missing_artifact_fails_stage(tmp_path, cli):
+    assert cli.main(["report", "--data-dir", str(tmp_path)]) == 1
+
+
+def test_merge_stage_combines_shard_partials(tmp_path, cli):
+    partials_dir = tmp_path / main.PARTIALS_DIR
+    partials_dir.mkdir()
+    pd.DataFrame({"ID": [2, 4], "Name": ["Ivysaur", "Charmander"]}).to_pickle(
+        partials_dir / "pokemon_records.shard-0-of-2.pkl"
+    )
+    pd.DataFrame({"ID": [1, 3], "Name": ["Bulbasaur", "Venusaur"]}).to_pickle(
+        partials_dir / "pokemon_records.shard-1-of-2.pkl"
+    )
+
+    exit_code = cli.main(["merge", "--data-dir", str(tmp_path)])
+
+    merged = pd.read_pickle(tmp_path / main.RECORDS_ARTIFACT)
+    assert exit_code == 0
+    assert merged["ID"].tolist() == [1, 2, 3, 4]
+    assert not (tmp_path / f"{main.RECORDS_ARTIFACT}.tmp").exists()
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["transform", "--shard", "0/2"],
+        ["extract", "--shard", "2/2"],
+        ["report", "--pipelined"],
+    ],
+)
+def test_invalid_shard_arguments_are_rejected(cli, argv):
+    with pytest.raises(SystemExit):
+        cli.main(argv)
+
+
+def test_repair_stage_patches_the_extracted_records(tmp_path, cli, monkeypatch):
+    from src.dead_letter import DeadLetterQueue
+    from src.extractor import PokemonExtractor
+
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    pd.DataFrame({"ID": [1, 3], "Name": ["Bulbasaur", "Venusaur"]}).to_pickle(
+        tmp_path / main.RECORDS_ARTIFACT
+    )
+    DeadLetterQueue(str(tmp_path / main.DEAD_LETTER_ARTIFACT), main.logger).record(
+        2,
+        {"name": "ivysaur", "url": "https://pokeapi.co/api/v2/pokemon/2/"},
+        TimeoutError("timed out"),
+    )
+    monkeypatch.setattr(
+        PokemonExtractor,
+        "_fetch_pokemon_projection",
+        lambda self, pokemon_id: {"ID": pokemon_id, "Name": "Ivysaur"},
+    )
+
+    exit_code = cli.main(["repair", "--data-dir", str(tmp_path)])
+
+    patched = pd.read_pickle(tmp_path / main.RECORDS_ARTIFACT)
+    assert exit_code == 0
+    assert patched["ID"].tolist() == [1, 2, 3]
+    assert not (tmp_path / main.DEAD_LETTER_ARTIFACT).exists()
+
+
+def test_repair_stage_patches_the_records_of_a_run(tmp_path, cli, monkeypatch):
+    import requests
+
+    from src.extractor import PokemonExtractor
+
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    monkeypatch.setattr(cli, "report", lambda transformed: True)
+    monkeypatch.setattr(
+        PokemonExtractor,
+        "iter_pokemon_data",
+        lambda self, page_size=None, max_count=None: iter([
+            {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+            for i in (1, 2, 3)
+        ]),
+    )
+    unreachable = {2}
+
+    def fetch(self, pokemon_id):
+        if pokemon_id in unreachable:
+            raise requests.ConnectionError("reset")
+        return {
+            "ID": pokemon_id,
+            "Name": f"Pokemon-{pokemon_id}",
+            "Base Experience": 60 + pokemon_id,
+            "Types": ["normal"],
+            "HP": 40,
+            "Attack": 50,
+            "Defense": 60,
+        }
+
+    monkeypatch.setattr(PokemonExtractor, "_fetch_pokemon_projection", fetch)
+
+    assert cli.main(["run", "--data-dir", str(tmp_path)]) == 0
+    assert pd.read_pickle(tmp_path / main.RECORDS_ARTIFACT)["ID"].tolist() == [1, 3]
+
+    unreachable.clear()
+    exit_code = cli.main(["repair", "--data-dir", str(tmp_path)])
+
+    patched = pd.read_pickle(tmp_path / main.RECORDS_ARTIFACT)
+    assert exit_code == 0
+    assert patched["ID"].tolist() == [1, 2, 3]
+    assert not (tmp_path / main.DEAD_LETTER_ARTIFACT).exists()
+
+
+def test_repair_without_records_points_to_the_previous_stage(tmp_path, cli, caplog):
+    from src.dead_letter import DeadLetterQueue
+
+    DeadLetterQueue(str(tmp_path / main.DEAD_LETTER_ARTIFACT), main.logger).record(
+        2,
+        {"name": "ivysaur", "url": "https://pokeapi.co/api/v2/pokemon/2/"},
+        TimeoutError("timed out"),
+    )
+
+    exit_code = cli.main(["repair", "--data-dir", str(tmp_path)])
+
+    assert exit_code == 1
+    assert "Missing input artifact" in caplog.text
@@ -0,0 +1,46 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.metrics import MetricsRecorder
+
+
+def test_stage_timings_and_memory():
+    metrics = MetricsRecorder(trace_memory=True)
+
+    with metrics.stage("transform"):
+        data = [0] * 100_000
+
+    stage = metrics.to_dict()["stages"]["transform"]
+    assert stage["wall_seconds"] >= 0
+    assert stage["peak_traced_bytes"] >= 800_000
+    del data
+
+
+def test_request_counters_and_histogram():
+    metrics = MetricsRecorder()
+
+    metrics.record_request(0.003, 100, 200)
+    metrics.record_request(0.2, 300, 200, retries=2)
+    metrics.record_error("request", TimeoutError())
+    metrics.record_error("request", TimeoutError())
+    metrics.set_cache_stats({"hits": 1, "misses": 2, "hit_rate": 0.3333})
+
+    report = metrics.to_dict()
+    assert report["http"]["requests"] == 2
+    assert report["http"]["bytes_downloaded"] == 400
+    assert report["http"]["retries"] == 2
+    assert report["http"]["status_codes"] == {"200": 2}
+    assert report["http"]["latency_histogram"]["<=5ms"] == 1
+    assert report["http"]["latency_histogram"]["<=250ms"] == 1
+    assert report["errors"] == {"request": {"TimeoutError": 2}}
+    assert report["cache"]["hit_rate"] == 0.3333
+
+
+def test_write_is_json(tmp_path):
+    metrics = MetricsRecorder()
+
+    path = metrics.write(str(tmp_path), "metrics_run.json")
+
+    assert os.listdir(tmp_path) == ["metrics_run.json"]
+    assert path.endswith("metrics_run.json")
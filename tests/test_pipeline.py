@@ -0,0 +1,135 @@
+import os
+import sys
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.columnar import PokemonColumnBuilder
+from src.pipeline import PipelineCancelled, PipelineError, StreamingPipeline
+from src.transformer import DataTransformer
+
+
+def _record(pokemon_id, base_experience, types):
+    return {
+        "ID": pokemon_id,
+        "Name": f"Pokemon {pokemon_id}",
+        "Base Experience": base_experience,
+        "Types": types,
+        "HP": 40 + pokemon_id,
+        "Attack": 50 + pokemon_id % 7,
+        "Defense": 45 + pokemon_id % 5,
+        "Special Attack": 60,
+        "Special Defense": 60,
+        "Speed": 70,
+        "Abilities": ["overgrow"],
+        "Height": 7,
+        "Weight": 69,
+    }
+
+
+RECORDS = [
+    _record(pokemon_id, (pokemon_id * 37) % 250, types)
+    for pokemon_id, types in zip(
+        range(1, 21), [["grass", "poison"], ["fire"], ["water"], ["fire", "flying"]] * 5
+    )
+]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setenv("PIPELINE_CHUNK_SIZE", "3")
+    monkeypatch.setenv("PIPELINE_QUEUE_SIZE", "1")
+
+
+def test_streamed_results_match_the_barrier_transformation():
+    builder = PokemonColumnBuilder()
+    builder.extend(RECORDS)
+    pokemon, by_type, type_statistics, top_5 = DataTransformer(
+        Mock()
+    ).transform_pokemon_data(builder.to_dataframe())
+
+    streamed = StreamingPipeline(Mock()).run(iter(RECORDS))
+
+    pd.testing.assert_frame_equal(streamed["pokemon"], pokemon)
+    pd.testing.assert_frame_equal(streamed["by_type"], by_type)
+    pd.testing.assert_frame_equal(streamed["type_statistics"], type_statistics)
+    pd.testing.assert_frame_equal(streamed["top_5"], top_5)
+
+
+def test_extraction_error_is_raised_with_its_stage():
+    def records():
+        yield from RECORDS[:4]
+        raise ConnectionError("API unreachable")
+
+    with pytest.raises(PipelineError) as excinfo:
+        StreamingPipeline(Mock()).run(records())
+
+    assert excinfo.value.stage == "extract"
+    assert isinstance(excinfo.value.__cause__, ConnectionError)
+
+
+def test_transformation_error_cancels_the_bounded_extraction(monkeypatch):
+    produced = []
+    closed = []
+
+    def records():
+        try:
+            while True:
+                produced.append(len(produced))
+                yield _record(len(produced), 64, ["grass"])
+        finally:
+            closed.append(True)
+
+    def fail(self, state, chunk):
+        raise ValueError("bad chunk")
+
+    monkeypatch.setattr(DataTransformer, "aggregate_chunk", fail)
+
+    with pytest.raises(PipelineError) as excinfo:
+        StreamingPipeline(Mock()).run(records())
+
+    assert excinfo.value.stage == "transform"
+    # The queue holds a single chunk, so the extraction stops a few chunks in.
+    assert len(produced) <= 4 * 3
+    assert closed == [True]
+
+
+def test_cancel_stops_the_stream():
+    pipeline = StreamingPipeline(Mock())
+
+    def records():
+        yield from RECORDS[:6]
+        pipeline.cancel()
+        yield from RECORDS[6:]
+
+    with pytest.raises(PipelineCancelled):
+        pipeline.run(records())
+
+
+def test_streamed_type_measures_match_the_barrier_transformation(monkeypatch):
+    monkeypatch.setenv(
+        "TYPE_STATISTICS_MEASURES",
+        '["HP max", "Attack std", "Defense sum", "Speed mean", "count", "HP min"]',
+    )
+    builder = PokemonColumnBuilder()
+    builder.extend(RECORDS)
+    _, _, type_statistics, _ = DataTransformer(Mock()).transform_pokemon_data(
+        builder.to_dataframe()
+    )
+
+    streamed = StreamingPipeline(Mock()).run(iter(RECORDS))
+
+    pd.testing.assert_frame_equal(
+        streamed["type_statistics"], type_statistics, check_dtype=False
+    )
+    assert streamed["type_statistics"].to_csv(index=False) == type_statistics.to_csv(
+        index=False
+    )
+
+
+def test_streamed_median_measure_is_a_configuration_error(monkeypatch):
+    monkeypatch.setenv("TYPE_STATISTICS_MEASURES", '["HP median"]')
+
+    with pytest.raises(ValueError, match="HP median"):
+        StreamingPipeline(Mock()).run(iter(RECORDS))
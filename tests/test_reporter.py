@@ -0,0 +1,166 @@
+import importlib.util
+import os
+import sys
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from src.reporter import DataReporter
+
+POKEMON_DATAFRAME = pd.DataFrame({
+    "ID": [1, 4, 6],
+    "Name": ["Bulbasaur", "Charmander", "Charizard"],
+    "Base Experience": [64, 62, 240],
+    "Types": [["grass", "poison"], ["fire"], ["fire", "flying"]],
+    "HP": [45, 39, 78],
+    "Attack": [49, 52, 84],
+    "Defense": [49, 43, 78],
+    "Category": pd.Categorical(["Medium", "Medium", "Strong"]),
+})
+BY_TYPE_DATAFRAME = pd.DataFrame({"Type": ["fire", "grass"], "Count": [2, 1]})
+STATISTICS_DATAFRAME = pd.DataFrame({"Types": ["fire", "grass"], "HP": [58.5, 45.0]})
+
+
+def listdir_reports(output_dir):
+    return [report for report in os.listdir(output_dir) if not report.startswith(".")]
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("OUTPUT_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_generate_all_reports_csv(output_dir):
+    logger = Mock()
+    reporter = DataReporter(logger)
+
+    result = reporter.generate_all_reports(
+        BY_TYPE_DATAFRAME,
+        POKEMON_DATAFRAME.head(2),
+        STATISTICS_DATAFRAME,
+        pokemon_dataframe=POKEMON_DATAFRAME,
+    )
+
+    assert result
+    logger.error.assert_not_called()
+    assert sorted(listdir_reports(output_dir)) == [
+        "graph_pokemon_by_category.png",
+        "graph_pokemon_by_type.png",
+        "graph_stat_distribution.png",
+        "pokemon_records.csv",
+        "top_5_pokemon.csv",
+        "type_statistics.csv",
+    ]
+    assert pd.read_csv(output_dir / "type_statistics.csv").equals(STATISTICS_DATAFRAME)
+
+
+def test_unchanged_reports_are_skipped(output_dir):
+    DataReporter(Mock()).generate_all_reports(
+        BY_TYPE_DATAFRAME, POKEMON_DATAFRAME.head(2), STATISTICS_DATAFRAME
+    )
+    written_at = os.stat(output_dir / "top_5_pokemon.csv").st_mtime_ns
+    changed_statistics = STATISTICS_DATAFRAME.assign(HP=[60.0, 45.0])
+
+    logger = Mock()
+    result = DataReporter(logger).generate_all_reports(
+        BY_TYPE_DATAFRAME, POKEMON_DATAFRAME.head(2), changed_statistics
+    )
+
+    assert result
+    assert os.stat(output_dir / "top_5_pokemon.csv").st_mtime_ns == written_at
+    assert pd.read_csv(output_dir / "type_statistics.csv").equals(changed_statistics)
+    skipped = [
+        call.args[0]
+        for call in logger.info.call_args_list
+        if call.args[0].startswith("Skipping")
+    ]
+    assert len(skipped) == 2
+
+
+def test_stale_reports_are_pruned(output_dir):
+    (output_dir / "unrelated.csv").write_text("stale")
+    DataReporter(Mock()).generate_all_reports(
+        BY_TYPE_DATAFRAME,
+        POKEMON_DATAFRAME.head(2),
+        STATISTICS_DATAFRAME,
+        leaderboards={"top_5_by_hp": POKEMON_DATAFRAME.head(2)},
+    )
+    assert "top_5_by_hp.csv" in listdir_reports(output_dir)
+
+    result = DataReporter(Mock()).generate_all_reports(
+        BY_TYPE_DATAFRAME, POKEMON_DATAFRAME.head(2), STATISTICS_DATAFRAME
+    )
+
+    assert result
+    assert sorted(listdir_reports(output_dir)) == [
+        "graph_pokemon_by_type.png",
+        "top_5_pokemon.csv",
+        "type_statistics.csv",
+    ]
+
+
+def test_modified_report_is_regenerated_and_validated(output_dir):
+    DataReporter(Mock()).generate_all_reports(
+        BY_TYPE_DATAFRAME, POKEMON_DATAFRAME.head(2), STATISTICS_DATAFRAME
+    )
+    (output_dir / "type_statistics.csv").write_text("tampered")
+
+    reporter = DataReporter(Mock())
+    assert not reporter._validate_reports_directory()
+    assert reporter.generate_all_reports(
+        BY_TYPE_DATAFRAME, POKEMON_DATAFRAME.head(2), STATISTICS_DATAFRAME
+    )
+    assert pd.read_csv(output_dir / "type_statistics.csv").equals(STATISTICS_DATAFRAME)
+
+
+@pytest.mark.parametrize("output_format", ["parquet", "feather"])
+def test_export_pokemon_records_columnar_formats(output_dir, monkeypatch, output_format):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setenv("OUTPUT_FORMAT", output_format)
+    reporter = DataReporter(Mock())
+
+    reporter.export_pokemon_records(POKEMON_DATAFRAME)
+
+    path = output_dir / f"pokemon_records.{output_format}"
+    result = getattr(pd, f"read_{output_format}")(path)
+    assert result["Name"].tolist() == POKEMON_DATAFRAME["Name"].tolist()
+    assert list(result["Types"].iloc[0]) == ["grass", "poison"]
+
+
+def test_failed_write_leaves_no_partial_file(output_dir):
+    reporter = DataReporter(Mock())
+    (output_dir / "type_statistics.csv").write_text("previous")
+
+    def failing_write(path):
+        with open(path, "w") as partial_file:
+            partial_file.write("partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        reporter._write_atomically("type_statistics.csv", failing_write)
+
+    assert os.listdir(output_dir) == ["type_statistics.csv"]
+    assert (output_dir / "type_statistics.csv").read_text() == "previous"
+
+
+def test_unsupported_output_format(output_dir, monkeypatch):
+    monkeypatch.setenv("OUTPUT_FORMAT", "xlsx")
+
+    with pytest.raises(ValueError):
+        DataReporter(Mock())
+
+
+def test_columnar_format_without_pyarrow_fails_fast(output_dir, monkeypatch):
+    monkeypatch.setenv("OUTPUT_FORMAT", "parquet")
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "pyarrow" else find_spec(name, *args),
+    )
+
+    with pytest.raises(ImportError, match="pyarrow"):
+        DataReporter(Mock())
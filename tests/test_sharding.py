@@ -0,0 +1,79 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from logging import Logger
+
+import pandas as pd
+import pytest
+
+from src.extractor import PokemonExtractor
+from src.sharding import (
+    ShardSpec,
+    merge_partials,
+    parse_id_ranges,
+    parse_shard,
+    partial_file_name,
+)
+
+
+def test_shards_partition_the_ids():
+    shards = [ShardSpec(index, 3) for index in range(3)]
+
+    owners = [[shard.contains(pokemon_id) for shard in shards] for pokemon_id in range(1, 31)]
+
+    assert all(sum(owner) == 1 for owner in owners)
+
+
+def test_shard_with_id_ranges():
+    shard = ShardSpec(0, 1, parse_id_ranges("387-493, 1-151, 800"))
+
+    assert shard.id_ranges == ((1, 151), (387, 493), (800, 800))
+    assert shard.contains(151) and shard.contains(800)
+    assert not shard.contains(152)
+    assert shard.name == "ids-1-151_387-493_800-800"
+    assert partial_file_name("pokemon_records.pkl", ShardSpec(2, 4)) == (
+        "pokemon_records.shard-2-of-4.pkl"
+    )
+
+
+@pytest.mark.parametrize("value", ["2", "4/4", "-1/4", "a/b"])
+def test_parse_shard_rejects_invalid_specs(value):
+    with pytest.raises(ValueError):
+        parse_shard(value)
+
+
+def test_filter_shard_keeps_the_shard_entries(monkeypatch):
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    extractor = PokemonExtractor(Logger("test_sharding"))
+    pokemons_data = [
+        {"name": f"pokemon-{i}", "url": f"https://pokeapi.co/api/v2/pokemon/{i}/"}
+        for i in range(1, 11)
+    ]
+
+    result = list(extractor.filter_shard(pokemons_data, ShardSpec(1, 4)))
+
+    assert [pokemon["name"] for pokemon in result] == [
+        "pokemon-1",
+        "pokemon-5",
+        "pokemon-9",
+    ]
+
+
+def test_merge_partials_dedupes_and_orders_by_id(tmp_path):
+    first = pd.DataFrame({"ID": [4, 1], "Name": ["Charmander", "Bulbasaur"]})
+    second = pd.DataFrame({"ID": [2, 4], "Name": ["Ivysaur", "Duplicate"]})
+    first.to_pickle(tmp_path / "pokemon_records.shard-0-of-2.pkl")
+    second.to_pickle(tmp_path / "pokemon_records.shard-1-of-2.pkl")
+    paths = [str(path) for path in tmp_path.iterdir()]
+
+    result = merge_partials(list(reversed(sorted(paths))))
+
+    assert result["ID"].tolist() == [1, 2, 4]
+    assert result["Name"].tolist() == ["Bulbasaur", "Ivysaur", "Charmander"]
+    assert result.index.tolist() == [0, 1, 2]
+
+
+def test_merge_without_partials_fails():
+    with pytest.raises(FileNotFoundError):
+        merge_partials([])
@@ -0,0 +1,99 @@
+import json
+import os
+import shutil
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from logging import Logger
+
+import pytest
+
+from config import Settings
+from src.extractor import PokemonExtractor
+from src.sources import (
+    HttpPokemonSource,
+    LocalDumpPokemonSource,
+    PokemonSource,
+    build_source,
+)
+
+
+def test_local_source_reads_detail_documents(dump_dir):
+    source = LocalDumpPokemonSource(str(dump_dir), Logger("test_sources"))
+
+    detail = json.loads(source.get_bytes("https://pokeapi.co/api/v2/pokemon/3"))
+
+    assert detail["name"] == "pokemon-3"
+
+
+def test_local_source_pages_the_index(dump_dir):
+    source = LocalDumpPokemonSource(str(dump_dir), Logger("test_sources"))
+
+    page = json.loads(source.get_bytes("https://pokeapi.co/api/v2/pokemon?limit=2&offset=0"))
+    last_page = json.loads(source.get_bytes("/api/v2/pokemon/?offset=4&limit=2"))
+
+    assert page["count"] == 5
+    assert [p["name"] for p in page["results"]] == ["pokemon-1", "pokemon-2"]
+    assert page["next"] == "/api/v2/pokemon/?offset=2&limit=2"
+    assert [p["name"] for p in last_page["results"]] == ["pokemon-5"]
+    assert last_page["next"] is None
+
+
+def test_local_source_reports_missing_resources(dump_dir, tmp_path):
+    source = LocalDumpPokemonSource(str(dump_dir), Logger("test_sources"))
+
+    with pytest.raises(FileNotFoundError):
+        source.get_bytes("https://pokeapi.co/api/v2/pokemon/99")
+    with pytest.raises(FileNotFoundError):
+        LocalDumpPokemonSource(str(tmp_path / "missing"), Logger("test_sources"))
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "gztar"])
+def test_local_source_streams_archives(dump_dir, tmp_path, archive_format):
+    archive = shutil.make_archive(
+        str(tmp_path / "dump"), archive_format, root_dir=dump_dir.parent
+    )
+    source = LocalDumpPokemonSource(archive, Logger("test_sources"))
+
+    detail = json.loads(source.get_bytes("https://pokeapi.co/api/v2/pokemon/5"))
+    page = json.loads(source.get_bytes("https://pokeapi.co/api/v2/pokemon?limit=10"))
+    source.close()
+
+    assert detail["id"] == 5
+    assert len(page["results"]) == 5
+
+
+def test_build_source_selects_backend(dump_dir, monkeypatch):
+    monkeypatch.setenv("CACHE_ENABLED", "false")
+    assert isinstance(build_source(Settings(), Logger("test_sources")), HttpPokemonSource)
+
+    monkeypatch.setenv("SOURCE", "local")
+    monkeypatch.setenv("LOCAL_DUMP_PATH", str(dump_dir))
+    assert isinstance(
+        build_source(Settings(), Logger("test_sources")), LocalDumpPokemonSource
+    )
+
+    monkeypatch.setenv("SOURCE", "ftp")
+    with pytest.raises(ValueError):
+        build_source(Settings(), Logger("test_sources"))
+
+
+def test_extractor_builds_dataframe_from_local_dump(dump_dir, monkeypatch):
+    monkeypatch.setenv("SOURCE", "local")
+    monkeypatch.setenv("LOCAL_DUMP_PATH", str(dump_dir))
+    extractor = PokemonExtractor(Logger("test_sources"))
+
+    result = extractor.build_pokemons_dataframe(extractor.iter_pokemon_data(page_size=2))
+    extractor.close()
+
+    assert result["ID"].tolist() == [1, 2, 3, 4, 5]
+    assert result["Name"].tolist()[0] == "Pokemon-1"
+    assert result["HP"].tolist() == [41, 42, 43, 44, 45]
+
+
+def test_incomplete_source_cannot_be_constructed():
+    class IncompleteSource(PokemonSource):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteSource()
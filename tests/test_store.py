@@ -0,0 +1,125 @@
+import os
+import sys
+from unittest.mock import Mock
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pandas as pd
+import pytest
+
+from src.columnar import PokemonColumnBuilder
+from src.store import PokemonStore
+from src.transformer import DataTransformer
+
+RECORDS = [
+    {"ID": 1, "Name": "Bulbasaur", "Base Experience": 64, "Types": ["grass", "poison"],
+     "HP": 45, "Attack": 49, "Defense": 49, "Speed": 45, "Abilities": ["overgrow"],
+     "Height": 7, "Weight": 69},
+    {"ID": 4, "Name": "Charmander", "Base Experience": 62, "Types": ["fire"],
+     "HP": 39, "Attack": 52, "Defense": 43, "Speed": 65, "Abilities": ["blaze"],
+     "Height": 6, "Weight": 85},
+    {"ID": 6, "Name": "Charizard", "Base Experience": 240, "Types": ["fire", "flying"],
+     "HP": 78, "Attack": 84, "Defense": 78, "Speed": 100, "Abilities": ["blaze"],
+     "Height": 17, "Weight": 905},
+    {"ID": 10, "Name": "Caterpie", "Base Experience": 39, "Types": ["bug"],
+     "HP": 45, "Attack": 30, "Defense": 35, "Speed": 45, "Abilities": ["shield-dust"],
+     "Height": 3, "Weight": 29},
+]
+
+
+@pytest.fixture
+def pokemon_dataframe():
+    builder = PokemonColumnBuilder()
+    builder.extend(RECORDS)
+    return builder.to_dataframe()
+
+
+@pytest.fixture
+def store(tmp_path, pokemon_dataframe):
+    store = PokemonStore(str(tmp_path / "pokemon.sqlite3"))
+    store.write_dataframe(pokemon_dataframe)
+    yield store
+    store.close()
+
+
+def test_store_round_trips_records(store, pokemon_dataframe):
+    result = store.to_dataframe()
+
+    assert list(result.columns) == list(pokemon_dataframe.columns)
+    assert result["ID"].tolist() == [1, 4, 6, 10]
+    assert result["Types"].tolist() == pokemon_dataframe["Types"].tolist()
+    assert result["Speed"].tolist() == [45, 65, 100, 45]
+    assert result["Special Attack"].isna().all()
+
+
+def test_rewrite_replaces_records(store, pokemon_dataframe):
+    updated = pokemon_dataframe[pokemon_dataframe["ID"] == 4].copy()
+    updated["Types"] = [["fire", "dragon"]]
+
+    store.write_dataframe(updated)
+
+    assert len(store) == 4
+    assert store.get_pokemon(4)["Types"] == ["fire", "dragon"]
+    assert store.get_pokemon(99) is None
+
+
+def test_lookups_use_the_indexes(store):
+    plan = store.query(
+        "EXPLAIN QUERY PLAN SELECT pokemon_id FROM pokemon_type WHERE type = ?",
+        ("fire",),
+    )
+
+    assert "idx_pokemon_type_type" in " ".join(plan["detail"])
+    assert store.pokemon_by_type("fire")["Name"].tolist() == ["Charmander", "Charizard"]
+    assert store.query(
+        "SELECT name FROM pokemon WHERE base_experience > ?", (100,)
+    )["name"].tolist() == ["Charizard"]
+
+
+def test_transform_store_matches_in_memory_transform(store, pokemon_dataframe):
+    transformer = DataTransformer(Mock())
+
+    by_type, statistics, top = transformer.transform_store(store, k=2)
+    (
+        categorized,
+        expected_by_type,
+        expected_statistics,
+        expected_top,
+    ) = transformer.transform_pokemon_data(pokemon_dataframe)
+
+    pd.testing.assert_frame_equal(by_type, expected_by_type, check_dtype=False)
+    pd.testing.assert_frame_equal(statistics, expected_statistics, check_dtype=False)
+    assert top["ID"].tolist() == expected_top["ID"].head(2).tolist()
+    assert store.query("SELECT category FROM pokemon ORDER BY id")[
+        "category"
+    ].tolist() == categorized["Category"].astype(str).tolist()
+
+
+def test_transform_store_computes_type_measures(store, pokemon_dataframe, monkeypatch):
+    monkeypatch.setenv(
+        "TYPE_STATISTICS_MEASURES",
+        '["HP max", "Attack std", "Speed sum", "Weight mean", "size"]',
+    )
+    transformer = DataTransformer(Mock())
+
+    _, statistics, _ = transformer.transform_store(store)
+    _, _, expected_statistics, _ = transformer.transform_pokemon_data(pokemon_dataframe)
+
+    assert statistics.to_csv(index=False) == expected_statistics.to_csv(index=False)
+
+
+def test_transform_store_rejects_median_measures(store, monkeypatch):
+    monkeypatch.setenv("TYPE_STATISTICS_MEASURES", '["HP median"]')
+
+    with pytest.raises(ValueError, match="HP median"):
+        DataTransformer(Mock()).transform_store(store)
+
+
+def test_transform_store_quotes_bucket_labels(store, monkeypatch):
+    monkeypatch.setenv("EXPERIENCE_BUCKETS", """{"Rookie's": 100, "Veteran": null}""")
+    transformer = DataTransformer(Mock())
+
+    transformer.transform_store(store)
+
+    assert store.query("SELECT category FROM pokemon ORDER BY id")[
+        "category"
+    ].tolist() == ["Rookie's", "Rookie's", "Veteran", "Rookie's"]
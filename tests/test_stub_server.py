@@ -0,0 +1,75 @@
+import os
+import sys
+from logging import Logger
+
+import pytest
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(ROOT_DIR)
+sys.path.append(os.path.join(ROOT_DIR, "benchmarks"))
+from src.extractor import PokemonExtractor
+from src.metrics import MetricsRecorder
+from stub_server import StubPokeAPIServer
+
+
+@pytest.fixture
+def configure_extractor(monkeypatch, tmp_path):
+    def configure(server, metrics=None, **settings):
+        monkeypatch.setenv("BASE_URL", server.base_url)
+        monkeypatch.setenv("CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        monkeypatch.setenv("RATE_LIMIT_PER_SECOND", "0")
+        monkeypatch.setenv("BACKOFF_FACTOR", "0")
+        for name, value in settings.items():
+            monkeypatch.setenv(name, str(value))
+        return PokemonExtractor(Logger("test_stub_server"), metrics)
+
+    return configure
+
+
+def test_extract_from_stub_server(configure_extractor):
+    with StubPokeAPIServer(dataset_size=25) as server:
+        extractor = configure_extractor(server, CACHE_ENABLED="false", PAGE_SIZE=10)
+        result = extractor.build_pokemons_dataframe(extractor.iter_pokemon_data())
+        extractor.close()
+
+    assert result["ID"].tolist() == list(range(1, 26))
+    assert result["HP"].notna().all()
+
+
+def test_transient_errors_are_retried(configure_extractor):
+    with StubPokeAPIServer(dataset_size=20, error_rate=0.3) as server:
+        extractor = configure_extractor(server, CACHE_ENABLED="false", MAX_RETRIES=20)
+        result = extractor.build_pokemons_dataframe(extractor.iter_pokemon_data())
+        extractor.close()
+
+    assert len(result) == 20
+    assert server.requests_served > 21
+
+
+def test_warm_cache_revalidates_without_downloading(configure_extractor):
+    with StubPokeAPIServer(dataset_size=5) as server:
+        extractor = configure_extractor(server)
+        extractor.build_pokemons_dataframe(extractor.iter_pokemon_data())
+        extractor.close()
+
+        extractor = configure_extractor(server, CACHE_TTL_SECONDS=0)
+        result = extractor.build_pokemons_dataframe(extractor.iter_pokemon_data())
+        stats = extractor.source.cache.stats()
+        extractor.close()
+
+    assert len(result) == 5
+    assert stats["revalidations"] == 5
+
+
+def test_extractor_records_request_metrics(configure_extractor):
+    metrics = MetricsRecorder()
+    with StubPokeAPIServer(dataset_size=10, error_rate=0.3) as server:
+        extractor = configure_extractor(server, metrics, MAX_RETRIES=20)
+        extractor.build_pokemons_dataframe(extractor.iter_pokemon_data())
+        extractor.close()
+
+    report = metrics.to_dict()
+    assert report["http"]["requests"] == 11
+    assert report["http"]["retries"] == server.requests_served - 11
+    assert report["http"]["bytes_downloaded"] > 0
+    assert report["cache"]["misses"] == 11
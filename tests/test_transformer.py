@@ -76,5 +76,194 @@ def test_transform_pokemon_data():
     assert top_df.iloc[0]['Name'] == 'Charizard'
     assert top_df.iloc[0]['Base Experience'] == 240
 
+def test_calculate_type_statistics():
+    # Test mean stats by type
+    test_data = {
+        'Types': [['Fire'], ['Fire', 'Flying'], ['Water'], []],
+        'HP': [40, 80, 50, 10],
+        'Attack': [50, 70, 60, 10],
+        'Defense': [30, 41, 70, 10]
+    }
+    df = pd.DataFrame(test_data)
+
+    transformer = DataTransformer(Mock())
+    result_df = transformer.calculate_type_statistics(df)
+
+    # Verify one row per type, with the original column names
+    assert list(result_df.columns) == ['Types', 'HP', 'Attack', 'Defense']
+    assert result_df['Types'].tolist() == ['Fire', 'Flying', 'Water']
+    fire = result_df[result_df['Types'] == 'Fire'].iloc[0]
+    assert fire['HP'] == 60
+    assert fire['Defense'] == 35.5
+
+def test_categorize_experience_missing_values():
+    # Missing base experience falls in the top category, as before
+    df = pd.DataFrame({'Base Experience': pd.array([45, None, 100], dtype='UInt16')})
+
+    transformer = DataTransformer(Mock())
+    result_df = transformer.categorize_experience(df)
+
+    assert result_df['Category'].tolist() == ['Weak', 'Strong', 'Strong']
+
+def test_find_top_pokemon_breaks_ties_by_id():
+    # Test configurable K and ranking column with deterministic ties
+    test_data = {
+        'ID': [4, 2, 3, 1],
+        'Name': ['Charmander', 'Ivysaur', 'Venusaur', 'Bulbasaur'],
+        'Attack': [52, 62, 82, 62],
+        'Types': [['Fire'], ['Grass'], ['Grass'], ['Grass']]
+    }
+    df = pd.DataFrame(test_data)
+
+    transformer = DataTransformer(Mock())
+    result_df = transformer.find_top_pokemon(df, k=2, column='Attack')
+
+    assert result_df['Name'].tolist() == ['Venusaur', 'Bulbasaur']
+
+def test_find_top_pokemon_by_type():
+    # Test per-type rankings over the exploded types
+    test_data = {
+        'ID': [1, 6, 4, 16],
+        'Name': ['Bulbasaur', 'Charizard', 'Charmander', 'Pidgey'],
+        'Base Experience': [64, 240, 62, 50],
+        'Types': [['Grass', 'Poison'], ['Fire', 'Flying'], ['Fire'], ['Normal', 'Flying']]
+    }
+    df = pd.DataFrame(test_data)
+
+    transformer = DataTransformer(Mock())
+    result_df = transformer.find_top_pokemon(df, k=1, by_type=True)
+
+    assert result_df.columns[0] == 'Type'
+    assert dict(zip(result_df['Type'], result_df['Name'])) == {
+        'Fire': 'Charizard',
+        'Flying': 'Charizard',
+        'Grass': 'Bulbasaur',
+        'Normal': 'Pidgey',
+        'Poison': 'Bulbasaur',
+    }
+
+def test_build_leaderboards(monkeypatch):
+    # Test leaderboards configured in the settings
+    monkeypatch.setenv('TOP_K', '2')
+    monkeypatch.setenv('LEADERBOARD_COLUMNS', '["HP", "Base Experience"]')
+    monkeypatch.setenv('LEADERBOARD_BY_TYPE', 'true')
+    test_data = {
+        'ID': [1, 2, 3],
+        'Name': ['Bulbasaur', 'Ivysaur', 'Venusaur'],
+        'Base Experience': [64, 142, 236],
+        'HP': [45, 60, 80],
+        'Types': [['Grass'], ['Grass'], ['Grass']]
+    }
+    df = pd.DataFrame(test_data)
+
+    transformer = DataTransformer(Mock())
+    leaderboards = transformer.build_leaderboards(df)
+
+    assert list(leaderboards) == [
+        'top_2_by_hp',
+        'top_2_by_hp_per_type',
+        'top_2_by_base_experience',
+        'top_2_by_base_experience_per_type',
+    ]
+    assert leaderboards['top_2_by_hp']['Name'].tolist() == ['Venusaur', 'Ivysaur']
+
+def _chunk_test_dataframe():
+    return pd.DataFrame({
+        'Name': ['Pikachu', 'Bulbasaur', 'Charizard', 'Squirtle', 'Pidgey', 'Oddish'],
+        'Base Experience': [112, 64, 240, 63, 50, 45],
+        'Types': [['Electric'], ['Grass', 'Poison'], ['Fire', 'Flying'], ['Water'], ['Flying'], ['Grass', 'Poison']],
+        'HP': [35, 45, 78, 44, 40, 45],
+        'Attack': [55, 65, 84, 50, 45, 50],
+        'Defense': [40, 65, 78, 64, 40, 55]
+    })
+
+def test_transform_chunks_matches_in_memory():
+    # Test chunked aggregation gives the same results as the full DataFrame
+    df = _chunk_test_dataframe()
+    transformer = DataTransformer(Mock())
+
+    _, types_df, statistics_df, _ = transformer.transform_pokemon_data(df.copy())
+    chunked_types_df, chunked_statistics_df = transformer.transform_chunks(
+        [df.iloc[0:2].copy(), df.iloc[2:5].copy(), df.iloc[5:].copy()]
+    )
+
+    pd.testing.assert_frame_equal(types_df, chunked_types_df)
+    pd.testing.assert_frame_equal(statistics_df, chunked_statistics_df)
+
+def test_aggregate_states_merge_across_workers():
+    # Test partial states built separately can be combined
+    df = _chunk_test_dataframe()
+    transformer = DataTransformer(Mock())
+
+    first = transformer.aggregate_chunk(transformer.new_aggregate_state(), df.iloc[:3].copy())
+    second = transformer.aggregate_chunk(transformer.new_aggregate_state(), df.iloc[3:].copy())
+    type_aggregates = first.merge(second).to_type_aggregates()
+
+    grass = type_aggregates.loc['Grass']
+    assert grass['Count'] == 2
+    assert grass['HP'] == 45
+    assert grass['Attack Std'] == pytest.approx(df['Attack'].iloc[[1, 5]].std())
+    assert grass['Medium'] == 1
+    assert grass['Weak'] == 1
+
+
+def test_update_type_aggregates_recomputes_only_the_given_types():
+    df = pd.DataFrame({
+        'Types': [['Fire'], ['Water'], ['Fire', 'Flying']],
+        'HP': [40, 50, 60],
+        'Attack': [45, 55, 65],
+        'Defense': [50, 60, 70],
+    })
+    transformer = DataTransformer(Mock())
+    type_aggregates = transformer.update_type_aggregates(None, df)
+    type_aggregates.loc['Water', 'HP'] = -1.0  # a stale value must be kept
+    df.loc[0, 'HP'] = 80
+
+    result = transformer.update_type_aggregates(type_aggregates, df, {'Fire'})
+
+    assert result.loc['Fire', 'HP'] == 70
+    assert result.loc['Flying', 'HP'] == 60
+    assert result.loc['Water', 'HP'] == -1.0
+    assert result.index.tolist() == ['Fire', 'Flying', 'Water']
+
+def test_configured_buckets_and_type_measures(monkeypatch):
+    monkeypatch.setenv('EXPERIENCE_BUCKETS', '{"Low": 100, "High": null}')
+    monkeypatch.setenv('TYPE_STATISTICS_MEASURES', '["HP median", "Attack max"]')
+    df = pd.DataFrame({
+        'Base Experience': [64, 240, 62],
+        'Types': [['Grass'], ['Fire'], ['Fire']],
+        'HP': [45, 78, 39],
+        'Attack': [49, 84, 52],
+        'Defense': [49, 78, 43],
+    })
+
+    transformer = DataTransformer(Mock())
+    pokemon, _, type_statistics, _ = transformer.transform_pokemon_data(df)
+
+    assert pokemon['Category'].tolist() == ['Low', 'High', 'Low']
+    assert type_statistics.columns.tolist() == [
+        'Types', 'HP', 'Attack', 'Defense', 'HP median', 'Attack max'
+    ]
+    assert type_statistics.set_index('Types').loc['Fire', 'HP median'] == 58.5
+
+def test_transform_chunks_carries_mergeable_type_measures(monkeypatch):
+    monkeypatch.setenv('TYPE_STATISTICS_MEASURES', '["HP max", "Attack std", "Defense sum", "count"]')
+    df = _chunk_test_dataframe()
+    transformer = DataTransformer(Mock())
+
+    _, _, statistics_df, _ = transformer.transform_pokemon_data(df.copy())
+    _, chunked_statistics_df = transformer.transform_chunks(
+        [df.iloc[0:2].copy(), df.iloc[2:5].copy(), df.iloc[5:].copy()]
+    )
+
+    pd.testing.assert_frame_equal(statistics_df, chunked_statistics_df, check_dtype=False)
+
+def test_transform_chunks_rejects_median_measures(monkeypatch):
+    monkeypatch.setenv('TYPE_STATISTICS_MEASURES', '["HP median"]')
+    transformer = DataTransformer(Mock())
+
+    with pytest.raises(ValueError, match='HP median'):
+        transformer.transform_chunks([_chunk_test_dataframe()])
+
 if __name__ == "__main__":
     pytest.main()